@@ -9,6 +9,9 @@ Supports both synchronous and asynchronous operations for parallel processing.
 import logging
 from typing import List, Optional, Dict, Any
 import os
+import io
+import json
+import time
 import asyncio
 from langchain_openai import ChatOpenAI, OpenAIEmbeddings
 from langchain_core.messages import HumanMessage
@@ -21,12 +24,17 @@ class OpenAIClient:
     Unified OpenAI client for various language model operations using LangChain.
     """
     
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, http_client: Optional[Any] = None,
+                 max_retries: Optional[int] = None):
         """
         Initialize the OpenAI client.
         
         Args:
             api_key (Optional[str]): OpenAI API key (defaults to environment variable)
+            http_client (Optional[httpx.Client]): HTTP client for synchronous requests, e.g. one
+                with a larger keep-alive pool shared by many callers (defaults to the SDK's own)
+            max_retries (Optional[int]): How often the SDK retries rate-limited (429), timed-out,
+                connection-failed and 5xx requests, with exponential backoff and jitter (defaults to the SDK's)
             
         Raises:
             ValueError: If API key is not provided
@@ -35,12 +43,41 @@ class OpenAIClient:
         if not self.api_key:
             raise ValueError("OpenAI API key is required. Set OPENAI_API_KEY environment variable.")
         
+        # Only passed when set, so the SDK defaults apply otherwise
+        self._http_kwargs = {"http_client": http_client} if http_client is not None else {}
+        self._retry_kwargs = {"max_retries": max_retries} if max_retries is not None else {}
+        
         # Initialize LangChain components
-        self.embeddings = OpenAIEmbeddings(openai_api_key=self.api_key)
-        self.chat_model = ChatOpenAI(openai_api_key=self.api_key)
+        self.embeddings = OpenAIEmbeddings(openai_api_key=self.api_key, **self._http_kwargs, **self._retry_kwargs)
+        self.chat_model = ChatOpenAI(openai_api_key=self.api_key, **self._http_kwargs, **self._retry_kwargs)
         logger.info("OpenAI client initialized successfully with LangChain")
     
-    def generate_completion(self, prompt: str, model: str = "gpt-4o-mini", max_tokens: int = 1000, temperature: float = 0.0) -> Optional[str]:
+    def generate_embedding(self, text: str, model: str = "text-embedding-3-small") -> Optional[List[float]]:
+        """
+        Generate an embedding vector for a text.
+
+        Args:
+            text (str): Text to embed
+            model (str): OpenAI embedding model to use
+
+        Returns:
+            Optional[List[float]]: Embedding vector or None if failed
+        """
+        try:
+            embeddings = OpenAIEmbeddings(
+                openai_api_key=self.api_key,
+                model=model,
+                **self._http_kwargs,
+                **self._retry_kwargs
+            )
+            return embeddings.embed_query(text)
+
+        except Exception as e:
+            logger.error(f"Failed to generate embedding: {str(e)}")
+            return None
+    
+    def generate_completion(self, prompt: str, model: str = "gpt-4o-mini", max_tokens: int = 1000, temperature: float = 0.0,
+                            json_mode: bool = False, stream: bool = False) -> Optional[str]:
         """
         Generate text completion using OpenAI models.
 
@@ -49,6 +86,9 @@ class OpenAIClient:
             model (str): OpenAI model to use
             max_tokens (int): Maximum tokens to generate
             temperature (float): Sampling temperature (0.0 = deterministic, 1.0 = creative). Default 0.0 for consistency.
+            json_mode (bool): Ask the API for a syntactically valid JSON object (the prompt must mention JSON)
+            stream (bool): Receive the completion incrementally and log time to first token, which
+                separates a slow/queued request from a slow generation on long completions
 
         Returns:
             Optional[str]: Generated text or None if failed
@@ -59,10 +99,26 @@ class OpenAIClient:
                 openai_api_key=self.api_key,
                 model=model,
                 max_tokens=max_tokens,
-                temperature=temperature  # Add temperature for deterministic scoring
+                temperature=temperature,  # Add temperature for deterministic scoring
+                model_kwargs={"response_format": {"type": "json_object"}} if json_mode else {},
+                **self._http_kwargs,
+                **self._retry_kwargs
             )
 
             messages = [HumanMessage(content=prompt)]
+            if stream:
+                started = time.monotonic()
+                first_token_at = None
+                parts = []
+                for chunk in chat_model.stream(messages):
+                    if first_token_at is None and chunk.content:
+                        first_token_at = time.monotonic()
+                        logger.info(f"First token from {model} after {first_token_at - started:.2f}s")
+                    parts.append(chunk.content)
+                completion = "".join(parts)
+                logger.info(f"Generated streamed completion using model: {model} (temperature={temperature}) in {time.monotonic() - started:.2f}s")
+                return completion
+
             response = chat_model.invoke(messages)
 
             completion = response.content
@@ -73,7 +129,8 @@ class OpenAIClient:
             logger.error(f"Failed to generate completion: {str(e)}")
             return None
     
-    async def generate_completion_async(self, prompt: str, model: str = "gpt-4o-mini", max_tokens: int = 1000, temperature: float = 0.0) -> Optional[str]:
+    async def generate_completion_async(self, prompt: str, model: str = "gpt-4o-mini", max_tokens: int = 1000, temperature: float = 0.0,
+                                        json_mode: bool = False) -> Optional[str]:
         """
         Generate text completion asynchronously using OpenAI models.
         This allows parallel execution of multiple LLM calls.
@@ -83,6 +140,7 @@ class OpenAIClient:
             model (str): OpenAI model to use
             max_tokens (int): Maximum tokens to generate
             temperature (float): Sampling temperature (0.0 = deterministic, 1.0 = creative). Default 0.0 for consistency.
+            json_mode (bool): Ask the API for a syntactically valid JSON object (the prompt must mention JSON)
 
         Returns:
             Optional[str]: Generated text or None if failed
@@ -93,7 +151,9 @@ class OpenAIClient:
                 openai_api_key=self.api_key,
                 model=model,
                 max_tokens=max_tokens,
-                temperature=temperature
+                temperature=temperature,
+                model_kwargs={"response_format": {"type": "json_object"}} if json_mode else {},
+                **self._retry_kwargs
             )
 
             messages = [HumanMessage(content=prompt)]
@@ -113,7 +173,8 @@ class OpenAIClient:
         Generate multiple completions in parallel.
         
         Args:
-            prompts: List of dicts with keys: 'prompt', 'model' (optional), 'max_tokens' (optional), 'temperature' (optional)
+            prompts: List of dicts with keys: 'prompt', 'model' (optional), 'max_tokens' (optional), 'temperature' (optional),
+                     'json_mode' (optional)
         
         Returns:
             List of completion strings (or None for failed calls)
@@ -124,8 +185,9 @@ class OpenAIClient:
             model = prompt_config.get('model', 'gpt-4o-mini')
             max_tokens = prompt_config.get('max_tokens', 1000)
             temperature = prompt_config.get('temperature', 0.0)
+            json_mode = prompt_config.get('json_mode', False)
             
-            task = self.generate_completion_async(prompt, model, max_tokens, temperature)
+            task = self.generate_completion_async(prompt, model, max_tokens, temperature, json_mode)
             tasks.append(task)
         
         # Execute all tasks in parallel
@@ -142,4 +204,93 @@ class OpenAIClient:
         
         logger.info(f"Completed {len(completions)} parallel LLM calls")
         return completions
-    
\ No newline at end of file
+    
+    def generate_completions_batch(self, prompts: List[Dict[str, Any]], poll_interval: float = 60.0,
+                                   timeout: float = 24 * 60 * 60) -> List[Optional[str]]:
+        """
+        Generate multiple completions through the OpenAI Batch API.
+        
+        Meant for large offline runs: batch requests are billed at a discount and are
+        not subject to the per-request rate limits, but results arrive within the
+        batch completion window (24h) rather than immediately. Blocks until the batch
+        finishes, fails or the timeout expires; on timeout the batch is cancelled so it
+        is not left running (and billed) after the caller has given up on it.
+        
+        Args:
+            prompts: List of dicts with keys: 'prompt', 'model' (optional), 'max_tokens' (optional), 'temperature' (optional),
+                     'json_mode' (optional)
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for the batch before cancelling it
+        
+        Returns:
+            List of completion strings (or None for failed requests), in input order
+        """
+        if not prompts:
+            return []
+        
+        # The LangChain wrappers have no batch support; use the SDK they are built on
+        from openai import OpenAI
+        client = OpenAI(api_key=self.api_key, **self._http_kwargs, **self._retry_kwargs)
+        
+        lines = []
+        for idx, prompt_config in enumerate(prompts):
+            lines.append(json.dumps({
+                "custom_id": str(idx),
+                "method": "POST",
+                "url": "/v1/chat/completions",
+                "body": {
+                    "model": prompt_config.get('model', 'gpt-4o-mini'),
+                    "messages": [{"role": "user", "content": prompt_config.get('prompt', '')}],
+                    "max_tokens": prompt_config.get('max_tokens', 1000),
+                    "temperature": prompt_config.get('temperature', 0.0),
+                    **({"response_format": {"type": "json_object"}} if prompt_config.get('json_mode') else {})
+                }
+            }))
+        
+        completions: List[Optional[str]] = [None] * len(prompts)
+        try:
+            input_file = client.files.create(
+                file=("batch_input.jsonl", io.BytesIO("\n".join(lines).encode("utf-8"))),
+                purpose="batch"
+            )
+            batch = client.batches.create(
+                input_file_id=input_file.id,
+                endpoint="/v1/chat/completions",
+                completion_window="24h"
+            )
+            logger.info(f"Submitted batch {batch.id} with {len(prompts)} requests")
+            
+            deadline = time.monotonic() + timeout
+            while batch.status not in ("completed", "failed", "expired", "cancelled"):
+                if time.monotonic() >= deadline:
+                    logger.error(f"Batch {batch.id} did not finish within {timeout:.0f}s (status: {batch.status}), cancelling it")
+                    try:
+                        client.batches.cancel(batch.id)
+                    except Exception as e:
+                        logger.error(f"Failed to cancel batch {batch.id}: {str(e)}")
+                    return completions
+                time.sleep(poll_interval)
+                batch = client.batches.retrieve(batch.id)
+            
+            if batch.status != "completed" or not batch.output_file_id:
+                logger.error(f"Batch {batch.id} ended with status: {batch.status}")
+                return completions
+            
+            output = client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = json.loads(line)
+                response = record.get("response") or {}
+                if response.get("status_code") != 200:
+                    continue
+                try:
+                    completions[int(record["custom_id"])] = response["body"]["choices"][0]["message"]["content"]
+                except (KeyError, IndexError, ValueError):
+                    continue
+        except Exception as e:
+            logger.error(f"Batch completion failed: {str(e)}")
+            return completions
+        
+        logger.info(f"Completed batch with {sum(c is not None for c in completions)}/{len(prompts)} successful LLM calls")
+        return completions
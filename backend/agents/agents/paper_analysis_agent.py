@@ -314,7 +314,8 @@ class PaperAnalysisAgent(BaseAgent):
         if file_path and os.path.exists(file_path):
             try:
                 logger.info(f"Parsing PDF from file path: {file_path}")
-                result = self.execute_tool("parse_pdf", file_path=file_path)
+                # Per-page text is needed for page-level evidence collection
+                result = self.execute_tool("parse_pdf", file_path=file_path, include_pages=True)
                 logger.info(f"PDF parsing result - success: {result.get('success')}, pages: {result.get('num_pages', 0)}")
                 return result
             except Exception as e:
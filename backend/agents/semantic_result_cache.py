@@ -0,0 +1,289 @@
+"""
+Semantic Result Cache for QualiLens.
+
+This module provides a near-match layer on top of the exact tool result cache:
+results are stored with an embedding of the paper text, and a later request whose
+text embeds (almost) identically - the same paper re-extracted with whitespace or
+OCR differences - reuses the stored result instead of re-running the analysis.
+"""
+
+import sqlite3
+import hashlib
+import json
+import logging
+import math
+import operator
+import threading
+from array import array
+from typing import Optional, Dict, Any, List, Tuple
+from datetime import datetime
+import os
+
+from .tool_result_cache import _dumps_result, _loads_result
+
+logger = logging.getLogger(__name__)
+
+
+class SemanticResultCache:
+    """
+    Persistent near-match cache for tool results using SQLite.
+    Entries are scoped by tool name and the parameters that affect the result; within
+    a scope, the entry whose embedding has the highest cosine similarity to the query
+    is returned if it reaches the similarity threshold.
+    """
+
+    # Cache version - increment when stored data changes to invalidate old caches
+    # Version 1: Initial implementation
+    CACHE_VERSION = 1
+
+    # Cosine similarity a stored paper needs to count as the same paper
+    DEFAULT_THRESHOLD = 0.97
+
+    # Lookups scan every entry of a scope, so the number of entries kept is bounded
+    DEFAULT_MAX_ENTRIES_PER_TOOL = 1000
+
+    def __init__(self, db_path: str = None, threshold: float = DEFAULT_THRESHOLD,
+                 max_entries_per_tool: Optional[int] = DEFAULT_MAX_ENTRIES_PER_TOOL):
+        """
+        Initialize the semantic result cache.
+
+        Args:
+            db_path: Path to SQLite database file. Defaults to 'semantic_result_cache.db' in backend directory.
+            threshold: Minimum cosine similarity for a cache hit
+            max_entries_per_tool: If specified, keep at most this many entries per tool,
+                                  evicting the oldest ones on insert.
+        """
+        if db_path is None:
+            # Default to backend directory
+            backend_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+            db_path = os.path.join(backend_dir, "semantic_result_cache.db")
+
+        self.db_path = db_path
+        self.threshold = threshold
+        self.max_entries_per_tool = max_entries_per_tool
+        # Normalized embeddings per scope, loaded from the database on first lookup
+        self._index: Dict[Tuple[str, str], List[Tuple[int, array]]] = {}
+        self._index_lock = threading.Lock()
+        self._initialize_db()
+        logger.info(f"Semantic result cache initialized at: {self.db_path}")
+
+    def _initialize_db(self):
+        """Initialize the SQLite database with required schema."""
+        try:
+            conn = sqlite3.connect(self.db_path)
+            conn.execute("""
+                CREATE TABLE IF NOT EXISTS semantic_result_cache (
+                    entry_id INTEGER PRIMARY KEY AUTOINCREMENT,
+                    tool_name TEXT NOT NULL,
+                    scope_key TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    result_data TEXT NOT NULL,
+                    cache_version INTEGER NOT NULL,
+                    created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+                )
+            """)
+
+            conn.execute("""
+                CREATE INDEX IF NOT EXISTS idx_semantic_scope
+                ON semantic_result_cache(tool_name, scope_key, cache_version)
+            """)
+
+            conn.commit()
+            conn.close()
+            logger.info("Semantic result cache database initialized successfully")
+        except Exception as e:
+            logger.error(f"Failed to initialize semantic result cache database: {str(e)}")
+            raise
+
+    @staticmethod
+    def _calculate_scope_key(**kwargs) -> str:
+        """Hash the parameters that affect the result; only entries with the same scope are compared."""
+        return hashlib.sha256(json.dumps(kwargs, sort_keys=True, default=str).encode('utf-8')).hexdigest()
+
+    @staticmethod
+    def _normalize(embedding: List[float]) -> Optional[array]:
+        """Return the embedding scaled to unit length (so a dot product is the cosine similarity)."""
+        norm = math.sqrt(math.fsum(x * x for x in embedding))
+        if not norm:
+            return None
+        return array('d', (x / norm for x in embedding))
+
+    def _load_scope(self, conn: sqlite3.Connection, tool_name: str, scope_key: str) -> List[Tuple[int, array]]:
+        """Return the (entry_id, embedding) list of a scope, loading it from the database once."""
+        with self._index_lock:
+            entries = self._index.get((tool_name, scope_key))
+            if entries is None:
+                cursor = conn.execute(
+                    """SELECT entry_id, embedding
+                       FROM semantic_result_cache
+                       WHERE tool_name = ? AND scope_key = ? AND cache_version = ?""",
+                    (tool_name, scope_key, self.CACHE_VERSION)
+                )
+                entries = []
+                for entry_id, blob in cursor.fetchall():
+                    embedding = array('d')
+                    embedding.frombytes(blob)
+                    entries.append((entry_id, embedding))
+                self._index[(tool_name, scope_key)] = entries
+            return list(entries)
+
+    def get_similar_result(self, tool_name: str, embedding: List[float], **kwargs) -> Optional[Dict[str, Any]]:
+        """
+        Retrieve the cached result of the most similar stored text.
+
+        Args:
+            tool_name: Name of the tool
+            embedding: Embedding of the paper text
+            **kwargs: Additional parameters that affect the result
+
+        Returns:
+            Dict with cached result if a stored text is similar enough, None otherwise
+        """
+        try:
+            query = self._normalize(embedding)
+            if query is None:
+                return None
+            scope_key = self._calculate_scope_key(**kwargs)
+
+            conn = sqlite3.connect(self.db_path)
+            best_id, best_similarity = None, -1.0
+            for entry_id, stored in self._load_scope(conn, tool_name, scope_key):
+                if len(stored) != len(query):
+                    continue  # embedded with a different model
+                similarity = sum(map(operator.mul, query, stored))
+                if similarity > best_similarity:
+                    best_id, best_similarity = entry_id, similarity
+
+            if best_id is None or best_similarity < self.threshold:
+                conn.close()
+                logger.debug(f"Semantic cache MISS for tool: {tool_name} (best similarity: {best_similarity:.4f})")
+                return None
+
+            cursor = conn.execute(
+                "SELECT result_data, created_at FROM semantic_result_cache WHERE entry_id = ?",
+                (best_id,)
+            )
+            result = cursor.fetchone()
+            conn.close()
+            if not result:
+                return None
+
+            result_data = _loads_result(result[0])
+            result_data["cached"] = True
+            result_data["cache_timestamp"] = result[1]
+            result_data["semantic_similarity"] = best_similarity
+
+            logger.info(f"Semantic cache HIT for tool: {tool_name} (similarity: {best_similarity:.4f})")
+            return result_data
+
+        except Exception as e:
+            logger.error(f"Failed to retrieve semantic cache result: {str(e)}")
+            return None
+
+    def cache_result(self, tool_name: str, embedding: List[float], result_data: Dict[str, Any], **kwargs) -> bool:
+        """
+        Cache a tool result under the embedding of its paper text.
+
+        Args:
+            tool_name: Name of the tool
+            embedding: Embedding of the paper text
+            result_data: Dict containing the tool result
+            **kwargs: Additional parameters that affect the result
+
+        Returns:
+            True if successfully cached, False otherwise
+        """
+        try:
+            normalized = self._normalize(embedding)
+            if normalized is None:
+                return False
+            scope_key = self._calculate_scope_key(**kwargs)
+
+            # Create a copy of result_data without cached metadata
+            cache_data = {k: v for k, v in result_data.items()
+                          if k not in ["cached", "cache_timestamp", "cache_key", "semantic_similarity"]}
+
+            conn = sqlite3.connect(self.db_path)
+            self._load_scope(conn, tool_name, scope_key)
+            cursor = conn.execute(
+                """INSERT INTO semantic_result_cache
+                   (tool_name, scope_key, embedding, result_data, cache_version, created_at)
+                   VALUES (?, ?, ?, ?, ?, ?)""",
+                (
+                    tool_name,
+                    scope_key,
+                    normalized.tobytes(),
+                    _dumps_result(cache_data),
+                    self.CACHE_VERSION,
+                    datetime.now().isoformat()
+                )
+            )
+            entry_id = cursor.lastrowid
+
+            evicted = set()
+            if self.max_entries_per_tool is not None:
+                cursor = conn.execute(
+                    """SELECT entry_id FROM semantic_result_cache
+                       WHERE tool_name = ?
+                       ORDER BY entry_id DESC
+                       LIMIT -1 OFFSET ?""",
+                    (tool_name, self.max_entries_per_tool)
+                )
+                evicted = {row[0] for row in cursor.fetchall()}
+                if evicted:
+                    conn.executemany(
+                        "DELETE FROM semantic_result_cache WHERE entry_id = ?",
+                        [(evicted_id,) for evicted_id in evicted]
+                    )
+            conn.commit()
+            conn.close()
+
+            with self._index_lock:
+                self._index.setdefault((tool_name, scope_key), []).append((entry_id, normalized))
+                if evicted:
+                    for key, entries in self._index.items():
+                        if key[0] == tool_name:
+                            entries[:] = [entry for entry in entries if entry[0] not in evicted]
+
+            logger.info(f"Tool result cached for semantic lookup: {tool_name}")
+            return True
+
+        except Exception as e:
+            logger.error(f"Failed to cache tool result for semantic lookup: {str(e)}")
+            return False
+
+    def clear_cache(self, tool_name: str = None) -> int:
+        """
+        Clear cached results.
+
+        Args:
+            tool_name: If specified, only clear cache for this tool. If None, clear all.
+
+        Returns:
+            Number of entries cleared
+        """
+        try:
+            conn = sqlite3.connect(self.db_path)
+            if tool_name:
+                cursor = conn.execute(
+                    "DELETE FROM semantic_result_cache WHERE tool_name = ? AND cache_version = ?",
+                    (tool_name, self.CACHE_VERSION)
+                )
+            else:
+                cursor = conn.execute(
+                    "DELETE FROM semantic_result_cache WHERE cache_version = ?",
+                    (self.CACHE_VERSION,)
+                )
+            deleted_count = cursor.rowcount
+            conn.commit()
+            conn.close()
+
+            with self._index_lock:
+                self._index.clear()
+
+            logger.info(f"Cleared {deleted_count} entries from semantic result cache")
+            return deleted_count
+
+        except Exception as e:
+            logger.error(f"Failed to clear semantic cache: {str(e)}")
+            return 0
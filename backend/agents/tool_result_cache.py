@@ -13,9 +13,37 @@ from typing import Optional, Dict, Any
 from datetime import datetime
 import os
 
+try:
+    import orjson  # pip install orjson
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
+
 logger = logging.getLogger(__name__)
 
 
+def _dumps_result(data: Dict[str, Any]) -> str:
+    """Serialize a result payload for storage, using orjson when it is installed."""
+    if _HAVE_ORJSON:
+        try:
+            return orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS).decode("utf-8")
+        except TypeError:
+            # e.g. integers wider than 64 bits; the stdlib encoder handles those
+            pass
+    return json.dumps(data)
+
+
+def _loads_result(raw: str) -> Dict[str, Any]:
+    """Deserialize a stored result payload, using orjson when it is installed."""
+    if _HAVE_ORJSON:
+        try:
+            return orjson.loads(raw)
+        except orjson.JSONDecodeError:
+            # Entries written by json.dumps may contain NaN/Infinity, which orjson rejects
+            pass
+    return json.loads(raw)
+
+
 class ToolResultCache:
     """
     Persistent cache for tool analysis results using SQLite.
@@ -27,12 +55,14 @@ class ToolResultCache:
     # Version 1: Initial implementation - caching for all tools
     CACHE_VERSION = 1
 
-    def __init__(self, db_path: str = None):
+    def __init__(self, db_path: str = None, max_entries_per_tool: Optional[int] = None):
         """
         Initialize the tool result cache.
 
         Args:
             db_path: Path to SQLite database file. Defaults to 'tool_result_cache.db' in backend directory.
+            max_entries_per_tool: If specified, keep at most this many entries per tool,
+                                  evicting the least recently accessed ones on insert.
         """
         if db_path is None:
             # Default to backend directory
@@ -40,6 +70,7 @@ class ToolResultCache:
             db_path = os.path.join(backend_dir, "tool_result_cache.db")
 
         self.db_path = db_path
+        self.max_entries_per_tool = max_entries_per_tool
         self._initialize_db()
         logger.info(f"Tool result cache initialized at: {self.db_path}")
 
@@ -129,7 +160,7 @@ class ToolResultCache:
                 )
                 conn.commit()
 
-                result_data = json.loads(result[0])
+                result_data = _loads_result(result[0])
                 result_data["cached"] = True
                 result_data["cache_timestamp"] = result[1]
                 result_data["cache_key"] = cache_key
@@ -174,12 +205,23 @@ class ToolResultCache:
                 (
                     cache_key,
                     tool_name,
-                    json.dumps(cache_data),
+                    _dumps_result(cache_data),
                     self.CACHE_VERSION,
                     datetime.now().isoformat(),
                     datetime.now().isoformat()
                 )
             )
+            if self.max_entries_per_tool is not None:
+                conn.execute(
+                    """DELETE FROM tool_result_cache
+                       WHERE tool_name = ? AND cache_key NOT IN (
+                           SELECT cache_key FROM tool_result_cache
+                           WHERE tool_name = ?
+                           ORDER BY last_accessed DESC
+                           LIMIT ?
+                       )""",
+                    (tool_name, tool_name, self.max_entries_per_tool)
+                )
             conn.commit()
             conn.close()
 
@@ -3,16 +3,24 @@
 
 from __future__ import annotations
 
-import io
 import os
+import sys
+import asyncio
 import re
 import json
 import math
+import mmap
 import hashlib
 import logging
+import tempfile
+import threading
 import multiprocessing
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
-from typing import List, Dict, Any, Optional, Tuple
+from functools import cached_property, lru_cache
+from operator import itemgetter
+from typing import Callable, Iterator, List, Dict, Any, Optional, Tuple
 
 # Third-party (all optional except at least one extractor)
 # Preferred:
@@ -46,6 +54,42 @@ except Exception:
     _HAVE_TESSERACT = False
     pytesseract = None  # type: ignore
 
+# Linear-time regex engine (optional)
+#   pip install google-re2
+try:
+    import re2
+    _HAVE_RE2 = True
+except Exception:
+    _HAVE_RE2 = False
+    re2 = None  # type: ignore
+
+# Fast content hashing (optional): BLAKE3 is SIMD/multi-threaded and much faster than SHA-256
+#   pip install blake3
+try:
+    from blake3 import blake3 as _blake3
+    _HAVE_BLAKE3 = True
+except Exception:
+    _HAVE_BLAKE3 = False
+    _blake3 = None  # type: ignore
+
+# Multi-keyword prefilter for citation validation (optional)
+#   pip install pyahocorasick
+try:
+    import ahocorasick
+    _HAVE_AHOCORASICK = True
+except Exception:
+    _HAVE_AHOCORASICK = False
+    ahocorasick = None  # type: ignore
+
+# Faster JSON encoding for the CLI output (optional)
+#   pip install orjson
+try:
+    import orjson
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
+    orjson = None  # type: ignore
+
 # Local base class
 try:
     from .base_tool import BaseTool, ToolMetadata
@@ -73,6 +117,15 @@ except Exception:
     _HAVE_LAYOUT_ANALYZER = False
     analyze_document_layout = None  # type: ignore
 
+# Persistent cache of extraction results (optional; unavailable in standalone usage)
+try:
+    sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    from tool_result_cache import ToolResultCache
+    _HAVE_RESULT_CACHE = True
+except Exception:
+    _HAVE_RESULT_CACHE = False
+    ToolResultCache = None  # type: ignore
+
 logger = logging.getLogger(__name__)
 
 
@@ -91,6 +144,7 @@ class PDFMetadata:
     modification_date: Optional[str]
     file_size_bytes: Optional[int]
     sha256: Optional[str]
+    content_id: Optional[str] = None  # "<algorithm>:<hexdigest>", identity key for caching
 
 
 @dataclass
@@ -98,71 +152,296 @@ class Section:
     name: str
     start_char: int
     end_char: int
+
+    def text_from(self, full_text: str) -> str:
+        """Slice this section's body out of the text it was split from."""
+        return full_text[self.start_char:self.end_char].strip()
+
+
+@dataclass
+class DocumentScan:
+    """Everything the single DOCUMENT_SCAN_REGEX pass pulls out of the text."""
+    headings: List[Tuple[int, int, str]]  # (start, end, matched heading line)
+    dois: List[str]
+    urls: List[str]
+    figure_table_cues: List[str]
+
+
+@dataclass
+class ParsedPDF:
+    """
+    Normalized document text plus the derived fields computed on first access.
+    Agents that only need the text or a single field (e.g. DOIs) skip the rest.
+    """
     text: str
+    chunk_chars: int = 4000
+    overlap: int = 200
+    include_section_text: bool = False
+
+    @cached_property
+    def scan(self) -> DocumentScan:
+        return _scan_document(self.text)
+
+    @cached_property
+    def sections(self) -> List[Section]:
+        return _split_sections(self.text, headings=self.scan.headings)
+
+    @cached_property
+    def section_dicts(self) -> List[Dict[str, Any]]:
+        section_dicts = []
+        for s in self.sections:
+            entry: Dict[str, Any] = {"name": s.name, "start_char": s.start_char, "end_char": s.end_char}
+            if self.include_section_text:
+                entry["text"] = s.text_from(self.text)
+            section_dicts.append(entry)
+        return section_dicts
+
+    @cached_property
+    def methodology_context(self) -> str:
+        return _extract_methodology_context(self.sections, self.text)
+
+    @cached_property
+    def chunk_bounds(self) -> List[Tuple[int, int]]:
+        return _chunk_bounds(self.text, target_chars=self.chunk_chars, overlap=self.overlap)
+
+    @cached_property
+    def chunks(self) -> List[str]:
+        return chunks_as_text(self.text, self.chunk_bounds)
+
+    @cached_property
+    def dois(self) -> List[str]:
+        return self.scan.dois
+
+    @cached_property
+    def urls(self) -> List[str]:
+        return self.scan.urls
+
+    @cached_property
+    def references_section(self) -> Optional[str]:
+        references_section = _extract_references_section(self.text, self.sections)
+        if not references_section:
+            logger.warning("Could not find references section in PDF")
+        return references_section
+
+    @cached_property
+    def citation_entries(self) -> List[Tuple[str, int]]:
+        if not self.references_section:
+            return []
+        return _segment_citations(self.references_section)
+
+    @cached_property
+    def citations(self) -> List[Dict[str, Any]]:
+        citations = [_parse_citation(text, num) for text, num in self.citation_entries]
+        logger.info(f"Extracted {len(citations)} citations from references section")
+        return citations
+
+    @cached_property
+    def figure_table_cues(self) -> List[str]:
+        return self.scan.figure_table_cues
+
+
+class LazyResultDict(dict):
+    """
+    Dict whose lazy keys are computed on first lookup.
+
+    Behaves like the plain result dict for `[]`, `get`, `in` and assignment;
+    iterating, serializing or pickling it materializes every pending key, and
+    pickling yields an ordinary dict so results can cross process boundaries.
+    """
+
+    def __init__(self, eager: Dict[str, Any], lazy: Dict[str, Callable[[], Any]]):
+        super().__init__(eager)
+        self._lazy = dict(lazy)
+
+    def _resolve(self, key: Any) -> None:
+        factory = self._lazy.pop(key, None)
+        if factory is not None:
+            dict.__setitem__(self, key, factory())
+
+    def _materialize(self) -> None:
+        for key in list(self._lazy):
+            self._resolve(key)
+
+    def __getitem__(self, key: Any) -> Any:
+        self._resolve(key)
+        return dict.__getitem__(self, key)
+
+    def __setitem__(self, key: Any, value: Any) -> None:
+        self._lazy.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: Any) -> None:
+        if self._lazy.pop(key, None) is None:
+            dict.__delitem__(self, key)
+
+    def __contains__(self, key: Any) -> bool:
+        return key in self._lazy or dict.__contains__(self, key)
+
+    def __iter__(self):
+        self._materialize()
+        return dict.__iter__(self)
+
+    def __len__(self) -> int:
+        return dict.__len__(self) + len(self._lazy)
+
+    def __repr__(self) -> str:
+        self._materialize()
+        return dict.__repr__(self)
+
+    def __eq__(self, other: Any) -> bool:
+        self._materialize()
+        return dict.__eq__(self, other)
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __reduce__(self):
+        self._materialize()
+        return (dict, (dict(self),))
+
+    def get(self, key: Any, default: Any = None) -> Any:
+        return self[key] if key in self else default
+
+    def pop(self, key: Any, *default: Any) -> Any:
+        self._resolve(key)
+        return dict.pop(self, key, *default)
+
+    def setdefault(self, key: Any, default: Any = None) -> Any:
+        if key not in self:
+            self[key] = default
+        return self[key]
+
+    def keys(self):
+        self._materialize()
+        return dict.keys(self)
+
+    def values(self):
+        self._materialize()
+        return dict.values(self)
+
+    def items(self):
+        self._materialize()
+        return dict.items(self)
+
+    def copy(self) -> Dict[str, Any]:
+        self._materialize()
+        return dict(self)
 
 
 # -----------------------------
 # Utility functions
 # -----------------------------
 
+# Section heading keywords; SECTION_REGEX anchors them to whole lines
 SECTION_PATTERNS = [
     # Core academic sections
-    r"^\s*abstract\s*$",
-    r"^\s*background\s*$",
-    r"^\s*introduction\s*$",
+    r"abstract",
+    r"background",
+    r"introduction",
 
     # Methodology sections (expanded for better detection)
-    r"^\s*methods?\s*$",
-    r"^\s*methodology\s*$",
-    r"^\s*materials\s+and\s+methods\s*$",
-    r"^\s*methods\s+and\s+materials\s*$",
-    r"^\s*study\s+design\s*$",
-    r"^\s*experimental\s+(design|procedure|methods?)\s*$",
-    r"^\s*research\s+(design|methods?|methodology)\s*$",
-    r"^\s*participants\s+(and\s+methods?)?\s*$",
-    r"^\s*subjects\s+(and\s+methods?)?\s*$",
-    r"^\s*procedure[s]?\s*$",
-    r"^\s*data\s+collection\s*$",
-    r"^\s*sampling\s+(methods?|procedure)?\s*$",
+    r"methods?",
+    r"methodology",
+    r"materials\s+and\s+methods",
+    r"methods\s+and\s+materials",
+    r"study\s+design",
+    r"experimental\s+(design|procedure|methods?)",
+    r"research\s+(design|methods?|methodology)",
+    r"participants\s+(and\s+methods?)?",
+    r"subjects\s+(and\s+methods?)?",
+    r"procedure[s]?",
+    r"data\s+collection",
+    r"sampling\s+(methods?|procedure)?",
 
     # Results and analysis
-    r"^\s*results?\s*$",
-    r"^\s*findings?\s*$",
-    r"^\s*analysis\s*$",
-    r"^\s*statistical\s+analysis\s*$",
+    r"results?",
+    r"findings?",
+    r"analysis",
+    r"statistical\s+analysis",
 
     # Discussion sections
-    r"^\s*discussion\s*$",
-    r"^\s*results\s+and\s+discussion\s*$",
-    r"^\s*interpretation\s*$",
+    r"discussion",
+    r"results\s+and\s+discussion",
+    r"interpretation",
 
     # Other sections
-    r"^\s*limitations?\s*$",
-    r"^\s*conclusion[s]?\s*$",
-    r"^\s*implications?\s*$",
-    r"^\s*recommenda­tions?\s*$",
-    r"^\s*acknowledg(e)?ments?\s*$",
-    r"^\s*references?\s*$",
-    r"^\s*bibliography\s*$",
-    r"^\s*supplementary\s+(materials?|information|data)\s*$",
-    r"^\s*appendix\s*$",
-    r"^\s*appendices\s*$",
+    r"limitations?",
+    r"conclusion[s]?",
+    r"implications?",
+    r"recommenda­tions?",
+    r"acknowledg(e)?ments?",
+    r"references?",
+    r"bibliography",
+    r"supplementary\s+(materials?|information|data)",
+    r"appendix",
+    r"appendices",
 ]
 
+
+def _compile_linear(pattern: str):
+    """
+    Compile a lookaround-free pattern with RE2 when available, so matching is
+    guaranteed linear-time (no backtracking); otherwise fall back to `re`.
+    Flags must be inline (e.g. "(?i)") since the two engines take different options.
+    """
+    if _HAVE_RE2:
+        try:
+            return re2.compile(pattern)
+        except Exception as e:
+            logger.debug("RE2 could not compile %r, using re: %s", pattern, e)
+    return re.compile(pattern)
+
+
+# Leading whitespace before a heading. No heading starts with whitespace, so it
+# can be matched possessively (Python 3.11+) instead of being backtracked one
+# character at a time for every alternative. The trailing "\s*$" must stay
+# backtracking: it may need to give back newlines to find the line end.
+_HEADING_LEAD = r"\s*+" if sys.version_info >= (3, 11) else r"\s*"
+
+# One anchored, factored alternation: the line anchor and leading whitespace are
+# matched once per position instead of once per heading
+_SECTION_ALTERNATION = _HEADING_LEAD + r"(?:" + "|".join(SECTION_PATTERNS) + r")\s*$"
+
 SECTION_REGEX = re.compile(
-    "(" + "|".join(SECTION_PATTERNS) + ")", flags=re.IGNORECASE | re.MULTILINE
+    r"^" + _SECTION_ALTERNATION, flags=re.IGNORECASE | re.MULTILINE
 )
 
-DOI_REGEX = re.compile(
-    r"\b(10\.\d{4,9}/[-._;()/:A-Z0-9]+)\b", flags=re.IGNORECASE
+# DOI prefixes are ASCII digits; [0-9] rather than \d so `re` (Unicode \d) and
+# RE2 (ASCII \d) agree. \b is also ASCII-only in RE2, so the engines can still
+# differ when a non-ASCII letter directly abuts a DOI or URL.
+DOI_REGEX = _compile_linear(
+    r"(?i)\b(10\.[0-9]{4,9}/[-._;()/:A-Z0-9]+)\b"
 )
 
-URL_REGEX = re.compile(
-    r"\bhttps?://[^\s)]+", flags=re.IGNORECASE
+# Non-ASCII whitespace, spelled out: `re` counts these as \s but RE2's \s is
+# ASCII-only, and a URL must stop at e.g. a no-break space on both engines
+_UNICODE_SPACES = "\x1c\x1d\x1e\x1f\x85\xa0\u1680\u2000-\u200a\u2028\u2029\u202f\u205f\u3000"
+
+URL_REGEX = _compile_linear(
+    r"(?i)\bhttps?://[^\s)" + _UNICODE_SPACES + r"]+"
 )
 
+# Caption line plus up to 200 chars of following context, captured in one pass.
+# The lookahead keeps matches zero-width so captions close together still overlap.
+# Matches start on the caption line itself ([ \t]* rather than \s*), so a cue is
+# the whole caption line plus 200 chars; the old `^\s*` could start at a blank
+# line before the caption and cut the caption short.
 FIG_TAB_REGEX = re.compile(
-    r"^\s*(figure|fig\.|table)\s*\d+[:.)]?", flags=re.IGNORECASE | re.MULTILINE
+    r"^[ \t]*(?=((?:figure|fig\.|table)\s*\d+[:.)]?[^\n]*[\s\S]{0,200}))",
+    flags=re.IGNORECASE | re.MULTILINE
+)
+
+# Single pass over the document for section headings, figure/table cues, DOIs
+# and URLs. Cue and URL captures sit in lookaheads so they never hide a DOI or
+# caption starting inside them; results match the four separate regexes above
+# (including the longer caption-line cues of FIG_TAB_REGEX).
+# This stays on `re`: RE2 has no lookarounds, and a Hyperscan database reports
+# every overlapping match as UTF-8 byte offsets rather than leftmost matches on
+# str indices, so neither can reproduce these results without a second pass.
+DOCUMENT_SCAN_REGEX = re.compile(
+    r"^(?:(?P<heading>" + _SECTION_ALTERNATION + r")"
+    r"|[ \t]*(?=(?P<cue>(?:figure|fig\.|table)\s*\d+[:.)]?[^\n]*[\s\S]{0,200})))"
+    r"|\b(?:(?P<doi>10\.[0-9]{4,9}/[-._;()/:A-Z0-9]+)\b|(?=(?P<url>https?://[^\s)]+)))",
+    flags=re.IGNORECASE | re.MULTILINE
 )
 
 # Citation/reference extraction patterns
@@ -179,13 +458,128 @@ REFERENCE_SECTION_REGEX = re.compile(
 )
 
 
-def _read_file_bytes(path: str) -> bytes:
+# Inputs larger than this are rejected before any extractor runs
+MAX_PDF_BYTES = 200 * 1024 * 1024
+
+# The "%PDF-" header must appear within the first 1024 bytes of the file
+_PDF_MAGIC = b"%PDF-"
+_PDF_HEADER_WINDOW = 1024
+
+
+def _check_pdf_file(path: str, max_bytes: int = MAX_PDF_BYTES) -> None:
+    """
+    Cheap pre-flight checks run before hashing or extraction: reject files over
+    `max_bytes` and files without a PDF header (mis-named or binary inputs).
+    """
+    size = os.path.getsize(path)
+    if size > max_bytes:
+        raise ValueError(f"PDF too large: {size:,} bytes (limit {max_bytes:,})")
     with open(path, "rb") as f:
-        return f.read()
+        head = f.read(_PDF_HEADER_WINDOW)
+    if _PDF_MAGIC not in head:
+        raise ValueError(f"Not a PDF file (no %PDF- header): {path}")
+
+
+def _content_hash(data: Any) -> Tuple[str, str]:
+    """
+    Return (algorithm, hexdigest) of a bytes-like object: BLAKE3 when installed,
+    SHA-256 otherwise. The hash is only an identity key, not a security boundary.
+    """
+    if _HAVE_BLAKE3:
+        return "blake3", _blake3(data, max_threads=_blake3.AUTO).hexdigest()
+    return "sha256", hashlib.sha256(data).hexdigest()
+
+
+_HASH_BLOCK_SIZE = 1024 * 1024
+
 
+def _stream_hash(f: Any) -> Tuple[str, str]:
+    """
+    Same result as `_content_hash` for an open binary file, read in fixed-size
+    blocks so memory stays flat. SHA-256 goes through `hashlib.file_digest` on
+    Python 3.11+, which reads straight into OpenSSL's buffer.
+    """
+    if _HAVE_BLAKE3:
+        algorithm, h = "blake3", _blake3(max_threads=_blake3.AUTO)
+    elif hasattr(hashlib, "file_digest"):
+        return "sha256", hashlib.file_digest(f, "sha256").hexdigest()
+    else:
+        algorithm, h = "sha256", hashlib.sha256()
+    for block in iter(lambda: f.read(_HASH_BLOCK_SIZE), b""):
+        h.update(block)
+    return algorithm, h.hexdigest()
 
-def _sha256(b: bytes) -> str:
-    return hashlib.sha256(b).hexdigest()
+
+def _hash_and_size(path: str) -> Tuple[str, str, int]:
+    """
+    Return (algorithm, hexdigest, size_bytes) for a file, hashing straight from a
+    read-only mmap so the PDF is never copied into a Python bytes object. The pages
+    stay in the OS page cache for the extractor's own open of the same file.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return (*_content_hash(b""), 0)  # mmap cannot map an empty file
+        try:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except (OSError, ValueError):
+            # Some filesystems and special files cannot be mapped
+            return (*_stream_hash(f), size)
+        with mm:
+            if hasattr(mmap, "MADV_SEQUENTIAL"):
+                mm.madvise(mmap.MADV_SEQUENTIAL)
+            return (*_content_hash(mm), size)
+
+
+def _file_identity(path: str) -> Tuple[str, str, int]:
+    """
+    Validate a PDF path (exists, size limit, header) and return
+    (hash_algorithm, digest, size_bytes) for it.
+    """
+    if not os.path.isfile(path):
+        raise FileNotFoundError(f"PDF not found: {path}")
+    _check_pdf_file(path)
+    return _hash_and_size(path)
+
+
+# Single-character fixes applied by _normalize_text in one pass. Ligatures are
+# word characters, so expanding them after the hyphen merge is equivalent to
+# expanding them before it.
+_NORMALIZE_CHARS = {
+    # Common ligatures (often mangled in PDFs)
+    "\ufb00": "ff", "\ufb01": "fi", "\ufb02": "fl", "\ufb03": "ffi", "\ufb04": "ffl",
+    "\ufb05": "ft", "\ufb06": "st",
+    # Soft hyphen and other invisible characters
+    "\u00ad": "",  # Soft hyphen
+    "\u200b": "",  # Zero-width space
+    "\u200c": "",  # Zero-width non-joiner
+    "\u200d": "",  # Zero-width joiner
+    "\ufeff": "",  # Zero-width no-break space / BOM
+    # Unicode dashes and quotes
+    "\u2013": "-",  # en dash
+    "\u2014": "-",  # em dash
+    "\u2018": "'",  # left single quote
+    "\u2019": "'",  # right single quote
+    "\u201c": '"',  # left double quote
+    "\u201d": '"',  # right double quote
+    # Unicode spaces (no-break, thin, ideographic, ...) become plain spaces
+    "\u00a0": " ", "\u1680": " ", "\u2000": " ", "\u2001": " ", "\u2002": " ",
+    "\u2003": " ", "\u2004": " ", "\u2005": " ", "\u2006": " ", "\u2007": " ",
+    "\u2008": " ", "\u2009": " ", "\u200a": " ", "\u202f": " ", "\u205f": " ",
+    "\u3000": " ",
+}
+# A character-class search finds the (rare) hits without touching anything else;
+# str.translate falls off its ASCII fast path on PDF text and is ~30x slower
+_NORMALIZE_CHAR_RE = re.compile("[" + "".join(_NORMALIZE_CHARS) + "]")
+
+_HYPHEN_BREAK_RE = re.compile(r"(\w)-\s*\n\s*(\w)")
+_MULTISPACE_RE = re.compile(r"([^\n])[ \t]{2,}")
+_TRAIL_WS_RE = re.compile(r"[ \t]+\n")
+_LEAD_WS_RE = re.compile(r"\n[ \t]+")
+_MANY_NL_RE = re.compile(r"\n{4,}")
+_ETAL_RE = re.compile(r"\bet\s+al\s*\.\s+")
+_EG_RE = re.compile(r"\be\s*\.\s*g\s*\.\s*")
+_IE_RE = re.compile(r"\bi\s*\.\s*e\s*\.\s*")
 
 
 def _normalize_text(text: str) -> str:
@@ -193,73 +587,89 @@ def _normalize_text(text: str) -> str:
     Enhanced text normalization for academic papers.
     Handles hyphenation, ligatures, special characters, and preserves important structure.
     """
-    # 1) Fix common ligatures (often mangled in PDFs)
-    ligature_map = {
-        "\ufb00": "ff", "\ufb01": "fi", "\ufb02": "fl", "\ufb03": "ffi", "\ufb04": "ffl",
-        "\ufb05": "ft", "\ufb06": "st"
-    }
-    for lig, replacement in ligature_map.items():
-        text = text.replace(lig, replacement)
-
-    # 2) Merge hyphenated line breaks: "exam-\nple" -> "example"
+    # 1) Merge hyphenated line breaks: "exam-\nple" -> "example"
     # Be careful to only merge real word breaks, not list items or math
-    text = re.sub(r"(\w)-\s*\n\s*(\w)", r"\1\2", text)
-
-    # 3) Replace soft hyphen U+00AD and other invisible characters
-    text = text.replace("\u00ad", "")  # Soft hyphen
-    text = text.replace("\u200b", "")  # Zero-width space
-    text = text.replace("\u200c", "")  # Zero-width non-joiner
-    text = text.replace("\u200d", "")  # Zero-width joiner
-    text = text.replace("\ufeff", "")  # Zero-width no-break space / BOM
+    text = _HYPHEN_BREAK_RE.sub(r"\1\2", text)
 
-    # 4) Fix common PDF extraction issues
-    # Remove excessive spaces within lines (but preserve paragraph breaks)
-    text = re.sub(r"([^\n])[ \t]{2,}", r"\1 ", text)
+    # 2) Fix ligatures, drop invisible characters and normalize unicode dashes
+    # and quotes in a single pass (see _NORMALIZE_CHARS)
+    text = _NORMALIZE_CHAR_RE.sub(lambda m: _NORMALIZE_CHARS[m.group()], text)
 
-    # 5) Normalize various unicode dashes and quotes
-    text = text.replace("\u2013", "-")  # en dash
-    text = text.replace("\u2014", "-")  # em dash
-    text = text.replace("\u2018", "'")  # left single quote
-    text = text.replace("\u2019", "'")  # right single quote
-    text = text.replace("\u201c", '"')  # left double quote
-    text = text.replace("\u201d", '"')  # right double quote
+    # Normalize Windows and Mac newlines to Unix
+    if "\r" in text:
+        text = text.replace("\r\n", "\n").replace("\r", "\n")
 
-    # 6) Normalize Windows and Mac newlines to Unix
-    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    # 3) Fix common PDF extraction issues
+    # Remove excessive spaces within lines (but preserve paragraph breaks)
+    text = _MULTISPACE_RE.sub(r"\1 ", text)
 
-    # 7) Remove trailing/leading spaces on lines
-    text = re.sub(r"[ \t]+\n", "\n", text)
-    text = re.sub(r"\n[ \t]+", "\n", text)
+    # 4) Remove trailing/leading spaces on lines
+    text = _TRAIL_WS_RE.sub("\n", text)
+    text = _LEAD_WS_RE.sub("\n", text)
 
-    # 8) Reduce excessive newlines (more than 3 in a row) to 2 (paragraph break)
-    text = re.sub(r"\n{4,}", "\n\n\n", text)
+    # 5) Reduce excessive newlines (more than 3 in a row) to 2 (paragraph break)
+    text = _MANY_NL_RE.sub("\n\n\n", text)
 
-    # 9) Fix common OCR errors in academic text
+    # 6) Fix common OCR errors in academic text
     # Fix "et al ." -> "et al."
-    text = re.sub(r"\bet\s+al\s*\.\s+", "et al. ", text)
+    text = _ETAL_RE.sub("et al. ", text)
     # Fix "e .g ." -> "e.g."
-    text = re.sub(r"\be\s*\.\s*g\s*\.\s*", "e.g. ", text)
+    text = _EG_RE.sub("e.g. ", text)
     # Fix "i .e ." -> "i.e."
-    text = re.sub(r"\bi\s*\.\s*e\s*\.\s*", "i.e. ", text)
+    text = _IE_RE.sub("i.e. ", text)
 
     return text.strip()
 
 
-def _chunk_text(text: str, target_chars: int = 4000, overlap: int = 200) -> List[str]:
+def _join_pages(pages: List[str]) -> str:
     """
-    Enhanced, semantic-aware chunker that tries to preserve section boundaries and paragraph structure.
-    target_chars≈4000 keeps chunks safely under ~1500-2000 tokens for most LLMs.
+    Join pages already passed through _normalize_text into the document text,
+    matching _normalize_text over the joined text without a second full pass.
     """
-    chunks: List[str] = []
+    full_text = "\n\n".join(p for p in pages if p)
+    # Normalized pages only differ from re-normalizing the whole text where a word
+    # is hyphenated across a page break (a hyphen left inside a page has no word
+    # character on one side, so the merge leaves it alone)
+    if "-\n\n" in full_text:
+        full_text = _HYPHEN_BREAK_RE.sub(r"\1\2", full_text)
+    return full_text
+
+
+def chunks_as_text(text: str, bounds: List[Tuple[int, int]]) -> List[str]:
+    """Materialize (start, end) chunk bounds from `_chunk_bounds` as strings."""
+    return [text[start:end] for start, end in bounds]
+
+
+def section_text(result: Dict[str, Any], index: int) -> str:
+    """Text of result["sections"][index], for results parsed without include_section_text."""
+    section = result["sections"][index]
+    return result["text"][section["start_char"]:section["end_char"]].strip()
+
+
+def chunk_text(result: Dict[str, Any], index: int) -> str:
+    """Text of result["chunk_bounds"][index], for results parsed without include_chunk_text."""
+    bounds = result["chunk_bounds"][index]
+    return result["text"][bounds["start_char"]:bounds["end_char"]]
+
+
+def _chunk_bounds(text: str, target_chars: int = 4000, overlap: int = 200) -> List[Tuple[int, int]]:
+    """
+    Chunk boundaries as (start, end) offsets into `text`, already trimmed of
+    surrounding whitespace, so each chunk is sliced at most once (by the caller).
+    """
+    bounds: List[Tuple[int, int]] = []
     i = 0
     n = len(text)
     if n == 0:
-        return chunks
+        return bounds
 
     while i < n:
         end = min(n, i + target_chars)
 
-        # Try to find a good break point (paragraph or sentence boundary)
+        # Try to find a good break point (paragraph or sentence boundary).
+        # Every search below is bounded to a window of at most 500 chars before
+        # `end`, so each chunk costs O(window) in C; a precomputed break index
+        # would add a full-text pass without saving anything.
         if end < n:
             # Look for paragraph break (double newline) within last 500 chars
             search_start = max(i + target_chars - 500, i)
@@ -277,9 +687,14 @@ def _chunk_text(text: str, target_chars: int = 4000, overlap: int = 200) -> List
                         end = last_sent + len(punct)
                         break
 
-        chunk = text[i:end].strip()
-        if chunk:  # Only add non-empty chunks
-            chunks.append(chunk)
+        # Trim whitespace by moving the bounds rather than copying a stripped slice
+        start, stop = i, end
+        while start < stop and text[start].isspace():
+            start += 1
+        while stop > start and text[stop - 1].isspace():
+            stop -= 1
+        if start < stop:  # Only add non-empty chunks
+            bounds.append((start, stop))
 
         if end >= n:
             break
@@ -293,42 +708,80 @@ def _chunk_text(text: str, target_chars: int = 4000, overlap: int = 200) -> List
         else:
             i = overlap_start
 
-    return chunks
+    return bounds
 
 
-def _split_sections(full_text: str) -> List[Section]:
+def _scan_document(full_text: str) -> DocumentScan:
+    """
+    Collect section headings, DOIs, URLs and figure/table cues in one traversal
+    of the text using DOCUMENT_SCAN_REGEX.
+    """
+    headings: List[Tuple[int, int, str]] = []
+    dois = set()
+    urls = set()
+    cues: List[str] = []
+    for m in DOCUMENT_SCAN_REGEX.finditer(full_text):
+        kind = m.lastgroup
+        if kind == "heading":
+            headings.append((m.start(), m.end(), m.group("heading")))
+        elif kind == "doi":
+            dois.add(m.group("doi"))
+        elif kind == "url":
+            urls.add(m.group("url"))
+        else:
+            cues.append(m.group("cue").strip())
+    return DocumentScan(headings=headings, dois=sorted(dois), urls=sorted(urls), figure_table_cues=cues)
+
+
+# Heading keywords that mark a section as methodology in _split_sections
+_METHODOLOGY_HEADING_KEYWORDS = ("method", "procedure", "design", "material", "participant",
+                                 "subject", "sampling", "data collection")
+
+
+def _split_sections(full_text: str, headings: Optional[List[Tuple[int, int, str]]] = None) -> List[Section]:
     """
     Enhanced section detection with better handling of methodology sections.
     Looks for common scholarly headings and builds sections from heading to next heading.
+    Pass `headings` from a DocumentScan to skip re-scanning the text.
     """
     sections: List[Section] = []
-    matches = list(SECTION_REGEX.finditer(full_text))
-    if not matches:
+    if headings is None:
+        headings = [(m.start(), m.end(), m.group(0)) for m in SECTION_REGEX.finditer(full_text)]
+    if not headings:
         # Return everything as a single "Body" section
-        return [Section(name="Body", start_char=0, end_char=len(full_text), text=full_text)]
+        return [Section(name="Body", start_char=0, end_char=len(full_text))]
 
     # Prepend synthetic start if text before first heading is meaningful
-    first_start = matches[0].start()
+    first_start = headings[0][0]
     if first_start > 50:
-        sections.append(Section(name="Preamble", start_char=0, end_char=first_start, text=full_text[:first_start]))
+        sections.append(Section(name="Preamble", start_char=0, end_char=first_start))
 
-    for idx, m in enumerate(matches):
-        name = m.group(0).strip().title()
-        start = m.end()
-        end = matches[idx + 1].start() if idx + 1 < len(matches) else len(full_text)
-        body = full_text[start:end].strip()
+    for idx, (_, start, heading) in enumerate(headings):
+        name = heading.strip().title()
+        end = headings[idx + 1][0] if idx + 1 < len(headings) else len(full_text)
 
         # Normalize methodology section names for consistency
         name_lower = name.lower()
-        if any(keyword in name_lower for keyword in ["method", "procedure", "design", "material", "participant", "subject", "sampling", "data collection"]):
+        if any(keyword in name_lower for keyword in _METHODOLOGY_HEADING_KEYWORDS):
             # Mark as methodology section
             if "methodology" not in name_lower and "methods" not in name_lower:
                 name = f"{name} (Methodology)"
 
-        sections.append(Section(name=name, start_char=start, end_char=end, text=body))
+        sections.append(Section(name=name, start_char=start, end_char=end))
     return sections
 
 
+# Section-name keywords and paragraph cues for _extract_methodology_context
+_METHODOLOGY_SECTION_KEYWORDS = ["method", "procedure", "design", "material", "participant",
+                                 "subject", "sampling", "data collection", "experimental"]
+_METHODOLOGY_CUES = ["we conducted", "we used", "participants were", "subjects were",
+                     "data were collected", "study design", "sample size", "randomized",
+                     "we recruited", "inclusion criteria", "exclusion criteria"]
+# One alternation over the already-lowercased paragraph instead of a scan per cue
+_METHODOLOGY_CUE_REGEX = re.compile("|".join(re.escape(cue) for cue in _METHODOLOGY_CUES))
+_MAX_METHODOLOGY_PARAGRAPHS = 10
+
+
 def _extract_methodology_context(sections: List[Section], full_text: str) -> str:
     """
     Extract and combine all methodology-related sections for better LLM analysis.
@@ -339,45 +792,50 @@ def _extract_methodology_context(sections: List[Section], full_text: str) -> str
     for section in sections:
         section_name_lower = section.name.lower()
         # Check if this is a methodology-related section
-        if any(keyword in section_name_lower for keyword in
-               ["method", "procedure", "design", "material", "participant",
-                "subject", "sampling", "data collection", "experimental"]):
-            methodology_text_parts.append(f"\n\n=== {section.name} ===\n{section.text}")
+        if any(keyword in section_name_lower for keyword in _METHODOLOGY_SECTION_KEYWORDS):
+            methodology_text_parts.append(f"\n\n=== {section.name} ===\n{section.text_from(full_text)}")
 
     if methodology_text_parts:
         return "".join(methodology_text_parts)
 
     # Fallback: try to find methodology content by keywords if no section found
-    # Look for paragraphs containing methodology indicators
-    paragraphs = full_text.split("\n\n")
+    # Look for paragraphs containing methodology indicators; only the first few are kept,
+    # so stop scanning once we have them and only lowercase paragraphs long enough to qualify
     methodology_paragraphs = []
 
-    for para in paragraphs:
-        para_lower = para.lower()
-        if len(para) > 100 and any(keyword in para_lower for keyword in
-                                   ["we conducted", "we used", "participants were", "subjects were",
-                                    "data were collected", "study design", "sample size", "randomized",
-                                    "we recruited", "inclusion criteria", "exclusion criteria"]):
+    for para in full_text.split("\n\n"):
+        if len(para) > 100 and _METHODOLOGY_CUE_REGEX.search(para.lower()):
             methodology_paragraphs.append(para)
+            if len(methodology_paragraphs) == _MAX_METHODOLOGY_PARAGRAPHS:
+                break
 
-    if methodology_paragraphs:
-        return "\n\n".join(methodology_paragraphs[:10])  # Limit to first 10 paragraphs
+    return "\n\n".join(methodology_paragraphs)
 
-    return ""
 
+# Citation-content probes shared by the reference section, citation parser and validator
+_YEAR_RE = re.compile(r"\b(19|20)\d{2}\b")
+_PUB_WORD_RE = re.compile(r"\b(vol\.|volume|journal|published)\b", re.IGNORECASE)
+_AUTHOR_INITIAL_RE = re.compile(r"[A-Z][a-z]+,\s+[A-Z]\.")
 
-def _extract_fig_table_cues(text: str) -> List[str]:
-    # Return the lines that look like Figure/Table captions
-    cues = []
-    for m in FIG_TAB_REGEX.finditer(text):
-        # capture a few words after the match line for context
-        start = m.start()
-        line_end = text.find("\n", start)
-        if line_end == -1:
-            line_end = min(start + 200, len(text))
-        snippet_end = min(line_end + 200, len(text))
-        cues.append(text[start:snippet_end].strip())
-    return cues
+# Headings that terminate a references section found by REFERENCE_SECTION_REGEX
+_REFERENCES_END_PATTERNS = [
+    r"\n\s*(?:appendix|supplementary|acknowledgment|acknowledgement)\s*\n",
+    r"\n\s*(?:figure|table)\s+\d+",
+    r"\n\s*(?:proof|lemma|theorem|corollary)\s+",  # Mathematical sections
+]
+_REFERENCES_END_REGEX = re.compile(
+    "|".join(_REFERENCES_END_PATTERNS), flags=re.IGNORECASE | re.MULTILINE
+)
+
+
+def _has_reference_content(text: str) -> bool:
+    """Whether a candidate references section contains citation-like content."""
+    return bool(
+        DOI_REGEX.search(text) or
+        _YEAR_RE.search(text) or  # Years
+        _PUB_WORD_RE.search(text) or
+        _AUTHOR_INITIAL_RE.search(text)  # Author patterns
+    )
 
 
 def _extract_references_section(full_text: str, sections: List[Section]) -> Optional[str]:
@@ -390,17 +848,9 @@ def _extract_references_section(full_text: str, sections: List[Section]) -> Opti
         section_name_lower = section.name.lower()
         if any(keyword in section_name_lower for keyword in ["reference", "bibliography", "works cited", "literature cited"]):
             # Additional validation: references section should have some citation-like content
-            section_text = section.text.strip()
-            if len(section_text) > 50:
-                # Check if it contains citation indicators
-                has_citations = (
-                    DOI_REGEX.search(section_text) or
-                    re.search(r'\b(19|20)\d{2}\b', section_text) or  # Years
-                    re.search(r'\b(vol\.|volume|journal|published)\b', section_text, re.IGNORECASE) or
-                    re.search(r'[A-Z][a-z]+,\s+[A-Z]\.', section_text)  # Author patterns
-                )
-                if has_citations:
-                    return section_text
+            section_text = section.text_from(full_text)
+            if len(section_text) > 50 and _has_reference_content(section_text):
+                return section_text
     
     # If not found in sections, try direct regex search
     ref_match = REFERENCE_SECTION_REGEX.search(full_text)
@@ -408,36 +858,54 @@ def _extract_references_section(full_text: str, sections: List[Section]) -> Opti
         # Find the start of the references section
         start_pos = ref_match.end()
         
-        # Look for the next major section or end of document
-        # Common patterns: next section heading, appendix, or end of text
-        next_section_patterns = [
-            r"\n\s*(?:appendix|supplementary|acknowledgment|acknowledgement)\s*\n",
-            r"\n\s*(?:figure|table)\s+\d+",
-            r"\n\s*(?:proof|lemma|theorem|corollary)\s+",  # Mathematical sections
-        ]
-        
-        end_pos = len(full_text)
-        for pattern in next_section_patterns:
-            next_match = re.search(pattern, full_text[start_pos:], re.IGNORECASE | re.MULTILINE)
-            if next_match:
-                end_pos = min(end_pos, start_pos + next_match.start())
+        # Look for the next major section or end of document: the earliest match of
+        # any end pattern, searched in place rather than on a sliced copy
+        next_match = _REFERENCES_END_REGEX.search(full_text, start_pos)
+        end_pos = next_match.start() if next_match else len(full_text)
         
         references_text = full_text[start_pos:end_pos].strip()
         # Validate that it looks like a references section
-        if len(references_text) > 50:
-            # Check if it contains citation indicators
-            has_citations = (
-                DOI_REGEX.search(references_text) or
-                re.search(r'\b(19|20)\d{2}\b', references_text) or  # Years
-                re.search(r'\b(vol\.|volume|journal|published)\b', references_text, re.IGNORECASE) or
-                re.search(r'[A-Z][a-z]+,\s+[A-Z]\.', references_text)  # Author patterns
-            )
-            if has_citations:
-                return references_text
+        if len(references_text) > 50 and _has_reference_content(references_text):
+            return references_text
     
     return None
 
 
+# Year candidates tried in order by _parse_citation, each with the literals one
+# of which must occur in the citation for the pattern to match
+_CITATION_YEAR_PATTERNS = [
+    (("19", "20"), _YEAR_RE),  # 1900-2099
+    (("(",), re.compile(r"\((\d{4})\)")),  # (2023)
+    (("[",), re.compile(r"\[(\d{4})\]")),  # [2023]
+]
+
+# Citation style detectors
+_APA_YEAR_RE = re.compile(r"\((\d{4})\)\.\s+[A-Z]")
+_APA_JOURNAL_VOL_RE = re.compile(r"\.\s+[A-Z][a-z]+,\s+\d+")
+_VANCOUVER_RE = re.compile(r"\.\s+\d{4}\s*[;:]\s*\d+")
+_QUOTED_TITLE_JOURNAL_RE = re.compile(r'"[^"]+",\s*[A-Z]')
+_CHICAGO_RE = re.compile(r"\(\d{4}\)\s*:\s*\d+")
+
+# Field extractors
+_AUTHOR_SPLIT_RE = re.compile(r",\s*(?:and|&)\s*|,\s*")
+_COMMA_SPLIT_RE = re.compile(r",\s*")
+_APA_JOURNAL_RE = re.compile(r"\.\s+([A-Z][^,]+?),\s+(\d+)")
+_PAGE_RANGE_RE = re.compile(r"(?:pp\.\s*)?(\d+)\s*[-–]\s*(\d+)")
+# Zero-width so every start offset is tried; the caller picks the first whose
+# year equals the parsed one (same result as searching for that literal year)
+_VANCOUVER_VOL_PAGES_RE = re.compile(r"(?=(\d{4})\s*;\s*(\d+)(?:\((\d+)\))?\s*:\s*(\d+[-–]?\d*))")
+_QUOTED_TITLE_RE = re.compile(r'"([^"]+)"')
+_IEEE_VOL_RE = re.compile(r"vol\.\s*(\d+)", re.IGNORECASE)
+_IEEE_ISSUE_RE = re.compile(r"no\.\s*(\d+)", re.IGNORECASE)
+_IEEE_PAGES_RE = re.compile(r"pp\.\s*(\d+[-–]?\d*)", re.IGNORECASE)
+_TITLE_CANDIDATE_RE = re.compile(r"\.\s+([A-Z][^.]{10,80})\.")
+_LEADING_AUTHOR_RE = re.compile(r"^([A-Z][a-z]+(?:\s+[A-Z]\.?)?(?:\s+[A-Z][a-z]+)*)")
+_GENERIC_JOURNAL_RE = re.compile(r"\.\s+([A-Z][A-Za-z\s&]+?)(?:,\s*(?:vol\.|no\.|\d{4}))")
+_VOLUME_RE = re.compile(r"(?:vol\.|volume|vol)\s*[:\s]*(\d+)", re.IGNORECASE)
+_ISSUE_RE = re.compile(r"(?:no\.|number|issue|iss)\s*[:\s]*(\d+)", re.IGNORECASE)
+_PAGES_RE = re.compile(r"(?:pp?\.|pages?)\s*[:\s]*(\d+[-–]?\d*)", re.IGNORECASE)
+
+
 def _parse_citation(citation_text: str, citation_num: int) -> Dict[str, Any]:
     """
     Parse a single citation entry into structured format.
@@ -445,13 +913,27 @@ def _parse_citation(citation_text: str, citation_num: int) -> Dict[str, Any]:
     
     Returns a dict with parsed fields: authors, title, journal, year, doi, etc.
     """
-    citation_text = citation_text.strip()
+    # The cached fields are shared, so callers get their own dict and authors list
+    parsed = dict(_parse_citation_text(citation_text.strip()))
+    parsed["citation_number"] = citation_num
+    if "authors" in parsed:
+        parsed["authors"] = list(parsed["authors"])
+    return parsed
+
+
+@lru_cache(maxsize=4096)
+def _parse_citation_text(citation_text: str) -> Dict[str, Any]:
+    """
+    Parse a stripped citation string for _parse_citation (which fills in
+    citation_number). Cached: the same entry text recurs across re-analyses of a
+    paper and in works that repeat references per chapter. Never mutate the result.
+    """
     if not citation_text or len(citation_text) < 10:
-        return {"raw": citation_text, "citation_number": citation_num}
+        return {"raw": citation_text, "citation_number": None}
     
     parsed = {
         "raw": citation_text,
-        "citation_number": citation_num,
+        "citation_number": None,
         "authors": [],
         "title": None,
         "journal": None,
@@ -466,24 +948,25 @@ def _parse_citation(citation_text: str, citation_num: int) -> Dict[str, Any]:
         "citation_style": None,
     }
     
+    # Every regex below is guarded by a substring probe for a literal it needs,
+    # so detectors for styles the citation can't be in are never run
+    text_lower = citation_text.lower()
+    
     # Extract DOI
-    doi_match = DOI_REGEX.search(citation_text)
+    doi_match = "10." in citation_text and DOI_REGEX.search(citation_text)
     if doi_match:
         parsed["doi"] = doi_match.group(1)
     
     # Extract URL
-    url_match = URL_REGEX.search(citation_text)
+    url_match = "http" in text_lower and URL_REGEX.search(citation_text)
     if url_match:
         parsed["url"] = url_match.group(0)
     
     # Extract year (4-digit year, typically between 1900-2100)
-    year_patterns = [
-        r"\b(19|20)\d{2}\b",  # 1900-2099
-        r"\((\d{4})\)",  # (2023)
-        r"\[(\d{4})\]",  # [2023]
-    ]
-    for pattern in year_patterns:
-        year_match = re.search(pattern, citation_text)
+    for literals, pattern in _CITATION_YEAR_PATTERNS:
+        if not any(literal in citation_text for literal in literals):
+            continue
+        year_match = pattern.search(citation_text)
         if year_match:
             year_str = year_match.group(1) if year_match.lastindex else year_match.group(0)
             try:
@@ -497,29 +980,32 @@ def _parse_citation(citation_text: str, citation_num: int) -> Dict[str, Any]:
     # Try to identify citation style and parse accordingly
     
     # APA Style: Author, A. A., & Author, B. B. (Year). Title. Journal, Volume(Issue), Pages. DOI
-    if re.search(r"\((\d{4})\)\.\s+[A-Z]", citation_text) or re.search(r"\.\s+[A-Z][a-z]+,\s+\d+", citation_text):
+    if (
+        (")." in citation_text and _APA_YEAR_RE.search(citation_text)) or
+        ("," in citation_text and _APA_JOURNAL_VOL_RE.search(citation_text))
+    ):
         parsed["citation_style"] = "APA"
         # Extract authors (before year)
         if parsed["year"]:
             year_pos = citation_text.find(str(parsed["year"]))
             authors_text = citation_text[:year_pos].strip()
             # Split by comma and "&" or "and"
-            authors = re.split(r",\s*(?:and|&)\s*|,\s*", authors_text)
+            authors = _AUTHOR_SPLIT_RE.split(authors_text)
             parsed["authors"] = [a.strip() for a in authors if a.strip() and len(a.strip()) > 2]
         
         # Extract journal (often after title, before volume)
-        journal_match = re.search(r"\.\s+([A-Z][^,]+?),\s+(\d+)", citation_text)
+        journal_match = _APA_JOURNAL_RE.search(citation_text)
         if journal_match:
             parsed["journal"] = journal_match.group(1).strip()
             parsed["volume"] = journal_match.group(2)
         
         # Extract pages (format: pp. 123-145 or 123-145)
-        pages_match = re.search(r"(?:pp\.\s*)?(\d+)\s*[-–]\s*(\d+)", citation_text)
+        pages_match = ("-" in citation_text or "–" in citation_text) and _PAGE_RANGE_RE.search(citation_text)
         if pages_match:
             parsed["pages"] = f"{pages_match.group(1)}-{pages_match.group(2)}"
     
     # Vancouver/Numeric Style: Author. Title. Journal. Year;Volume(Issue):Pages.
-    elif re.search(r"\.\s+\d{4}\s*;\s*\d+", citation_text) or re.search(r"\.\s+\d{4}\s*:\s*\d+", citation_text):
+    elif (";" in citation_text or ":" in citation_text) and _VANCOUVER_RE.search(citation_text):
         parsed["citation_style"] = "Vancouver"
         # Extract authors (first sentence before period)
         first_period = citation_text.find(".")
@@ -542,53 +1028,56 @@ def _parse_citation(citation_text: str, citation_num: int) -> Dict[str, Any]:
                         parsed["journal"] = journal_candidate
         
         # Extract volume and pages (format: 2023;15(3):123-145)
-        volume_pages_match = re.search(rf"{parsed['year']}\s*;\s*(\d+)(?:\((\d+)\))?\s*:\s*(\d+[-–]?\d*)", citation_text)
+        volume_pages_match = next(
+            (m for m in _VANCOUVER_VOL_PAGES_RE.finditer(citation_text) if m.group(1) == str(parsed["year"])),
+            None,
+        )
         if volume_pages_match:
-            parsed["volume"] = volume_pages_match.group(1)
-            if volume_pages_match.group(2):
-                parsed["issue"] = volume_pages_match.group(2)
-            parsed["pages"] = volume_pages_match.group(3)
+            parsed["volume"] = volume_pages_match.group(2)
+            if volume_pages_match.group(3):
+                parsed["issue"] = volume_pages_match.group(3)
+            parsed["pages"] = volume_pages_match.group(4)
     
     # IEEE Style: A. Author, "Title," Journal, vol. X, no. Y, pp. Z, Year.
-    elif re.search(r'"[^"]+",\s*[A-Z]', citation_text) and re.search(r"vol\.\s*\d+", citation_text, re.IGNORECASE):
+    elif '"' in citation_text and _QUOTED_TITLE_JOURNAL_RE.search(citation_text) and _IEEE_VOL_RE.search(citation_text):
         parsed["citation_style"] = "IEEE"
         # Extract title (in quotes)
-        title_match = re.search(r'"([^"]+)"', citation_text)
+        title_match = _QUOTED_TITLE_RE.search(citation_text)
         if title_match:
             parsed["title"] = title_match.group(1)
         
         # Extract authors (before title)
         if title_match:
             authors_text = citation_text[:title_match.start()].strip().rstrip(",")
-            authors = re.split(r",\s*", authors_text)
+            authors = _COMMA_SPLIT_RE.split(authors_text)
             parsed["authors"] = [a.strip() for a in authors if a.strip()]
         
         # Extract volume
-        vol_match = re.search(r"vol\.\s*(\d+)", citation_text, re.IGNORECASE)
+        vol_match = _IEEE_VOL_RE.search(citation_text)
         if vol_match:
             parsed["volume"] = vol_match.group(1)
         
         # Extract issue
-        issue_match = re.search(r"no\.\s*(\d+)", citation_text, re.IGNORECASE)
+        issue_match = "no." in text_lower and _IEEE_ISSUE_RE.search(citation_text)
         if issue_match:
             parsed["issue"] = issue_match.group(1)
         
         # Extract pages
-        pages_match = re.search(r"pp\.\s*(\d+[-–]?\d*)", citation_text, re.IGNORECASE)
+        pages_match = "pp." in text_lower and _IEEE_PAGES_RE.search(citation_text)
         if pages_match:
             parsed["pages"] = pages_match.group(1)
     
     # MLA Style: Author. "Title." Journal, vol. X, no. Y, Year, pp. Z.
-    elif re.search(r'"[^"]+",\s*[A-Z]', citation_text) and re.search(r"vol\.\s*\d+", citation_text, re.IGNORECASE):
+    elif '"' in citation_text and _QUOTED_TITLE_JOURNAL_RE.search(citation_text) and _IEEE_VOL_RE.search(citation_text):
         # Similar to IEEE but different ordering
         if not parsed["citation_style"]:
             parsed["citation_style"] = "MLA"
-            title_match = re.search(r'"([^"]+)"', citation_text)
+            title_match = _QUOTED_TITLE_RE.search(citation_text)
             if title_match:
                 parsed["title"] = title_match.group(1)
     
     # Chicago Style: Author. "Title." Journal Volume, no. Issue (Year): Pages.
-    elif re.search(r"\(\d{4}\)\s*:\s*\d+", citation_text):
+    elif "(" in citation_text and ":" in citation_text and _CHICAGO_RE.search(citation_text):
         parsed["citation_style"] = "Chicago"
         # Extract authors (first part before period)
         first_period = citation_text.find(".")
@@ -601,25 +1090,25 @@ def _parse_citation(citation_text: str, citation_num: int) -> Dict[str, Any]:
         parsed["citation_style"] = "Unknown"
         
         # Try to extract title (often in quotes or italics, or first capitalized phrase)
-        title_match = re.search(r'"([^"]+)"', citation_text)
+        title_match = '"' in citation_text and _QUOTED_TITLE_RE.search(citation_text)
         if title_match:
             parsed["title"] = title_match.group(1)
         else:
             # Look for capitalized phrase that might be a title
-            title_candidate = re.search(r"\.\s+([A-Z][^.]{10,80})\.", citation_text)
+            title_candidate = _TITLE_CANDIDATE_RE.search(citation_text)
             if title_candidate:
                 parsed["title"] = title_candidate.group(1).strip()
         
         # Extract authors (first part, often ends with comma or period)
         if not parsed["authors"]:
             # Look for name patterns: "Last, First" or "First Last"
-            author_match = re.search(r"^([A-Z][a-z]+(?:\s+[A-Z]\.?)?(?:\s+[A-Z][a-z]+)*)", citation_text)
+            author_match = _LEADING_AUTHOR_RE.search(citation_text)
             if author_match:
                 parsed["authors"] = [author_match.group(1).strip()]
         
         # Extract journal (often capitalized, before volume/year)
         if not parsed["journal"]:
-            journal_match = re.search(r"\.\s+([A-Z][A-Za-z\s&]+?)(?:,\s*(?:vol\.|no\.|\d{4}))", citation_text)
+            journal_match = _GENERIC_JOURNAL_RE.search(citation_text)
             if journal_match:
                 journal_candidate = journal_match.group(1).strip()
                 if len(journal_candidate) > 3 and len(journal_candidate) < 100:
@@ -627,127 +1116,200 @@ def _parse_citation(citation_text: str, citation_num: int) -> Dict[str, Any]:
     
     # Extract volume and issue if not already extracted
     if not parsed["volume"]:
-        vol_match = re.search(r"(?:vol\.|volume|vol)\s*[:\s]*(\d+)", citation_text, re.IGNORECASE)
+        vol_match = "vol" in text_lower and _VOLUME_RE.search(citation_text)
         if vol_match:
             parsed["volume"] = vol_match.group(1)
     
     if not parsed["issue"]:
-        issue_match = re.search(r"(?:no\.|number|issue|iss)\s*[:\s]*(\d+)", citation_text, re.IGNORECASE)
+        # No probe here: IGNORECASE also matches "ı"/"ſ"/"İ" for the i and s of "iss"
+        issue_match = _ISSUE_RE.search(citation_text)
         if issue_match:
             parsed["issue"] = issue_match.group(1)
     
     if not parsed["pages"]:
-        pages_match = re.search(r"(?:pp?\.|pages?)\s*[:\s]*(\d+[-–]?\d*)", citation_text, re.IGNORECASE)
+        pages_match = ("p." in text_lower or "page" in text_lower) and _PAGES_RE.search(citation_text)
         if pages_match:
             parsed["pages"] = pages_match.group(1)
     
     return parsed
 
 
+# Proof language and mathematical content, matched against lower-cased text
+_PROOF_INDICATORS = [
+    r'\bby\s+induction\b',
+    r'\bthe\s+proof\s+is\b',
+    r'\bwe\s+prove\b',
+    r'\bproof\s+by\b',
+    r'\blet\s+\w+\s+be\b',
+    r'\bthus\s+\w+',
+    r'\bassume\s+that\b',
+    r'\bsuppose\s+that\b',
+    r'\bit\s+follows\s+that\b',
+    r'\bwe\s+show\s+that\b',
+    r'\bwe\s+have\b',
+    r'\bconsider\s+the\b',
+]
+_PROOF_INDICATOR_REGEX = re.compile("|".join(_PROOF_INDICATORS))
+
+_GREEK_LETTERS = r'[αβγδεζηθικλμνξοπρστυφχψωΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ]'
+_GREEK_RE = re.compile(_GREEK_LETTERS)
+_MATH_CHAR_RE = re.compile(_GREEK_LETTERS + r'|[\^_\{\}\(\)\[\]=\+\-×÷]')
+
+_PROOF_STARTER_PUB_RE = re.compile(r'\b(vol\.|volume|journal|published|press|university|edition)\b')
+_PUBLICATION_RE = re.compile(r'\b(vol\.|volume|vol\.|no\.|number|issue|pp\.|pages?|journal|journal of|proceedings|conference|workshop|symposium)\b')
+_PUBLISHER_RE = re.compile(r'\b(published|press|university|publisher|edition|ed\.|editor|eds\.)\b')
+_AUTHOR_FULL_NAME_RE = re.compile(r'[A-Z][a-z]+\s+[A-Z]\.\s+[A-Z][a-z]+')
+
+# Literal keywords at least one of which must occur for the proof / publication
+# regexes above to match; used to skip those regexes in one Aho-Corasick pass
+_PROOF_KEYWORDS = [
+    "induction", "proof", "prove", "let", "thus", "assume", "suppose",
+    "follows", "show", "have", "consider",
+]
+_PUBLICATION_KEYWORDS = [
+    "vol", "no.", "number", "issue", "pp.", "page", "journal", "proceedings",
+    "conference", "workshop", "symposium", "publish", "press", "university",
+    "edition", "ed.", "editor", "eds.",
+]
+
+
+def _keyword_automaton(keywords: List[str]):
+    """Build an Aho-Corasick automaton over `keywords`, or None without pyahocorasick."""
+    if not _HAVE_AHOCORASICK:
+        return None
+    automaton = ahocorasick.Automaton()
+    for keyword in keywords:
+        automaton.add_word(keyword, keyword)
+    automaton.make_automaton()
+    return automaton
+
+
+_PROOF_KEYWORD_AUTOMATON = _keyword_automaton(_PROOF_KEYWORDS)
+_PUBLICATION_KEYWORD_AUTOMATON = _keyword_automaton(_PUBLICATION_KEYWORDS)
+
+
+def _may_contain_keyword(automaton, text: str) -> bool:
+    """False only if no keyword of `automaton` occurs in `text`; True when there is no automaton."""
+    return automaton is None or next(automaton.iter(text), None) is not None
+
+
+# Author-like openings (Last, First or First Last with initials)
+_LEADING_AUTHOR_PATTERNS = [
+    r'[A-Z][a-z]+,\s+[A-Z]\.',  # "Smith, J."
+    r'[A-Z][a-z]+\s+[A-Z]\.\s+[A-Z][a-z]+',  # "Smith J. R."
+    r'[A-Z][a-z]+\s+and\s+[A-Z][a-z]+',  # "Smith and Jones"
+    r'[A-Z][a-z]+,\s+[A-Z]\.\s+[A-Z]\.',  # "Smith, J. R."
+]
+_LEADING_AUTHOR_REGEX = re.compile("|".join(_LEADING_AUTHOR_PATTERNS))
+
+
+@lru_cache(maxsize=4096)
 def _is_valid_citation(citation_text: str) -> bool:
     """
     Validate if a text snippet is likely a real citation.
     Filters out proof text, mathematical expressions, and other non-citation content.
+    Pure, so results are cached: the fallback split in _segment_citations
+    often re-validates fragments the first pass already checked.
     
     Returns True if the text appears to be a valid citation.
     """
-    if not citation_text or len(citation_text.strip()) < 20:
+    if not citation_text:
+        return False
+    text_stripped = citation_text.strip()
+    if len(text_stripped) < 20:
         return False
     
     text_lower = citation_text.lower()
-    text_stripped = citation_text.strip()
     
     # Filter out proof language and mathematical content
-    proof_indicators = [
-        r'\bby\s+induction\b',
-        r'\bthe\s+proof\s+is\b',
-        r'\bwe\s+prove\b',
-        r'\bproof\s+by\b',
-        r'\blet\s+\w+\s+be\b',
-        r'\bthus\s+\w+',
-        r'\bassume\s+that\b',
-        r'\bsuppose\s+that\b',
-        r'\bit\s+follows\s+that\b',
-        r'\bwe\s+show\s+that\b',
-        r'\bwe\s+have\b',
-        r'\bconsider\s+the\b',
-    ]
-    
-    for pattern in proof_indicators:
-        if re.search(pattern, text_lower):
-            return False
+    if _may_contain_keyword(_PROOF_KEYWORD_AUTOMATON, text_lower) and _PROOF_INDICATOR_REGEX.search(text_lower):
+        return False
+    
+    # Structural indicators, each searched only when the literal its regex
+    # requires is present (most fragments fail these substring tests)
+    has_link = bool(
+        ("10." in citation_text and DOI_REGEX.search(citation_text)) or  # DOI
+        ("http" in text_lower and URL_REGEX.search(citation_text))  # URL
+    )
+    has_year = bool(
+        ("19" in citation_text or "20" in citation_text) and _YEAR_RE.search(citation_text)
+    )
+    # Publication/publisher keyword regexes below can only match if a keyword is present
+    has_publication_keyword = _may_contain_keyword(_PUBLICATION_KEYWORD_AUTOMATON, text_lower)
     
     # Filter out mathematical expressions (Greek letters, subscripts, mathematical operators)
     # Citations rarely contain complex mathematical notation
-    greek_letters = r'[αβγδεζηθικλμνξοπρστυφχψωΑΒΓΔΕΖΗΘΙΚΛΜΝΞΟΠΡΣΤΥΦΧΨΩ]'
-    if re.search(greek_letters, citation_text):
-        # Allow if it's part of a DOI or URL, but not if it's standalone math
-        if not (DOI_REGEX.search(citation_text) or URL_REGEX.search(citation_text)):
-            # Check if it's mostly mathematical (high ratio of Greek/math symbols)
-            math_chars = len(re.findall(greek_letters + r'|[\^_\{\}\(\)\[\]=\+\-×÷]', citation_text))
-            if math_chars > len(citation_text) * 0.1:  # More than 10% math symbols
-                return False
+    if not has_link and _GREEK_RE.search(citation_text):
+        # Allowed if it's part of a DOI or URL, but not if it's standalone math:
+        # check if it's mostly mathematical (high ratio of Greek/math symbols)
+        math_chars = len(_MATH_CHAR_RE.findall(citation_text))
+        if math_chars > len(citation_text) * 0.1:  # More than 10% math symbols
+            return False
     
     # Filter out text that starts with common proof words
-    proof_starters = ['let ', 'we ', 'thus ', 'therefore ', 'hence ', 'assume ', 'suppose ']
-    first_words = text_stripped[:20].lower()
-    if any(first_words.startswith(starter) for starter in proof_starters):
+    proof_starters = ('let ', 'we ', 'thus ', 'therefore ', 'hence ', 'assume ', 'suppose ')
+    if text_stripped[:20].lower().startswith(proof_starters):
         # But allow if it has citation indicators
         has_citation_indicators = (
-            DOI_REGEX.search(citation_text) or
-            URL_REGEX.search(citation_text) or
-            re.search(r'\b(19|20)\d{2}\b', citation_text) or  # Year
-            re.search(r'\b(vol\.|volume|journal|published|press|university|edition)\b', text_lower)
+            has_link or
+            has_year or
+            (has_publication_keyword and _PROOF_STARTER_PUB_RE.search(text_lower))
         )
         if not has_citation_indicators:
             return False
     
-    # Citations should have at least one of these indicators:
-    citation_indicators = [
-        DOI_REGEX.search(citation_text),  # DOI
-        URL_REGEX.search(citation_text),  # URL
-        re.search(r'\b(19|20)\d{2}\b', citation_text),  # Year (1900-2099)
-        re.search(r'\b(vol\.|volume|vol\.|no\.|number|issue|pp\.|pages?|journal|journal of|proceedings|conference|workshop|symposium)\b', text_lower),  # Publication indicators
-        re.search(r'\b(published|press|university|publisher|edition|ed\.|editor|eds\.)\b', text_lower),  # Publisher indicators
-        re.search(r'[A-Z][a-z]+\s+[A-Z]\.\s+[A-Z][a-z]+', citation_text),  # Author name pattern (e.g., "Smith, J. R.")
-        re.search(r'[A-Z][a-z]+,\s+[A-Z]\.', citation_text),  # Author name pattern (e.g., "Smith, J.")
-    ]
-    
-    # If it has at least one citation indicator, it's likely valid
-    if any(citation_indicators):
+    # Citations should have at least one of these indicators; if it has any,
+    # it's likely valid (checked in order, stopping at the first hit)
+    if (
+        has_link or
+        has_year or  # Year (1900-2099)
+        (has_publication_keyword and (
+            _PUBLICATION_RE.search(text_lower) or  # Publication indicators
+            _PUBLISHER_RE.search(text_lower)  # Publisher indicators
+        )) or
+        _AUTHOR_FULL_NAME_RE.search(citation_text) or  # Author name pattern (e.g., "Smith, J. R.")
+        _AUTHOR_INITIAL_RE.search(citation_text)  # Author name pattern (e.g., "Smith, J.")
+    ):
         return True
     
     # If it's very short and has no indicators, it's probably not a citation
-    if len(citation_text.strip()) < 50:
+    if len(text_stripped) < 50:
         return False
     
     # Check for author-like patterns (Last, First or First Last with initials)
-    author_patterns = [
-        r'^[A-Z][a-z]+,\s+[A-Z]\.',  # "Smith, J."
-        r'^[A-Z][a-z]+\s+[A-Z]\.\s+[A-Z][a-z]+',  # "Smith J. R."
-        r'^[A-Z][a-z]+\s+and\s+[A-Z][a-z]+',  # "Smith and Jones"
-        r'^[A-Z][a-z]+,\s+[A-Z]\.\s+[A-Z]\.',  # "Smith, J. R."
-    ]
-    
-    if any(re.match(pattern, text_stripped) for pattern in author_patterns):
+    if _LEADING_AUTHOR_REGEX.match(text_stripped):
         return True
     
     # If none of the above, it's probably not a citation
     return False
 
 
-def _extract_citations(references_text: str) -> List[Dict[str, Any]]:
+# Citation-start markers for _segment_citations
+_NUMBERED_CITATION_REGEX = re.compile(
+    r"^\s*(?:\[?\d+\]?[.)]\s*|\(\d+\)\s*)",
+    re.MULTILINE | re.IGNORECASE
+)
+# Line-start markers ("1.", "[2]", "3)", "•", "-", "*") are tested on the first
+# characters directly; str.isdecimal matches the same characters as \d
+_CITATION_BULLETS = "•-*"
+_AUTHOR_LINE_RE = re.compile(r"^[A-Z][a-z]+\s+[A-Z]")
+_LEADING_BULLET_RE = re.compile(r"^\s*[•\-\*]\s*")
+_CITATION_FALLBACK_SPLIT_RE = re.compile(r"\n\s*\n|\.\s*\n(?=[A-Z])")
+
+
+def _segment_citations(references_text: str) -> List[Tuple[str, int]]:
     """
-    Extract individual citations from the references section.
+    Split the references section into individual citation entries.
     Handles various numbering formats and citation styles.
     Filters out non-citation text (proofs, mathematical expressions, etc.).
     
-    Returns a list of parsed citation dictionaries.
+    Returns (citation_text, citation_number) pairs; parsing them into fields is
+    left to _parse_citation so callers that only need a count skip it.
     """
     if not references_text or len(references_text.strip()) < 20:
         return []
     
-    citations = []
+    citations: List[Tuple[str, int]] = []
     
     # Split references by common patterns
     # Patterns for citation starts:
@@ -756,13 +1318,9 @@ def _extract_citations(references_text: str) -> List[Dict[str, Any]]:
     # 3. Author-year: "Author, A. (2023)"
     
     # Try numbered format first (most common)
-    numbered_pattern = re.compile(
-        r"^\s*(?:\[?\d+\]?[.)]\s*|\(\d+\)\s*)", 
-        re.MULTILINE | re.IGNORECASE
-    )
-    
-    # Split by numbered citations
-    parts = re.split(numbered_pattern, references_text)
+    # Split by numbered citations. The pattern has no capture groups, so the parts are
+    # just the entries (no separator items), and split beats slicing finditer spans
+    parts = _NUMBERED_CITATION_REGEX.split(references_text)
     
     # If splitting by numbers didn't work well, try other methods
     if len(parts) < 3:
@@ -770,6 +1328,7 @@ def _extract_citations(references_text: str) -> List[Dict[str, Any]]:
         # Look for lines that start with common citation patterns
         lines = references_text.split("\n")
         current_citation = []
+        current_citation_len = 0  # len(" ".join(current_citation)), kept without re-joining
         
         for line in lines:
             line_stripped = line.strip()
@@ -777,35 +1336,40 @@ def _extract_citations(references_text: str) -> List[Dict[str, Any]]:
                 if current_citation:
                     citation_text = " ".join(current_citation).strip()
                     if len(citation_text) > 20:
-                        citations.append(_parse_citation(citation_text, len(citations) + 1))
+                        citations.append((citation_text, len(citations) + 1))
                     current_citation = []
+                    current_citation_len = 0
                 continue
             
             # Check if this line starts a new citation
+            first_char = line_stripped[0]
             is_new_citation = (
-                re.match(r"^\d+[.)]\s*", line_stripped) or
-                re.match(r"^\[?\d+\]?\s*", line_stripped) or
-                re.match(r"^[•\-\*]\s*", line_stripped) or
+                first_char.isdecimal() or
+                (first_char == "[" and line_stripped[1:2].isdecimal()) or
+                first_char in _CITATION_BULLETS or
                 (current_citation and 
-                 re.match(r"^[A-Z][a-z]+\s+[A-Z]", line_stripped) and
-                 len(current_citation) > 0 and
-                 len(" ".join(current_citation)) > 50)
+                 _AUTHOR_LINE_RE.match(line_stripped) and
+                 current_citation_len > 50)
             )
             
             if is_new_citation and current_citation:
                 # Save previous citation
                 citation_text = " ".join(current_citation).strip()
                 if len(citation_text) > 20 and _is_valid_citation(citation_text):
-                    citations.append(_parse_citation(citation_text, len(citations) + 1))
+                    citations.append((citation_text, len(citations) + 1))
                 current_citation = []
+                current_citation_len = 0
             
+            if current_citation:
+                current_citation_len += 1  # joining space
+            current_citation_len += len(line_stripped)
             current_citation.append(line_stripped)
         
         # Add last citation
         if current_citation:
             citation_text = " ".join(current_citation).strip()
             if len(citation_text) > 20 and _is_valid_citation(citation_text):
-                citations.append(_parse_citation(citation_text, len(citations) + 1))
+                citations.append((citation_text, len(citations) + 1))
     else:
         # Process numbered citations
         citation_num = 1
@@ -813,8 +1377,8 @@ def _extract_citations(references_text: str) -> List[Dict[str, Any]]:
             part = part.strip()
             if len(part) > 20 and _is_valid_citation(part):  # Validate before adding
                 # Clean up: remove leading numbers/bullets if any
-                part = re.sub(r"^\s*[•\-\*]\s*", "", part)
-                citations.append(_parse_citation(part, citation_num))
+                part = _LEADING_BULLET_RE.sub("", part)
+                citations.append((part, citation_num))
                 citation_num += 1
     
     # If we still don't have many citations, try a more aggressive approach
@@ -822,19 +1386,25 @@ def _extract_citations(references_text: str) -> List[Dict[str, Any]]:
     if len(citations) < 3:
         # Split by double newlines or periods followed by newlines (end of citation)
         # This is a fallback for poorly formatted references
-        potential_citations = re.split(r"\n\s*\n|\.\s*\n(?=[A-Z])", references_text)
+        potential_citations = _CITATION_FALLBACK_SPLIT_RE.split(references_text)
         if len(potential_citations) > len(citations):
             citations = []
             for i, cit_text in enumerate(potential_citations, 1):
                 cit_text = cit_text.strip()
                 # Validate before adding - be stricter in fallback mode
                 if len(cit_text) > 30 and _is_valid_citation(cit_text):
-                    citations.append(_parse_citation(cit_text, i))
+                    citations.append((cit_text, i))
     
-    logger.info(f"Extracted {len(citations)} citations from references section")
     return citations
 
 
+def _page_limit(num_pages: int, max_pages: Optional[int]) -> int:
+    """Number of pages to extract given an optional (non-positive = unlimited) cap."""
+    if max_pages is not None and max_pages > 0:
+        return min(num_pages, max_pages)
+    return num_pages
+
+
 def _safe_int(x: Any) -> Optional[int]:
     try:
         return int(x)
@@ -846,7 +1416,11 @@ def _safe_int(x: Any) -> Optional[int]:
 # OCR Functions
 # -----------------------------
 
-def _needs_ocr(pages: List[str], threshold_chars_per_page: int = 50) -> bool:
+# Pages whose extracted text is shorter than this (after stripping) count as image-only
+OCR_MIN_CHARS_PER_PAGE = 50
+
+
+def _needs_ocr(pages: List[str], threshold_chars_per_page: int = OCR_MIN_CHARS_PER_PAGE) -> bool:
     """
     Determine if a PDF needs OCR processing.
     
@@ -864,13 +1438,16 @@ def _needs_ocr(pages: List[str], threshold_chars_per_page: int = 50) -> bool:
     if not pages:
         return True
     
+    # Strip each page once and reuse the lengths for both statistics
+    page_lengths = [len(page.strip()) for page in pages]
+
     # Calculate average characters per page
-    total_chars = sum(len(page.strip()) for page in pages)
-    avg_chars_per_page = total_chars / len(pages) if pages else 0
+    total_chars = sum(page_lengths)
+    avg_chars_per_page = total_chars / len(pages)
     
     # Count pages with very little text
-    low_text_pages = sum(1 for page in pages if len(page.strip()) < threshold_chars_per_page)
-    low_text_ratio = low_text_pages / len(pages) if pages else 1.0
+    low_text_pages = sum(1 for length in page_lengths if length < threshold_chars_per_page)
+    low_text_ratio = low_text_pages / len(pages)
     
     # Need OCR if average is too low OR if most pages have little text
     needs_ocr = avg_chars_per_page < threshold_chars_per_page or low_text_ratio > 0.7
@@ -911,7 +1488,14 @@ def _ocr_page_with_confidence(
         output_type=pytesseract.Output.DICT,
         lang='eng',  # Default to English, can be extended for multilingual support
     )
-    
+    return _filter_ocr_words(ocr_data, word_confidence_threshold)
+
+
+def _filter_ocr_words(ocr_data: Dict[str, List[Any]], word_confidence_threshold: int = 60) -> str:
+    """
+    Build page text from one page of Tesseract image_to_data output, dropping
+    low-confidence words and likely OCR artifacts.
+    """
     # Filter words and characters based on confidence thresholds
     filtered_text_parts = []
     current_line_words = []
@@ -962,7 +1546,8 @@ def _ocr_page_with_confidence(
     filtered_words = []
     for word in words:
         # Keep words that have at least 50% alphanumeric characters
-        alnum_ratio = sum(1 for c in word if c.isalnum()) / len(word) if word else 0
+        # map(str.isalnum) keeps the per-character test in C (True counts as 1)
+        alnum_ratio = sum(map(str.isalnum, word)) / len(word) if word else 0
         if alnum_ratio >= 0.5 or len(word) <= 2:  # Keep short words (likely valid)
             filtered_words.append(word)
     
@@ -971,42 +1556,36 @@ def _ocr_page_with_confidence(
     return result_text
 
 
-def _ocr_single_page(args: Tuple[str, int, Dict[str, Any]]) -> Tuple[int, str]:
+# Render resolution for OCR; 300 DPI is the usual quality/speed balance for Tesseract
+OCR_DPI = 300
+
+
+def _render_page_for_ocr(page: Any, dpi: int = OCR_DPI) -> Image.Image:
+    """Rasterize a PyMuPDF page in grayscale for Tesseract."""
+    mat = fitz.Matrix(dpi / 72, dpi / 72)
+    # Tesseract reduces colour input to luminance anyway, so render gray directly:
+    # a third of the pixel data to hold, write and read back
+    pix = page.get_pixmap(matrix=mat, colorspace=fitz.csGRAY, alpha=False)
+    # Wrap the raw samples directly; a PNG encode/decode round trip costs ~10x the
+    # render itself and pytesseract re-encodes the image for Tesseract anyway
+    return Image.frombytes("L", (pix.width, pix.height), pix.samples, "raw", "L", pix.stride)
+
+
+def _ocr_single_page(args: Tuple[int, Image.Image]) -> Tuple[int, str]:
     """
-    Process a single page for OCR (used in parallel processing).
+    OCR one rasterized page (run on a worker thread).
     
     Args:
-        args: Tuple of (pdf_path, page_num, page_info)
-            - pdf_path: Path to PDF file
+        args: Tuple of (page_num, page_image)
             - page_num: Page number (0-indexed)
-            - page_info: Dict with page metadata (optional)
+            - page_image: PIL Image from _render_page_for_ocr
             
     Returns:
         Tuple of (page_num, extracted_text)
     """
-    pdf_path, page_num, page_info = args
+    page_num, page_image = args
     
     try:
-        # Open PDF and get page
-        if _HAVE_MUPDF:
-            doc = fitz.open(pdf_path)
-            page = doc.load_page(page_num)
-            
-            # Convert page to image (300 DPI for good OCR quality)
-            logger.debug(f"[OCR] Converting page {page_num + 1} to image (300 DPI)")
-            mat = fitz.Matrix(300/72, 300/72)  # 300 DPI scaling
-            pix = page.get_pixmap(matrix=mat)
-            
-            # Convert to PIL Image
-            img_data = pix.tobytes("png")
-            page_image = Image.open(io.BytesIO(img_data))
-            
-            doc.close()
-        else:
-            # Fallback: try pdf2image if available, otherwise skip
-            logger.warning(f"[OCR] PyMuPDF not available for OCR page {page_num + 1}, skipping")
-            return (page_num, "")
-        
         # Perform OCR with confidence filtering
         logger.debug(f"[OCR] Running Tesseract OCR on page {page_num + 1}")
         text = _ocr_page_with_confidence(page_image)
@@ -1020,19 +1599,82 @@ def _ocr_single_page(args: Tuple[str, int, Dict[str, Any]]) -> Tuple[int, str]:
         return (page_num, "")
 
 
+# Pages per Tesseract run. Tesseract loads its LSTM model once per run, so batching
+# amortizes that start-up; batches stay small because every page of a batch is held
+# in memory as a rendered image (~8 MB at 300 DPI) until it is handed to a worker
+_OCR_BATCH_PAGES = 4
+
+
+def _ocr_page_batch(batch: List[Tuple[int, Image.Image]]) -> List[Tuple[int, str]]:
+    """
+    OCR several rasterized pages with a single Tesseract run (run on a worker thread).
+
+    The pages are written to a temporary directory and passed to Tesseract as a
+    list file; the page_num column of the output tells the pages apart. If the
+    batch run fails, the pages are OCR'd one by one instead.
+
+    Returns:
+        List of (page_num, extracted_text) in batch order
+    """
+    if len(batch) == 1:
+        return [_ocr_single_page(batch[0])]
+
+    try:
+        with tempfile.TemporaryDirectory(prefix="qualilens_ocr_") as tmp_dir:
+            image_paths = []
+            for page_num, page_image in batch:
+                image_path = os.path.join(tmp_dir, f"page_{page_num}.png")
+                page_image.save(image_path)
+                image_paths.append(image_path)
+            list_path = os.path.join(tmp_dir, "pages.txt")
+            with open(list_path, "w", encoding="utf-8") as f:
+                f.write("\n".join(image_paths) + "\n")
+            logger.debug(f"[OCR] Running Tesseract OCR on {len(batch)} pages")
+            ocr_data = pytesseract.image_to_data(
+                list_path,
+                output_type=pytesseract.Output.DICT,
+                lang='eng',
+            )
+    except Exception as e:
+        logger.warning(f"[OCR] Batch OCR failed ({e}), processing its pages individually")
+        return [_ocr_single_page(item) for item in batch]
+
+    # Tesseract numbers the listed images 1..len(batch)
+    rows_by_page: Dict[int, List[int]] = {}
+    for row, page_index in enumerate(ocr_data["page_num"]):
+        rows_by_page.setdefault(int(page_index), []).append(row)
+
+    results = []
+    for page_index, (page_num, _) in enumerate(batch, start=1):
+        rows = rows_by_page.get(page_index, [])
+        page_data = {key: [ocr_data[key][row] for row in rows] for key in ("text", "conf", "line_num")}
+        text = _filter_ocr_words(page_data)
+        logger.debug(f"[OCR] Page {page_num + 1} OCR complete: {len(text.strip())} characters extracted")
+        results.append((page_num, text))
+    return results
+
+
 def _extract_with_ocr(
     path: str,
-    num_cores: Optional[int] = None
+    num_cores: Optional[int] = None,
+    max_pages: Optional[int] = None,
+    page_numbers: Optional[List[int]] = None,
+    dpi: int = OCR_DPI
 ) -> Tuple[List[str], Dict[str, Any], List[Dict[str, Any]]]:
     """
     Extract text from a scanned PDF using Tesseract OCR with parallel processing.
     
-    Uses multiprocessing.Pool with N-2 cores (where N is total CPU cores) for parallel
-    page processing to achieve target performance of ≥1 page/second.
+    Pages are rasterized once, in the calling thread, and OCR'd in small batches by
+    N-2 worker threads (where N is total CPU cores); each Tesseract run is its own
+    subprocess, so the threads overlap them without forking Python workers.
     
     Args:
         path: Path to PDF file
         num_cores: Number of cores to use (default: max(1, cpu_count() - 2))
+        max_pages: If set, only OCR the first N pages
+        page_numbers: If set, only OCR these pages (0-indexed); the other entries of
+            pages_text are left empty
+        dpi: Render resolution (default OCR_DPI); 200 is often enough for clean scans
         
     Returns:
         Tuple of (pages_text, metadata, pages_with_coords)
@@ -1061,8 +1703,12 @@ def _extract_with_ocr(
     
     # Open PDF to get page count and metadata
     doc = fitz.open(path)
-    num_pages = len(doc)
-    logger.info(f"[OCR] Total pages to process: {num_pages}")
+    num_pages = _page_limit(len(doc), max_pages)
+    if page_numbers is None:
+        ocr_page_numbers = list(range(num_pages))
+    else:
+        ocr_page_numbers = [page_num for page_num in page_numbers if page_num < num_pages]
+    logger.info(f"[OCR] Total pages to process: {len(ocr_page_numbers)} of {num_pages}")
     
     # Get metadata
     info = doc.metadata or {}
@@ -1076,22 +1722,15 @@ def _extract_with_ocr(
         "modification_date": info.get("modDate"),
     }
     
-    doc.close()
-    
     # Determine number of cores for parallel processing (N-2 cores)
     if num_cores is None:
         total_cores = multiprocessing.cpu_count()
         num_cores = max(1, total_cores - 2)
         # Don't use more cores than pages
-        num_cores = min(num_cores, num_pages)
+        num_cores = max(1, min(num_cores, len(ocr_page_numbers)))
     
     logger.info(f"[OCR] Using {num_cores} cores for parallel processing")
-    logger.info(f"[OCR] Processing {num_pages} pages with Tesseract OCR (confidence filtering: word≥60%, char≥70%)")
-    
-    # Prepare arguments for parallel processing
-    page_args = [
-        (path, page_num, {}) for page_num in range(num_pages)
-    ]
+    logger.info(f"[OCR] Processing {len(ocr_page_numbers)} pages with Tesseract OCR (confidence filtering: word≥60%, char≥70%)")
     
     # Process pages in parallel
     pages_text = [""] * num_pages
@@ -1099,15 +1738,49 @@ def _extract_with_ocr(
     
     try:
         logger.info(f"[OCR] Starting parallel OCR processing...")
-        with multiprocessing.Pool(processes=num_cores) as pool:
-            results = pool.map(_ocr_single_page, page_args)
-        
-        # Sort results by page number and extract text
-        results.sort(key=lambda x: x[0])
+        # MuPDF is not thread-safe, so pages are rendered here and only the images go
+        # to the threads; at most num_cores batches are in flight at once. Short
+        # documents use smaller batches so every worker still gets pages.
+        # Threads also work inside daemonic pool workers (e.g. ParsePDFTool.run_batch)
+        batch_size = max(1, min(_OCR_BATCH_PAGES, math.ceil(len(ocr_page_numbers) / num_cores)))
+        # Progress is logged roughly every tenth of the document
+        progress_every = max(1, len(ocr_page_numbers) // 10)
         total_chars = 0
-        for page_num, text in results:
-            pages_text[page_num] = text
-            total_chars += len(text.strip())
+        pages_done = 0
+
+        def _collect(batch_results: List[Tuple[int, str]]) -> None:
+            # Results carry their page number, so they are stored as each batch
+            # finishes; indexed assignment keeps pages_text in page order
+            nonlocal total_chars, pages_done
+            for page_num, text in batch_results:
+                pages_text[page_num] = text
+                total_chars += len(text.strip())
+            previous = pages_done
+            pages_done += len(batch_results)
+            if pages_done // progress_every > previous // progress_every:
+                logger.info(f"[OCR] Progress: {pages_done}/{len(ocr_page_numbers)} pages")
+
+        with ThreadPoolExecutor(max_workers=num_cores) as executor:
+            in_flight = deque()
+            batch: List[Tuple[int, Image.Image]] = []
+            for page_num in ocr_page_numbers:
+                try:
+                    logger.debug(f"[OCR] Converting page {page_num + 1} to image ({dpi} DPI)")
+                    page_image = _render_page_for_ocr(doc.load_page(page_num), dpi)
+                except Exception as e:
+                    logger.error(f"[OCR] Error during OCR for page {page_num + 1}: {e}")
+                    _collect([(page_num, "")])
+                    continue
+                batch.append((page_num, page_image))
+                if len(batch) == batch_size:
+                    in_flight.append(executor.submit(_ocr_page_batch, batch))
+                    batch = []
+                    if len(in_flight) >= num_cores:
+                        _collect(in_flight.popleft().result())
+            if batch:
+                in_flight.append(executor.submit(_ocr_page_batch, batch))
+            for future in in_flight:
+                _collect(future.result())
         
         # Create pages_with_coords structure (simplified for OCR, no precise coordinates)
         for page_num in range(num_pages):
@@ -1119,14 +1792,16 @@ def _extract_with_ocr(
                 "ocr_processed": True  # Flag to indicate OCR was used
             })
         
-        avg_chars_per_page = total_chars / num_pages if num_pages > 0 else 0
+        avg_chars_per_page = total_chars / len(ocr_page_numbers) if ocr_page_numbers else 0
         logger.info(f"[OCR] ===== OCR extraction completed successfully =====")
-        logger.info(f"[OCR] Processed {num_pages} pages, extracted {total_chars:,} total characters ({avg_chars_per_page:.1f} avg/page)")
+        logger.info(f"[OCR] Processed {len(ocr_page_numbers)} pages, extracted {total_chars:,} total characters ({avg_chars_per_page:.1f} avg/page)")
         
     except Exception as e:
         logger.error(f"[OCR] ===== Error during parallel OCR processing =====")
         logger.error(f"[OCR] Error details: {e}")
         raise
+    finally:
+        doc.close()
     
     return pages_text, meta, pages_with_coords
 
@@ -1135,119 +1810,192 @@ def _extract_with_ocr(
 # Extractors
 # -----------------------------
 
-def _extract_with_pymupdf(path: str) -> Tuple[List[str], Dict[str, Any], List[Dict[str, Any]]]:
+# Documents with at least this many pages are split into page ranges and
+# extracted in parallel processes (MuPDF is not thread-safe, so no threads)
+PARALLEL_PAGE_THRESHOLD = 100
+_MAX_PAGE_WORKERS = 8
+
+
+def _extract_pymupdf_page(page: Any, page_num: int, include_coords: bool = True) -> Tuple[str, Optional[Dict[str, Any]]]:
+    """
+    Extract one PyMuPDF page: reading-order text plus line/span blocks with
+    normalized bounding boxes for evidence highlighting.
+
+    Returns:
+        Tuple of (page_text, page_coords) where page_coords has page_num (1-indexed),
+        text_blocks, page_width and page_height, or is None if include_coords is False
+    """
+    # Build the TextPage once. TEXTFLAGS_BLOCKS skips image extraction, which the
+    # "dict" pass never uses.
+    textpage = page.get_textpage(flags=fitz.TEXTFLAGS_BLOCKS)
+
+    # A single "dict" pass feeds both the page text and the coordinates below
+    text_dict = page.get_text("dict", textpage=textpage) if include_coords else None
+
+    # Use "blocks" layout for better multi-column support
+    # This preserves reading order better than "text" mode. Building the TextPage
+    # dominates per-page cost; the blocks text and join are a few percent of it, so
+    # "text" mode with TEXT_DEHYPHENATE would only trade away reading order and the
+    # _HYPHEN_BREAK_RE merge rules in _normalize_text for a negligible gain
+    try:
+        if text_dict is not None:
+            # Rebuild the "blocks" output from the dict: each text block's lines, each
+            # terminated by a newline, keyed by the block's top-left corner
+            page_blocks = [
+                (int(block["bbox"][1] / 50), block["bbox"][0],
+                 "".join("".join(span["text"] for span in line["spans"]) + "\n" for line in block["lines"]))
+                for block in text_dict.get("blocks", []) if "lines" in block
+            ]
+        else:
+            # Without coordinates the C-level "blocks" pass is cheaper than building the dict
+            page_blocks = [(int(block[1] / 50), block[0], block[4]) for block in page.get_text("blocks", textpage=textpage)]
+        # Sort blocks by ~50pt vertical band (y0) then horizontal position (x0) for
+        # proper reading order; the band is computed once per block above. PyMuPDF's
+        # sort=True orders by exact coordinates instead, which interleaves columns.
+        # The sort is stable, so blocks with the same band and x0 keep PDF order.
+        page_blocks.sort(key=itemgetter(0, 1))
+        page_text_str = "\n".join(block[2] for block in page_blocks if block[2].strip())
+    except:
+        # Fallback to simple text extraction
+        page_text_str = page.get_text("text", textpage=textpage)
+
+    if text_dict is None:
+        return page_text_str, None
+
+    # Extract text with coordinates for evidence highlighting
+    page_width = page.rect.width
+    page_height = page.rect.height
+
+    # Extract text blocks with bounding boxes
+    # We extract both line-level and span-level blocks for better matching.
+    # Spans are handled with unpacked coordinates and each text is stripped once;
+    # this loop runs for every span on every page
+    text_blocks = []
+    for block in text_dict.get("blocks", []):
+        if "lines" not in block:  # Not a text block
+            continue
+        for line in block["lines"]:
+            line_text = ""
+            line_bbox = None
+            line_spans = 0  # Non-blank spans in this line
+            span_blocks = []  # Collect spans for this line
+
+            for span in line["spans"]:
+                span_text = span["text"]
+                span_text_stripped = span_text.strip()
+                if not span_text_stripped:
+                    continue
+
+                line_text += span_text
+                line_spans += 1
+                # Get bounding box for this span
+                span_bbox = span.get("bbox", [0, 0, 0, 0])
+                x0, y0, x1, y1 = span_bbox
+
+                # Extract span-level block for more precise matching: only spans with
+                # meaningful text (at least 3 chars), a valid box, and a box that is not
+                # too small (to avoid clutter)
+                if len(span_text_stripped) >= 3 and x0 > 0 and y0 > 0 and x1 > x0 and y1 > y0:
+                    width = (x1 - x0) / page_width
+                    height = (y1 - y0) / page_height
+                    if width > 0.01 and height > 0.005:  # Minimum size threshold
+                        span_blocks.append({
+                            "x": x0 / page_width,
+                            "y": y0 / page_height,
+                            "width": width,
+                            "height": height,
+                            "text": span_text_stripped,
+                            "raw_bbox": span_bbox
+                        })
+
+                if line_bbox is None:
+                    line_bbox = [x0, y0, x1, y1]
+                else:
+                    # Expand bbox to include this span
+                    if x0 < line_bbox[0]:
+                        line_bbox[0] = x0
+                    if y0 < line_bbox[1]:
+                        line_bbox[1] = y0
+                    if x1 > line_bbox[2]:
+                        line_bbox[2] = x1
+                    if y1 > line_bbox[3]:
+                        line_bbox[3] = y1
+
+            # Add line-level block (for broader matching); line_bbox is only set
+            # once a non-blank span was seen
+            if line_bbox is not None:
+                text_blocks.append({
+                    "x": line_bbox[0] / page_width,
+                    "y": line_bbox[1] / page_height,
+                    "width": (line_bbox[2] - line_bbox[0]) / page_width,
+                    "height": (line_bbox[3] - line_bbox[1]) / page_height,
+                    "text": line_text.strip(),
+                    "raw_bbox": line_bbox
+                })
+
+            # Also add span-level blocks for more precise matching. A line made of a
+            # single span already has that span's exact text and box as its line block
+            if line_spans > 1:
+                text_blocks.extend(span_blocks)
+
+    return page_text_str, {
+        "page_num": page_num + 1,  # 1-indexed
+        "text_blocks": text_blocks,
+        "page_width": page_width,
+        "page_height": page_height
+    }
+
+
+def _extract_pymupdf_range(job: Tuple[str, int, int, bool]) -> List[Tuple[str, Optional[Dict[str, Any]]]]:
+    """
+    Worker for parallel extraction: open the PDF in this process and extract
+    pages [start, stop). Module-level so it can be pickled.
+    """
+    path, start, stop, include_coords = job
+    doc = fitz.open(path)
+    try:
+        return [_extract_pymupdf_page(doc.load_page(i), i, include_coords) for i in range(start, stop)]
+    finally:
+        doc.close()
+
+
+def _extract_with_pymupdf(
+    path: str,
+    max_pages: Optional[int] = None,
+    include_coords: bool = True,
+) -> Tuple[List[str], Dict[str, Any], List[Dict[str, Any]]]:
     """
     Enhanced PDF text extraction with coordinate information for evidence highlighting.
     Handles multi-column layouts and preserves reading order.
 
+    Large documents (>= PARALLEL_PAGE_THRESHOLD pages) are split into contiguous
+    page ranges, each extracted by a separate process with its own document handle.
+
     Returns:
         Tuple of (pages_text, metadata, pages_with_coords)
-        pages_with_coords: List of dicts with page_num, text_blocks (with bboxes)
+        pages_with_coords: List of dicts with page_num, text_blocks (with bboxes);
+        empty if include_coords is False
     """
     doc = fitz.open(path)
-    pages = []
-    pages_with_coords = []
+    num_pages = _page_limit(len(doc), max_pages)
+    workers = min(os.cpu_count() or 1, _MAX_PAGE_WORKERS, num_pages)
+
+    if (
+        num_pages >= PARALLEL_PAGE_THRESHOLD
+        and workers > 1
+        and not multiprocessing.current_process().daemon  # pool workers cannot fork again
+    ):
+        step = math.ceil(num_pages / workers)
+        jobs = [(path, i, min(i + step, num_pages), include_coords) for i in range(0, num_pages, step)]
+        logger.info("Extracting %d pages with PyMuPDF across %d processes", num_pages, len(jobs))
+        with multiprocessing.Pool(processes=len(jobs)) as pool:
+            extracted = [item for chunk in pool.map(_extract_pymupdf_range, jobs) for item in chunk]
+    else:
+        extracted = [_extract_pymupdf_page(doc.load_page(i), i, include_coords) for i in range(num_pages)]
 
-    for page_num in range(len(doc)):
-        page = doc.load_page(page_num)
+    pages = [page_text for page_text, _ in extracted]
+    pages_with_coords = [page_coords for _, page_coords in extracted] if include_coords else []
 
-        # Use "blocks" mode for better multi-column support
-        # This preserves reading order better than "text" mode
-        try:
-            # Try to extract with layout preservation (better for multi-column)
-            page_text = page.get_text("blocks")
-            # Sort blocks by vertical position (y0) then horizontal (x0) for proper reading order
-            sorted_blocks = sorted(page_text, key=lambda b: (int(b[1] / 50), b[0]))  # Group by ~50pt vertical bands
-            page_text_str = "\n".join(block[4] for block in sorted_blocks if len(block) > 4 and block[4].strip())
-        except:
-            # Fallback to simple text extraction
-            page_text_str = page.get_text("text")
-
-        pages.append(page_text_str)
-        
-        # Extract text with coordinates for evidence highlighting
-        text_dict = page.get_text("dict")
-        page_width = page.rect.width
-        page_height = page.rect.height
-        
-        # Extract text blocks with bounding boxes
-        # We extract both line-level and span-level blocks for better matching
-        text_blocks = []
-        for block in text_dict.get("blocks", []):
-            if "lines" in block:  # Text block
-                block_text = ""
-                block_bbox = None
-                for line in block["lines"]:
-                    line_text = ""
-                    line_bbox = None
-                    span_blocks = []  # Collect spans for this line
-                    
-                    for span in line["spans"]:
-                        span_text = span["text"]
-                        if not span_text.strip():
-                            continue
-                            
-                        line_text += span_text
-                        # Get bounding box for this span
-                        span_bbox = span.get("bbox", [0, 0, 0, 0])
-                        
-                        # Extract span-level block for more precise matching
-                        if span_bbox and all(v > 0 for v in span_bbox[:2]) and span_bbox[2] > span_bbox[0] and span_bbox[3] > span_bbox[1]:
-                            span_normalized = {
-                                "x": span_bbox[0] / page_width,
-                                "y": span_bbox[1] / page_height,
-                                "width": (span_bbox[2] - span_bbox[0]) / page_width,
-                                "height": (span_bbox[3] - span_bbox[1]) / page_height,
-                                "text": span_text.strip(),
-                                "raw_bbox": span_bbox
-                            }
-                            # Only add if span has meaningful text (at least 3 chars)
-                            if len(span_text.strip()) >= 3:
-                                span_blocks.append(span_normalized)
-                        
-                        if line_bbox is None:
-                            line_bbox = list(span_bbox)
-                        else:
-                            # Expand bbox to include this span
-                            line_bbox[0] = min(line_bbox[0], span_bbox[0])  # x0
-                            line_bbox[1] = min(line_bbox[1], span_bbox[1])  # y0
-                            line_bbox[2] = max(line_bbox[2], span_bbox[2])  # x1
-                            line_bbox[3] = max(line_bbox[3], span_bbox[3])  # y1
-                    
-                    # Add line-level block (for broader matching)
-                    if line_text.strip() and line_bbox:
-                        normalized_bbox = {
-                            "x": line_bbox[0] / page_width,
-                            "y": line_bbox[1] / page_height,
-                            "width": (line_bbox[2] - line_bbox[0]) / page_width,
-                            "height": (line_bbox[3] - line_bbox[1]) / page_height,
-                            "text": line_text.strip(),
-                            "raw_bbox": line_bbox
-                        }
-                        text_blocks.append(normalized_bbox)
-                        block_text += line_text + " "
-                        
-                        if block_bbox is None:
-                            block_bbox = list(line_bbox)
-                        else:
-                            block_bbox[0] = min(block_bbox[0], line_bbox[0])
-                            block_bbox[1] = min(block_bbox[1], line_bbox[1])
-                            block_bbox[2] = max(block_bbox[2], line_bbox[2])
-                            block_bbox[3] = max(block_bbox[3], line_bbox[3])
-                    
-                    # Also add span-level blocks for more precise matching
-                    # (but only if they're not too small to avoid clutter)
-                    for span_block in span_blocks:
-                        if span_block["width"] > 0.01 and span_block["height"] > 0.005:  # Minimum size threshold
-                            text_blocks.append(span_block)
-        
-        pages_with_coords.append({
-            "page_num": page_num + 1,  # 1-indexed
-            "text_blocks": text_blocks,
-            "page_width": page_width,
-            "page_height": page_height
-        })
-    
     info = doc.metadata or {}
     meta = {
         "title": info.get("title"),
@@ -1261,13 +2009,17 @@ def _extract_with_pymupdf(path: str) -> Tuple[List[str], Dict[str, Any], List[Di
     return pages, meta, pages_with_coords
 
 
-def _extract_with_pdfminer(path: str) -> Tuple[List[str], Dict[str, Any], List[Dict[str, Any]]]:
+# Rough page boundary for pdfminer output that has no form feeds
+_PDFMINER_PAGE_GAP_RE = re.compile(r"\n{3,}")
+
+
+def _extract_with_pdfminer(path: str, max_pages: Optional[int] = None) -> Tuple[List[str], Dict[str, Any], List[Dict[str, Any]]]:
     # pdfminer returns one long string; we'll split by form feed if present, else by heuristic
-    text = pdfminer_extract_text(path)
-    # Try page splits
-    pages = re.split(r"\f", text) if "\f" in text else text.split("\x0c")
+    text = pdfminer_extract_text(path, maxpages=max_pages if max_pages and max_pages > 0 else 0)  # 0 = all pages
+    # Try page splits (pdfminer ends every page with a form feed)
+    pages = text.split("\f")
     if len(pages) == 1:  # fallback: very rough page split on multiple newlines
-        pages = re.split(r"\n{3,}", text)
+        pages = _PDFMINER_PAGE_GAP_RE.split(text)
     meta: Dict[str, Any] = {}
     # Metadata via PyPDF2 if available
     if _HAVE_PYPDF2:
@@ -1290,9 +2042,10 @@ def _extract_with_pdfminer(path: str) -> Tuple[List[str], Dict[str, Any], List[D
     return pages, meta, pages_with_coords
 
 
-def _extract_with_pypdf2(path: str) -> Tuple[List[str], Dict[str, Any], List[Dict[str, Any]]]:
+def _extract_with_pypdf2(path: str, max_pages: Optional[int] = None) -> Tuple[List[str], Dict[str, Any], List[Dict[str, Any]]]:
     reader = PdfReader(path)
-    pages = [page.extract_text() or "" for page in reader.pages]
+    num_pages = _page_limit(len(reader.pages), max_pages)
+    pages = [reader.pages[i].extract_text() or "" for i in range(num_pages)]
     info = reader.metadata or {}
     meta = {
         "title": getattr(info, "title", None),
@@ -1308,48 +2061,171 @@ def _extract_with_pypdf2(path: str) -> Tuple[List[str], Dict[str, Any], List[Dic
     return pages, meta, pages_with_coords
 
 
-def extract_pdf(path: str) -> Tuple[List[str], PDFMetadata, List[Dict[str, Any]]]:
+# Extraction results (pages plus block coordinates, several times the text size) are
+# kept in their own, untracked database rather than the shared tool result cache,
+# holding only the most recently used parses
+EXTRACTION_CACHE_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "pdf_extraction_cache.db"
+)
+EXTRACTION_CACHE_MAX_ENTRIES = 200
+
+# Bump when extraction or page normalization output changes, so cached pages
+# from older code are not reused
+_EXTRACTION_CACHE_VERSION = 3
+
+
+def extract_pdf(
+    path: str,
+    max_pages: Optional[int] = None,
+    enable_layout_analysis: bool = False,
+    cache: Optional["ToolResultCache"] = None,
+    include_coords: bool = True,
+    ocr_dpi: int = OCR_DPI,
+    identity: Optional[Tuple[str, str, int]] = None,
+) -> Tuple[List[str], PDFMetadata, List[Dict[str, Any]]]:
     """
     Returns (pages_text_list, metadata, pages_with_coords)
     Preference: PyMuPDF > pdfminer > PyPDF2 > OCR (if needed)
+
+    Oversized or non-PDF inputs are rejected with ValueError before any extractor
+    runs. If max_pages is set, extractors stop after the first N pages.
     
     pages_with_coords: List of dicts with page_num, text_blocks (with bboxes), page_width, page_height
     
     OCR is automatically used as a fallback when:
     - Text extraction fails completely, OR
     - Extracted text is too sparse (indicating a scanned PDF)
+    Pages are rendered for OCR at ocr_dpi.
+
+    If enable_layout_analysis is set, semantic roles are added to the text blocks
+    in pages_with_coords (S-FR1).
+
+    If include_coords is False, no text blocks are built (pages_with_coords is
+    empty, so layout analysis is skipped too); only the page text is extracted.
+
+    If a ToolResultCache is given, results are stored under the file's content
+    hash, so re-parsing an identical PDF (under any name) skips extraction, OCR
+    and layout analysis entirely.
+
+    Pass `identity` from _file_identity if the caller already validated and
+    hashed the file.
     """
-    if not os.path.isfile(path):
-        raise FileNotFoundError(f"PDF not found: {path}")
+    hash_algorithm, digest, size = identity if identity is not None else _file_identity(path)
+    content_id = f"{hash_algorithm}:{digest}"
+
+    # Layout analysis annotates the text blocks, so it needs coordinates
+    enable_layout_analysis = enable_layout_analysis and include_coords
+    cache_params = {
+        "max_pages": max_pages if max_pages is not None and max_pages > 0 else None,
+        "layout_analysis": enable_layout_analysis,
+        "coords": include_coords,
+        "ocr_dpi": ocr_dpi,
+        "extraction_version": _EXTRACTION_CACHE_VERSION,
+    }
+    cached = cache.get_cached_result("parse_pdf", content_id, **cache_params) if cache else None
+    if cached:
+        pages = cached["pages"]
+        meta_dict = cached["metadata"]
+        pages_with_coords = cached["pages_with_coords"]
+    else:
+        pages, meta_dict, pages_with_coords = _extract_pages(
+            path, max_pages=max_pages, include_coords=include_coords, ocr_dpi=ocr_dpi
+        )
+        layout_done = True
+        if enable_layout_analysis:
+            analyzed = _analyze_layout(pages, pages_with_coords)
+            layout_done = analyzed is not None
+            if layout_done:
+                pages_with_coords = analyzed
+        # Don't cache a result whose layout analysis failed under the "analyzed" key
+        if cache and layout_done:
+            cache.cache_result(
+                "parse_pdf",
+                content_id,
+                {"pages": pages, "metadata": meta_dict, "pages_with_coords": pages_with_coords},
+                **cache_params,
+            )
+
+    meta = PDFMetadata(
+        title=meta_dict.get("title"),
+        authors=meta_dict.get("authors"),
+        subject=meta_dict.get("subject"),
+        creator=meta_dict.get("creator"),
+        producer=meta_dict.get("producer"),
+        creation_date=meta_dict.get("creation_date"),
+        modification_date=meta_dict.get("modification_date"),
+        file_size_bytes=size,
+        # Only one hash is computed; sha256 is reported when it is the algorithm in use
+        sha256=digest if hash_algorithm == "sha256" else None,
+        content_id=content_id,
+    )
+    return pages, meta, pages_with_coords
 
-    file_bytes = _read_file_bytes(path)
-    sha = _sha256(file_bytes)
-    size = len(file_bytes)
 
+def _analyze_layout(pages: List[str], pages_with_coords: List[Dict[str, Any]]) -> Optional[List[Dict[str, Any]]]:
+    """
+    S-FR1: Layout Analysis - add semantic roles to text blocks.
+    Returns the enhanced pages_with_coords, or None if analysis is unavailable or failed.
+    """
+    if not (_HAVE_LAYOUT_ANALYZER and analyze_document_layout):
+        logger.warning("[Layout Analysis] Enabled but layout_analyzer module not available - skipping")
+        return None
+    try:
+        logger.info("[Layout Analysis] Enabled - Performing semantic role identification")
+        pages_with_coords = analyze_document_layout(
+            pages_with_coords=pages_with_coords,
+            pages_text=pages,
+            use_ml_models=False  # Set to True if ML models are available
+        )
+        logger.info("[Layout Analysis] Successfully completed - semantic roles added to text blocks")
+        return pages_with_coords
+    except Exception as e:
+        logger.warning(f"[Layout Analysis] Failed, continuing without semantic roles: {e}")
+        # Continue without layout analysis - backward compatible
+        return None
+
+
+def _extract_pages(
+    path: str,
+    max_pages: Optional[int] = None,
+    include_coords: bool = True,
+    ocr_dpi: int = OCR_DPI,
+) -> Tuple[List[str], Dict[str, Any], List[Dict[str, Any]]]:
+    """
+    Run the extractor cascade (with OCR fallback) and normalize each page.
+    Returns (pages_text_list, raw_metadata_dict, pages_with_coords); pages_with_coords
+    is empty if include_coords is False.
+    """
     pages: List[str] = []
     meta_dict: Dict[str, Any] = {}
     pages_with_coords: List[Dict[str, Any]] = []
 
     last_err: Optional[Exception] = None
+    # PyMuPDF yields exactly one text entry per physical page, so its pages can be
+    # OCR'd selectively; pdfminer/PyPDF2 page splits are not reliable enough for that
+    has_page_text_layer = False
 
     # Try standard text extraction methods first
     if _HAVE_MUPDF:
         try:
-            pages, meta_dict, pages_with_coords = _extract_with_pymupdf(path)
+            pages, meta_dict, pages_with_coords = _extract_with_pymupdf(
+                path, max_pages=max_pages, include_coords=include_coords
+            )
+            has_page_text_layer = bool(pages)
         except Exception as e:
             last_err = e
             logger.warning("PyMuPDF extraction failed: %s", e)
 
     if not pages and _HAVE_PDFMINER:
         try:
-            pages, meta_dict, pages_with_coords = _extract_with_pdfminer(path)
+            pages, meta_dict, pages_with_coords = _extract_with_pdfminer(path, max_pages=max_pages)
         except Exception as e:
             last_err = e
             logger.warning("pdfminer extraction failed: %s", e)
 
     if not pages and _HAVE_PYPDF2:
         try:
-            pages, meta_dict, pages_with_coords = _extract_with_pypdf2(path)
+            pages, meta_dict, pages_with_coords = _extract_with_pypdf2(path, max_pages=max_pages)
         except Exception as e:
             last_err = e
             logger.warning("PyPDF2 extraction failed: %s", e)
@@ -1358,21 +2234,37 @@ def extract_pdf(path: str) -> Tuple[List[str], PDFMetadata, List[Dict[str, Any]]
     # OCR is needed if:
     # 1. No text was extracted at all, OR
     # 2. The extracted text is too sparse (average < 50 chars per page)
-    if pages:
-        # Check if OCR is needed even though we have some text
-        needs_ocr_check = _needs_ocr(pages)
-        if not needs_ocr_check:
-            # Log that OCR was checked but not needed (for visibility)
-            if _HAVE_TESSERACT:
-                logger.info("[OCR] Tesseract available but not needed - PDF has sufficient text (machine-readable)")
-            else:
-                logger.debug("[OCR] OCR check: PDF has sufficient text, Tesseract not installed")
-    
-    if not pages or _needs_ocr(pages):
+    # _needs_ocr returns True for an empty page list, so one call covers both cases
+    needs_ocr_check = _needs_ocr(pages)
+    if not needs_ocr_check:
+        # Log that OCR was checked but not needed (for visibility)
+        if _HAVE_TESSERACT:
+            logger.info("[OCR] Tesseract available but not needed - PDF has sufficient text (machine-readable)")
+        else:
+            logger.debug("[OCR] OCR check: PDF has sufficient text, Tesseract not installed")
+    
+    if needs_ocr_check:
         if _HAVE_TESSERACT and _HAVE_MUPDF:
             logger.info("[OCR] Text extraction insufficient or failed. Attempting Tesseract OCR...")
             try:
-                pages, meta_dict, pages_with_coords = _extract_with_ocr(path)
+                if has_page_text_layer:
+                    # Only rasterize and OCR the pages whose text layer is (nearly) empty;
+                    # pages that already have text keep it along with their coordinates
+                    low_text_pages = [
+                        page_num for page_num, page in enumerate(pages)
+                        if len(page.strip()) < OCR_MIN_CHARS_PER_PAGE
+                    ]
+                    ocr_pages, _, ocr_coords = _extract_with_ocr(
+                        path, max_pages=max_pages, page_numbers=low_text_pages, dpi=ocr_dpi
+                    )
+                    for page_num in low_text_pages:
+                        pages[page_num] = ocr_pages[page_num]
+                        if include_coords:
+                            pages_with_coords[page_num] = ocr_coords[page_num]
+                else:
+                    pages, meta_dict, pages_with_coords = _extract_with_ocr(
+                        path, max_pages=max_pages, dpi=ocr_dpi
+                    )
                 logger.info("[OCR] Tesseract OCR extraction completed successfully")
             except Exception as e:
                 logger.error(f"[OCR] Tesseract OCR extraction failed: {e}")
@@ -1396,20 +2288,12 @@ def extract_pdf(path: str) -> Tuple[List[str], PDFMetadata, List[Dict[str, Any]]
     if not pages:
         raise RuntimeError(f"Could not extract text from PDF. Last error: {last_err}")
 
+    if not include_coords:
+        pages_with_coords = []  # the OCR and pdfminer/PyPDF2 fallbacks always build them
+
     # Normalize pages
     pages = [_normalize_text(p) for p in pages]
-    meta = PDFMetadata(
-        title=meta_dict.get("title"),
-        authors=meta_dict.get("authors"),
-        subject=meta_dict.get("subject"),
-        creator=meta_dict.get("creator"),
-        producer=meta_dict.get("producer"),
-        creation_date=meta_dict.get("creation_date"),
-        modification_date=meta_dict.get("modification_date"),
-        file_size_bytes=size,
-        sha256=sha,
-    )
-    return pages, meta, pages_with_coords
+    return pages, meta_dict, pages_with_coords
 
 
 # -----------------------------
@@ -1428,17 +2312,47 @@ class ParsePDFTool(BaseTool):
         {
           "metadata": {...},
           "num_pages": int,
+          "pages": ["page 1 text", ...],  # only if include_pages=True
           "text": "full normalized text",
           "sections": [
-              {"name": str, "start_char": int, "end_char": int, "text": str}, ...
+              {"name": str, "start_char": int, "end_char": int}, ...  # + "text" if include_section_text
           ],
-          "chunks": ["...", "..."],
+          "chunks": ["...", "..."],  # or "chunk_bounds": [{"start_char", "end_char"}, ...] if not include_chunk_text
           "dois": ["10.1234/abcd..."],
           "urls": ["https://..."],
           "figure_table_cues": ["Figure 1: ...", "Table 2. ..."]
         }
+
+    The dict is a LazyResultDict: everything derived from the text (sections,
+    chunks, DOIs, URLs, citations, cues) is computed on first access.
+
+    With use_cache, the most recent parses are also kept in memory, keyed by
+    content hash and parse options, so re-invoking the tool on the same paper
+    (retries, several questions about one upload) skips extraction and reuses
+    anything already derived from the text.
     """
 
+    # Parses kept in memory per tool instance (see _parsed_cache)
+    PARSED_CACHE_SIZE = 32
+
+    def __init__(self):
+        super().__init__()
+        self.result_cache = None
+        # key -> (pages, meta, pages_with_coords, ParsedPDF), least recently used first
+        self._parsed_cache: "OrderedDict[tuple, Tuple[List[str], PDFMetadata, List[Dict[str, Any]], ParsedPDF]]" = OrderedDict()
+        self._parsed_cache_lock = threading.Lock()
+
+    def _get_result_cache(self):
+        """Get the extraction result cache, initializing it lazily (None if unavailable)."""
+        if self.result_cache is None and _HAVE_RESULT_CACHE:
+            try:
+                self.result_cache = ToolResultCache(
+                    db_path=EXTRACTION_CACHE_PATH, max_entries_per_tool=EXTRACTION_CACHE_MAX_ENTRIES
+                )
+            except Exception as e:
+                logger.warning(f"Extraction cache unavailable, parsing without it: {e}")
+        return self.result_cache
+
     def _get_metadata(self) -> ToolMetadata:
         """Return the metadata for this tool."""
         return ToolMetadata(
@@ -1446,7 +2360,7 @@ class ParsePDFTool(BaseTool):
             description="Extracts text, sections, and metadata from a PDF, returning analysis-ready chunks.",
             parameters={
                 "required": ["file_path"],
-                "optional": ["chunk_chars", "overlap", "max_pages"],
+                "optional": ["chunk_chars", "overlap", "max_pages", "include_section_text", "include_chunk_text", "include_pages", "include_coords", "include_sections", "include_references", "include_methodology", "use_cache"],
                 "properties": {
                     "file_path": {
                         "type": "string",
@@ -1470,6 +2384,46 @@ class ParsePDFTool(BaseTool):
                 "type": "boolean",
                 "description": "Enable layout analysis for semantic role identification (default: True)",
                 "default": True
+            },
+            "include_section_text": {
+                "type": "boolean",
+                "description": "Include each section's text in addition to its character offsets (default: False)",
+                "default": False
+            },
+            "include_chunk_text": {
+                "type": "boolean",
+                "description": "Return chunks as text; otherwise only their character offsets as chunk_bounds (default: True)",
+                "default": True
+            },
+            "include_pages": {
+                "type": "boolean",
+                "description": "Include the per-page text list in the result (default: False)",
+                "default": False
+            },
+            "include_coords": {
+                "type": "boolean",
+                "description": "Extract text block coordinates for evidence highlighting (default: True)",
+                "default": True
+            },
+            "include_sections": {
+                "type": "boolean",
+                "description": "Include the detected sections in the result (default: True)",
+                "default": True
+            },
+            "include_references": {
+                "type": "boolean",
+                "description": "Include the references section and parsed citations in the result (default: True)",
+                "default": True
+            },
+            "include_methodology": {
+                "type": "boolean",
+                "description": "Include the extracted methodology context in the result (default: True)",
+                "default": True
+            },
+            "use_cache": {
+                "type": "boolean",
+                "description": "Reuse extraction results for identical PDF content (default: True)",
+                "default": True
             }
                 }
             },
@@ -1488,6 +2442,14 @@ class ParsePDFTool(BaseTool):
         overlap: int = 200,
         max_pages: Optional[int] = None,
         enable_layout_analysis: bool = True,
+        include_section_text: bool = False,
+        include_chunk_text: bool = True,
+        include_pages: bool = False,
+        include_coords: bool = True,
+        include_sections: bool = True,
+        include_references: bool = True,
+        include_methodology: bool = True,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
         """
         Parse a PDF and return structured content for downstream LLM agents.
@@ -1497,6 +2459,26 @@ class ParsePDFTool(BaseTool):
             chunk_chars: Target characters per chunk (for LLM-friendly splitting).
             overlap: Overlap characters between chunks.
             max_pages: If set, limit extraction to the first N pages.
+            include_section_text: Also emit each section's text (otherwise only
+                start_char/end_char offsets into "text" are returned; see section_text).
+            include_chunk_text: Emit "chunks" as strings. When False, "chunk_bounds"
+                (start_char/end_char offsets into "text") is emitted instead, so the
+                result holds no second copy of the text; see chunk_text.
+            include_pages: Also emit the per-page text list under "pages" (needed
+                for page-level evidence collection; otherwise only "text" is kept).
+            include_coords: Extract text blocks with bounding boxes into
+                "pages_with_coords" (evidence highlighting, layout analysis). When
+                False, "pages_with_coords" is empty and extraction is cheaper.
+            include_sections: Emit "sections". Off, the key is omitted.
+            include_references: Emit "references_section", "citations" and
+                "num_citations". Off, the keys are omitted.
+            include_methodology: Emit "methodology_context". Off, the key is omitted.
+                Omitted keys are never computed, not even when the result is
+                serialized; callers needing only text/chunks can turn all three off.
+            use_cache: Reuse cached extraction results for a file with the same
+                content hash instead of re-extracting (and re-OCRing) it. Repeat
+                calls in this process return results that share their lists with
+                the earlier ones; don't mutate them.
 
         Returns:
             Dict with metadata, text, sections, chunks, dois, urls, figure/table cues.
@@ -1505,107 +2487,148 @@ class ParsePDFTool(BaseTool):
             raise ValueError("file_path must be a path to a .pdf file")
 
         logger.info("Parsing PDF: %s", file_path)
-        pages, meta, pages_with_coords = extract_pdf(file_path)
-
-        if max_pages is not None and max_pages > 0:
-            pages = pages[:max_pages]
-            pages_with_coords = pages_with_coords[:max_pages]
-
-        # S-FR1: Layout Analysis - Add semantic roles to text blocks
-        if enable_layout_analysis:
-            if _HAVE_LAYOUT_ANALYZER and analyze_document_layout:
-                try:
-                    logger.info("[Layout Analysis] Enabled - Performing semantic role identification")
-                    pages_with_coords = analyze_document_layout(
-                        pages_with_coords=pages_with_coords,
-                        pages_text=pages,
-                        use_ml_models=False  # Set to True if ML models are available
-                    )
-                    logger.info("[Layout Analysis] Successfully completed - semantic roles added to text blocks")
-                except Exception as e:
-                    logger.warning(f"[Layout Analysis] Failed, continuing without semantic roles: {e}")
-                    # Continue without layout analysis - backward compatible
-            else:
-                logger.warning("[Layout Analysis] Enabled but layout_analyzer module not available - skipping")
+        identity = _file_identity(file_path)
+        memo_key = None
+        memo = None
+        if use_cache:
+            memo_key = (
+                identity,
+                max_pages if max_pages is not None and max_pages > 0 else None,
+                enable_layout_analysis and include_coords,
+                include_coords,
+                chunk_chars,
+                overlap,
+                include_section_text,
+            )
+            with self._parsed_cache_lock:
+                memo = self._parsed_cache.get(memo_key)
+                if memo is not None:
+                    self._parsed_cache.move_to_end(memo_key)
+
+        if memo is not None:
+            logger.info("Reusing in-memory parse of %s", os.path.basename(file_path))
+            pages, meta, pages_with_coords, parsed = memo
         else:
-            logger.debug("[Layout Analysis] Disabled - skipping semantic role identification")
-
-        full_text = "\n\n".join(p for p in pages if p)
-        full_text = _normalize_text(full_text)
-
-        # Heuristic sectioning
-        sections = _split_sections(full_text)
+            # S-FR1: Layout Analysis (semantic roles on text blocks) runs inside
+            # extract_pdf so its output is cached together with the extraction
+            pages, meta, pages_with_coords = extract_pdf(
+                file_path,
+                max_pages=max_pages,
+                enable_layout_analysis=enable_layout_analysis,
+                cache=self._get_result_cache() if use_cache else None,
+                include_coords=include_coords,
+                identity=identity,
+            )
 
-        # Extract methodology-focused context for better analysis
-        methodology_context = _extract_methodology_context(sections, full_text)
+            if max_pages is not None and max_pages > 0:
+                pages = pages[:max_pages]
+                pages_with_coords = pages_with_coords[:max_pages]
 
-        # Chunking
-        chunks = _chunk_text(full_text, target_chars=chunk_chars, overlap=overlap)
+            # Sectioning, chunking, references and cues are computed on first access
+            parsed = ParsedPDF(
+                text=_join_pages(pages),
+                chunk_chars=chunk_chars,
+                overlap=overlap,
+                include_section_text=include_section_text,
+            )
 
-        # References
-        dois = sorted(set(m.group(1) for m in DOI_REGEX.finditer(full_text)))
-        urls = sorted(set(URL_REGEX.findall(full_text)))
-        
-        # Extract citations from references section
-        references_section = _extract_references_section(full_text, sections)
-        citations = []
-        if references_section:
-            citations = _extract_citations(references_section)
-            logger.info(f"Extracted {len(citations)} citations from references section")
+            if memo_key is not None:
+                with self._parsed_cache_lock:
+                    self._parsed_cache[memo_key] = (pages, meta, pages_with_coords, parsed)
+                    while len(self._parsed_cache) > self.PARSED_CACHE_SIZE:
+                        self._parsed_cache.popitem(last=False)
+
+        full_text = parsed.text
+
+        lazy: Dict[str, Callable[[], Any]] = {}
+        if include_methodology:
+            lazy["methodology_context"] = lambda: parsed.methodology_context  # Focused methodology extraction
+        if include_sections:
+            lazy["sections"] = lambda: parsed.section_dicts
+        if include_chunk_text:
+            lazy["chunks"] = lambda: parsed.chunks
         else:
-            logger.warning("Could not find references section in PDF")
-
-        # Figures/Tables cues
-        figtab = _extract_fig_table_cues(full_text)
-
-        result: Dict[str, Any] = {
-            "success": True,
-            "metadata": {
-                "title": meta.title,
-                "authors": meta.authors,
-                "subject": meta.subject,
-                "creator": meta.creator,
-                "producer": meta.producer,
-                "creation_date": meta.creation_date,
-                "modification_date": meta.modification_date,
-                "file_size_bytes": meta.file_size_bytes,
-                "sha256": meta.sha256,
-                "source_path": os.path.abspath(file_path),
+            lazy["chunk_bounds"] = lambda: [
+                {"start_char": start, "end_char": end} for start, end in parsed.chunk_bounds
+            ]
+        lazy["dois"] = lambda: parsed.dois
+        lazy["urls"] = lambda: parsed.urls
+        if include_references:
+            lazy["citations"] = lambda: parsed.citations  # Extracted citations
+            lazy["references_section"] = lambda: parsed.references_section or None  # Full references text
+            lazy["num_citations"] = lambda: len(parsed.citation_entries)  # Count of extracted citations
+        lazy["figure_table_cues"] = lambda: parsed.figure_table_cues
+
+        result: Dict[str, Any] = LazyResultDict(
+            {
+                "success": True,
+                "metadata": {
+                    "title": meta.title,
+                    "authors": meta.authors,
+                    "subject": meta.subject,
+                    "creator": meta.creator,
+                    "producer": meta.producer,
+                    "creation_date": meta.creation_date,
+                    "modification_date": meta.modification_date,
+                    "file_size_bytes": meta.file_size_bytes,
+                    "sha256": meta.sha256,
+                    "content_id": meta.content_id,
+                    "source_path": os.path.abspath(file_path),
+                },
+                "num_pages": len(pages),
+                **({"pages": pages} if include_pages else {}),  # Per-page text for evidence collection
+                "pages_with_coords": pages_with_coords,  # Include coordinate data for evidence highlighting
+                "text": full_text,
+                "tool_used": "parse_pdf",
             },
-            "num_pages": len(pages),
-            "pages": pages,  # Include pages for evidence collection
-            "pages_with_coords": pages_with_coords,  # Include coordinate data for evidence highlighting
-            "text": full_text,
-            "methodology_context": methodology_context,  # NEW: Focused methodology extraction
-            "sections": [
-                {
-                    "name": s.name,
-                    "start_char": s.start_char,
-                    "end_char": s.end_char,
-                    "text": s.text,
-                }
-                for s in sections
-            ],
-            "chunks": chunks,
-            "dois": dois,
-            "urls": urls,
-            "citations": citations,  # NEW: Extracted citations
-            "references_section": references_section if references_section else None,  # NEW: Full references text
-            "num_citations": len(citations),  # NEW: Count of extracted citations
-            "figure_table_cues": figtab,
-            "tool_used": "parse_pdf"
-        }
+            lazy=lazy,
+        )
 
         logger.info(
-            "Parsed PDF '%s' — pages=%d, sections=%d, chunks=%d",
+            "Parsed PDF '%s' — pages=%d, chars=%d",
             os.path.basename(file_path),
             result["num_pages"],
-            len(result["sections"]),
-            len(result["chunks"]),
+            len(full_text),
         )
 
         return result
 
+    @classmethod
+    def run_batch(
+        cls,
+        paths: List[str],
+        workers: Optional[int] = None,
+        **kwargs: Any,
+    ) -> Iterator[Tuple[str, Dict[str, Any]]]:
+        """
+        Parse many PDFs in parallel, one file per worker process.
+
+        Yields (path, result) in completion order (not input order) so callers can
+        consume results as they finish instead of holding them all in memory.
+        A file that fails yields {"success": False, "error": ...} rather than
+        aborting the batch. Extra kwargs are passed to execute() for every file.
+
+        Args:
+            paths: PDF file paths.
+            workers: Worker processes (default: min(cpu_count, 4)).
+        """
+        if not paths:
+            return
+        if workers is None:
+            workers = min(os.cpu_count() or 1, 4)
+        workers = max(1, min(workers, len(paths)))
+        jobs = [(path, kwargs) for path in paths]
+
+        if workers == 1:
+            yield from map(_parse_one_pdf, jobs)
+            return
+
+        # fork shares the compiled module-level regexes copy-on-write; other
+        # platforms spawn and recompile them on import
+        ctx = multiprocessing.get_context("fork" if sys.platform.startswith("linux") else None)
+        with ctx.Pool(processes=workers) as pool:
+            yield from pool.imap_unordered(_parse_one_pdf, jobs, chunksize=2)
+
     # Optional async hook for agent frameworks that support async tools
     async def arun(  # type: ignore
         self,
@@ -1613,16 +2636,51 @@ class ParsePDFTool(BaseTool):
         chunk_chars: int = 4000,
         overlap: int = 200,
         max_pages: Optional[int] = None,
+        enable_layout_analysis: bool = True,
+        include_section_text: bool = False,
+        include_chunk_text: bool = True,
+        include_pages: bool = False,
+        include_coords: bool = True,
+        include_sections: bool = True,
+        include_references: bool = True,
+        include_methodology: bool = True,
+        use_cache: bool = True,
     ) -> Dict[str, Any]:
-        # Simple passthrough to sync .execute() to keep behavior identical
-        return self.execute(
+        # Run the blocking parse in a worker thread so it does not block the event loop
+        # outright. The parse itself still holds the GIL (PyMuPDF does not release it in
+        # get_text), so other Python work is slowed while it runs. A single fitz.Document
+        # is not thread-safe, so the parse is not fanned out across pages here.
+        return await asyncio.to_thread(
+            self.execute,
             file_path=file_path,
             chunk_chars=chunk_chars,
             overlap=overlap,
             max_pages=max_pages,
+            enable_layout_analysis=enable_layout_analysis,
+            include_section_text=include_section_text,
+            include_chunk_text=include_chunk_text,
+            include_pages=include_pages,
+            include_coords=include_coords,
+            include_sections=include_sections,
+            include_references=include_references,
+            include_methodology=include_methodology,
+            use_cache=use_cache,
         )
 
 
+def _parse_one_pdf(job: Tuple[str, Dict[str, Any]]) -> Tuple[str, Dict[str, Any]]:
+    """
+    Worker for ParsePDFTool.run_batch (module-level so it can be pickled).
+    Returns a plain, fully materialized dict so it can be sent back to the parent.
+    """
+    path, kwargs = job
+    try:
+        return path, dict(ParsePDFTool().execute(file_path=path, **kwargs))
+    except Exception as e:
+        logger.error(f"Batch PDF parsing failed for {path}: {e}")
+        return path, {"success": False, "error": str(e), "tool_used": "parse_pdf"}
+
+
 # -----------------------------
 # CLI for quick manual testing
 # -----------------------------
@@ -1637,6 +2695,7 @@ if __name__ == "__main__":
     parser.add_argument("--overlap", type=int, default=200)
     parser.add_argument("--max-pages", type=int, default=0, help="0 means no limit")
     parser.add_argument("--out", type=str, default="", help="Optional JSON output path")
+    parser.add_argument("--include-pages", action="store_true", help="Include per-page text in --out JSON")
     args = parser.parse_args()
 
     tool = ParsePDFTool()
@@ -1645,11 +2704,19 @@ if __name__ == "__main__":
         chunk_chars=args.chunk_chars,
         overlap=args.overlap,
         max_pages=args.max_pages if args.max_pages > 0 else None,
+        include_pages=bool(args.out) and args.include_pages,
+        include_coords=bool(args.out),  # the console preview never shows coordinates
     )
 
     if args.out:
-        with open(args.out, "w", encoding="utf-8") as f:
-            json.dump(out, f, ensure_ascii=False, indent=2)
+        if _HAVE_ORJSON:
+            # orjson reads dicts directly, so materialize the LazyResultDict first;
+            # it writes UTF-8 unescaped, like ensure_ascii=False
+            with open(args.out, "wb") as f:
+                f.write(orjson.dumps(dict(out), option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(args.out, "w", encoding="utf-8") as f:
+                json.dump(out, f, ensure_ascii=False, indent=2)
         print(f"Wrote: {args.out}")
     else:
         # Print just the metadata + first 500 chars to avoid console spam
@@ -1660,4 +2727,7 @@ if __name__ == "__main__":
             "chunks": len(out["chunks"]),
             "text_preview": out["text"][:500] + ("..." if len(out["text"]) > 500 else ""),
         }
-        print(json.dumps(preview, ensure_ascii=False, indent=2))
+        if _HAVE_ORJSON:
+            print(orjson.dumps(preview, option=orjson.OPT_INDENT_2).decode("utf-8"))
+        else:
+            print(json.dumps(preview, ensure_ascii=False, indent=2))
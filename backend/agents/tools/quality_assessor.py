@@ -6,12 +6,67 @@ based on all other analysis results. The scoring must be reproducible and
 based on specific criteria.
 """
 
+import bisect
 import logging
-from typing import Dict, Any, Optional, List
+from types import MappingProxyType
+from typing import Dict, Any, Optional, List, Mapping, Tuple
 from .base_tool import BaseTool, ToolMetadata
 
 logger = logging.getLogger(__name__)
 
+# Default weight factors for quality dimensions (read-only, shared by all calls)
+_DEFAULT_WEIGHTS: Mapping[str, float] = MappingProxyType({
+    "methodology": 0.25,      # Study design and methodology quality
+    "statistics": 0.20,       # Statistical validity and rigor
+    "bias": 0.20,             # Bias detection and limitations
+    "reproducibility": 0.15,   # Reproducibility and transparency
+    "novelty": 0.10,          # Research novelty and contribution
+    "presentation": 0.10      # Clarity and presentation quality
+})
+
+_SCORING_CRITERIA: Tuple[str, ...] = (
+    "Methodology Quality (25%): Study design, sample size, data collection methods, validity",
+    "Statistical Quality (20%): Method appropriateness, assumptions, effect sizes, confidence intervals",
+    "Bias Assessment (20%): Selection bias, measurement bias, confounding, publication bias",
+    "Reproducibility (15%): Data availability, code availability, methodology transparency",
+    "Novelty/Contribution (10%): Research gaps, key findings, innovation",
+    "Presentation Quality (10%): Clarity, citation quality, recent sources"
+)
+
+# Shared read-only default for missing sub-results, so lookups such as
+# data.get("validity", _NO_DATA).get(...) don't build a throwaway dict each time
+_NO_DATA: Mapping[str, Any] = MappingProxyType({})
+
+# Quality dimensions in report order: (dimension, scorer method, analysis_results
+# keys whose results are passed to the scorer)
+_QUALITY_DIMENSIONS = (
+    ("methodology", "_score_methodology", ("methodology",)),
+    ("statistics", "_score_statistics", ("statistics",)),
+    ("bias", "_score_bias", ("bias_detection",)),  # Inverted - lower bias = higher score
+    ("reproducibility", "_score_reproducibility", ("reproducibility",)),
+    ("novelty", "_score_novelty", ("research_gaps", "summary")),
+    ("presentation", "_score_presentation", ("summary", "citations")),
+)
+
+# Recommendation for each dimension scoring below _RECOMMENDATION_THRESHOLD
+_DIMENSION_RECOMMENDATIONS = {
+    "methodology": "Improve study design and methodology description",
+    "statistics": "Enhance statistical analysis and reporting",
+    "bias": "Address identified biases and limitations",
+    "reproducibility": "Improve data and code availability for reproducibility",
+}
+_RECOMMENDATION_THRESHOLD = 60
+
+# Confidence level by score: below 40 "Very Low", 40-54.x "Low", ..., 85+ "Very High"
+_CONFIDENCE_THRESHOLDS = (40, 55, 70, 85)
+_CONFIDENCE_LEVELS = ("Very Low", "Low", "Medium", "High", "Very High")
+
+# Score penalty per detected bias, by severity; high-severity critical bias types
+# cost an extra _CRITICAL_BIAS_PENALTY
+_BIAS_SEVERITY_PENALTY = {"high": 20.0, "medium": 10.0, "low": 5.0}
+_CRITICAL_BIAS_TYPES = frozenset({"selection_bias", "confounding_bias", "publication_bias"})
+_CRITICAL_BIAS_PENALTY = 15.0
+
 
 class QualityAssessorTool(BaseTool):
     """
@@ -67,18 +122,8 @@ class QualityAssessorTool(BaseTool):
         try:
             logger.info("Assessing overall paper quality with numerical scoring")
             
-            # Default weight factors for quality dimensions
-            default_weights = {
-                "methodology": 0.25,      # Study design and methodology quality
-                "statistics": 0.20,       # Statistical validity and rigor
-                "bias": 0.20,             # Bias detection and limitations
-                "reproducibility": 0.15,   # Reproducibility and transparency
-                "novelty": 0.10,          # Research novelty and contribution
-                "presentation": 0.10      # Clarity and presentation quality
-            }
-            
             # Use provided weights or defaults
-            weights = weight_factors if weight_factors else default_weights
+            weights = weight_factors if weight_factors else _DEFAULT_WEIGHTS
             
             # Calculate quality scores for each dimension
             quality_scores = self._calculate_quality_dimensions(analysis_results, weights)
@@ -123,58 +168,38 @@ class QualityAssessorTool(BaseTool):
                 "tool_used": "quality_assessor_tool"
             }
     
-    def _calculate_quality_dimensions(self, analysis_results: Dict[str, Any], weights: Dict[str, float]) -> Dict[str, Any]:
-        """Calculate quality scores for each dimension."""
-        scores = {}
-        
-        # Methodology Quality (0-100)
-        methodology_score = self._score_methodology(analysis_results.get("methodology", {}))
-        scores["methodology"] = {
-            "score": methodology_score,
-            "weight": weights["methodology"],
-            "weighted_score": methodology_score * weights["methodology"]
-        }
-        
-        # Statistical Quality (0-100)
-        statistics_score = self._score_statistics(analysis_results.get("statistics", {}))
-        scores["statistics"] = {
-            "score": statistics_score,
-            "weight": weights["statistics"],
-            "weighted_score": statistics_score * weights["statistics"]
-        }
-        
-        # Bias Assessment (0-100, inverted - lower bias = higher score)
-        bias_score = self._score_bias(analysis_results.get("bias_detection", {}))
-        scores["bias"] = {
-            "score": bias_score,
-            "weight": weights["bias"],
-            "weighted_score": bias_score * weights["bias"]
-        }
-        
-        # Reproducibility (0-100)
-        reproducibility_score = self._score_reproducibility(analysis_results.get("reproducibility", {}))
-        scores["reproducibility"] = {
-            "score": reproducibility_score,
-            "weight": weights["reproducibility"],
-            "weighted_score": reproducibility_score * weights["reproducibility"]
-        }
-        
-        # Novelty/Contribution (0-100)
-        novelty_score = self._score_novelty(analysis_results.get("research_gaps", {}), analysis_results.get("summary", {}))
-        scores["novelty"] = {
-            "score": novelty_score,
-            "weight": weights["novelty"],
-            "weighted_score": novelty_score * weights["novelty"]
-        }
-        
-        # Presentation Quality (0-100)
-        presentation_score = self._score_presentation(analysis_results.get("summary", {}), analysis_results.get("citations", {}))
-        scores["presentation"] = {
-            "score": presentation_score,
-            "weight": weights["presentation"],
-            "weighted_score": presentation_score * weights["presentation"]
-        }
+    def batch_execute(self, batch: List[Dict[str, Any]], scoring_criteria: Optional[List[str]] = None,
+                      weight_factors: Optional[Dict[str, float]] = None) -> List[Dict[str, Any]]:
+        """
+        Assess several papers with the same criteria and weights.
         
+        Args:
+            batch: One analysis_results dict per paper
+            scoring_criteria: Specific criteria to use for scoring
+            weight_factors: Weight factors for different quality dimensions
+            
+        Returns:
+            One execute() result per paper, in input order; a paper that fails
+            gets its own {"success": False, ...} entry without stopping the batch
+        """
+        logger.info(f"Assessing quality of {len(batch)} papers")
+        return [
+            self.execute(analysis_results, scoring_criteria=scoring_criteria, weight_factors=weight_factors)
+            for analysis_results in batch
+        ]
+    
+    def _calculate_quality_dimensions(self, analysis_results: Dict[str, Any], weights: Mapping[str, float]) -> Dict[str, Any]:
+        """Calculate quality scores (0-100) for each dimension in _QUALITY_DIMENSIONS."""
+        scores = {}
+        for dimension, scorer_name, result_keys in _QUALITY_DIMENSIONS:
+            scorer = getattr(self, scorer_name)
+            score = scorer(*(analysis_results.get(key, _NO_DATA) for key in result_keys))
+            weight = weights[dimension]
+            scores[dimension] = {
+                "score": score,
+                "weight": weight,
+                "weighted_score": score * weight
+            }
         return scores
     
     def _score_methodology(self, methodology_data: Dict[str, Any]) -> float:
@@ -192,32 +217,32 @@ class QualityAssessorTool(BaseTool):
         score = 50.0  # Base score
         
         # Study design quality
-        study_design = methodology_data.get("study_design", {})
+        study_design = methodology_data.get("study_design", _NO_DATA)
         if study_design.get("design_type") in ["randomized_controlled_trial", "quasi_experimental"]:
             score += 20.0
         elif study_design.get("design_type") in ["observational", "case_study"]:
             score += 10.0
         
         # Sample size adequacy
-        sample_info = methodology_data.get("sample_characteristics", {})
+        sample_info = methodology_data.get("sample_characteristics", _NO_DATA)
         if sample_info.get("sample_size_justification") == "adequate":
             score += 15.0
         elif sample_info.get("sample_size_justification") == "partially_adequate":
             score += 8.0
         
         # Data collection methods
-        data_collection = methodology_data.get("data_collection", {})
+        data_collection = methodology_data.get("data_collection", _NO_DATA)
         if data_collection.get("methods_clearly_described"):
             score += 10.0
         
         # Validity considerations
-        validity = methodology_data.get("validity", {})
+        validity = methodology_data.get("validity", _NO_DATA)
         if validity.get("internal_validity") == "high":
             score += 5.0
         if validity.get("external_validity") == "high":
             score += 5.0
         
-        return min(100.0, max(0.0, score))
+        return 0.0 if score < 0.0 else 100.0 if score > 100.0 else score  # Clamp to 0-100 without min()/max() calls
     
     def _score_statistics(self, statistics_data: Dict[str, Any]) -> float:
         """Score statistical quality (0-100)."""
@@ -227,20 +252,20 @@ class QualityAssessorTool(BaseTool):
         score = 40.0  # Base score
         
         # Statistical methods appropriateness
-        methods = statistics_data.get("statistical_methods", {})
+        methods = statistics_data.get("statistical_methods", _NO_DATA)
         if methods.get("methods_appropriate"):
             score += 20.0
         if methods.get("assumptions_checked"):
             score += 15.0
         
         # Effect sizes and confidence intervals
-        results = statistics_data.get("statistical_results", {})
+        results = statistics_data.get("statistical_results", _NO_DATA)
         if results.get("effect_sizes_provided"):
             score += 15.0
         if results.get("confidence_intervals_provided"):
             score += 10.0
         
-        return min(100.0, max(0.0, score))
+        return 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
     
     def _score_bias(self, bias_data: Dict[str, Any]) -> float:
         """Score bias assessment (0-100, inverted - lower bias = higher score)."""
@@ -249,24 +274,15 @@ class QualityAssessorTool(BaseTool):
         
         score = 80.0  # Start with high score
         
-        # Reduce score based on detected biases
-        detected_biases = bias_data.get("detected_biases", [])
-        for bias in detected_biases:
+        # Reduce score based on detected biases, with an additional penalty for
+        # high-severity critical bias types
+        for bias in bias_data.get("detected_biases", []):
             severity = bias.get("severity", "medium")
-            if severity == "high":
-                score -= 20.0
-            elif severity == "medium":
-                score -= 10.0
-            elif severity == "low":
-                score -= 5.0
-        
-        # Additional penalty for critical bias types
-        critical_biases = ["selection_bias", "confounding_bias", "publication_bias"]
-        for bias in detected_biases:
-            if bias.get("bias_type") in critical_biases and bias.get("severity") == "high":
-                score -= 15.0
-        
-        return min(100.0, max(0.0, score))
+            score -= _BIAS_SEVERITY_PENALTY.get(severity, 0.0)
+            if severity == "high" and bias.get("bias_type") in _CRITICAL_BIAS_TYPES:
+                score -= _CRITICAL_BIAS_PENALTY
+        
+        return 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
     
     def _score_reproducibility(self, reproducibility_data: Dict[str, Any]) -> float:
         """Score reproducibility (0-100)."""
@@ -276,27 +292,27 @@ class QualityAssessorTool(BaseTool):
         score = 50.0  # Base score
         
         # Data availability
-        data_availability = reproducibility_data.get("data_availability", {})
+        data_availability = reproducibility_data.get("data_availability", _NO_DATA)
         if data_availability.get("data_publicly_available"):
             score += 20.0
         if data_availability.get("code_available"):
             score += 15.0
         
         # Methodology transparency
-        methodology = reproducibility_data.get("methodology_transparency", {})
+        methodology = reproducibility_data.get("methodology_transparency", _NO_DATA)
         if methodology.get("methods_clearly_described"):
             score += 10.0
         if methodology.get("parameters_specified"):
             score += 10.0
         
         # Reproducibility assessment
-        assessment = reproducibility_data.get("reproducibility_assessment", {})
+        assessment = reproducibility_data.get("reproducibility_assessment", _NO_DATA)
         if assessment.get("reproducibility_score") == "high":
             score += 15.0
         elif assessment.get("reproducibility_score") == "medium":
             score += 8.0
         
-        return min(100.0, max(0.0, score))
+        return 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
     
     def _score_novelty(self, research_gaps_data: Dict[str, Any], summary_data: Dict[str, Any]) -> float:
         """Score novelty and contribution (0-100)."""
@@ -316,7 +332,7 @@ class QualityAssessorTool(BaseTool):
             if summary_data.get("novelty_mentioned"):
                 score += 15.0
         
-        return min(100.0, max(0.0, score))
+        return 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
     
     def _score_presentation(self, summary_data: Dict[str, Any], citations_data: Dict[str, Any]) -> float:
         """Score presentation quality (0-100)."""
@@ -331,15 +347,15 @@ class QualityAssessorTool(BaseTool):
         
         # Citation quality
         if citations_data and citations_data.get("success"):
-            citation_quality = citations_data.get("citation_quality", {})
+            citation_quality = citations_data.get("citation_quality", _NO_DATA)
             if citation_quality.get("recent_citations_ratio", 0) > 0.3:  # 30% recent citations
                 score += 15.0
             if citation_quality.get("high_impact_sources_ratio", 0) > 0.5:  # 50% high-impact sources
                 score += 15.0
         
-        return min(100.0, max(0.0, score))
+        return 0.0 if score < 0.0 else 100.0 if score > 100.0 else score
     
-    def _calculate_overall_score(self, quality_scores: Dict[str, Any], weights: Dict[str, float]) -> float:
+    def _calculate_overall_score(self, quality_scores: Dict[str, Any], weights: Mapping[str, float]) -> float:
         """Calculate overall weighted quality score."""
         total_weighted_score = sum(dim["weighted_score"] for dim in quality_scores.values())
         total_weight = sum(weights.values())
@@ -356,34 +372,19 @@ class QualityAssessorTool(BaseTool):
         weaknesses = []
         recommendations = []
         
-        # Analyze strengths and weaknesses
+        # Analyze strengths and weaknesses and generate recommendations in one pass
+        # (dimensions are in _QUALITY_DIMENSIONS order, so recommendations are too)
         for dimension, scores in quality_scores.items():
-            if scores["score"] >= 80:
-                strengths.append(f"Excellent {dimension} quality (score: {scores['score']:.1f})")
-            elif scores["score"] <= 40:
-                weaknesses.append(f"Poor {dimension} quality (score: {scores['score']:.1f})")
-        
-        # Generate recommendations
-        if quality_scores["methodology"]["score"] < 60:
-            recommendations.append("Improve study design and methodology description")
-        if quality_scores["statistics"]["score"] < 60:
-            recommendations.append("Enhance statistical analysis and reporting")
-        if quality_scores["bias"]["score"] < 60:
-            recommendations.append("Address identified biases and limitations")
-        if quality_scores["reproducibility"]["score"] < 60:
-            recommendations.append("Improve data and code availability for reproducibility")
-        
-        # Determine confidence level
-        if overall_score >= 85:
-            confidence_level = "Very High"
-        elif overall_score >= 70:
-            confidence_level = "High"
-        elif overall_score >= 55:
-            confidence_level = "Medium"
-        elif overall_score >= 40:
-            confidence_level = "Low"
-        else:
-            confidence_level = "Very Low"
+            score = scores["score"]
+            if score >= 80:
+                strengths.append(f"Excellent {dimension} quality (score: {score:.1f})")
+            elif score <= 40:
+                weaknesses.append(f"Poor {dimension} quality (score: {score:.1f})")
+            if score < _RECOMMENDATION_THRESHOLD and dimension in _DIMENSION_RECOMMENDATIONS:
+                recommendations.append(_DIMENSION_RECOMMENDATIONS[dimension])
+        
+        # Determine confidence level (a score equal to a threshold takes the higher level)
+        confidence_level = _CONFIDENCE_LEVELS[bisect.bisect_right(_CONFIDENCE_THRESHOLDS, overall_score)]
         
         return {
             "strengths": strengths,
@@ -394,12 +395,5 @@ class QualityAssessorTool(BaseTool):
         }
     
     def _get_scoring_criteria(self) -> List[str]:
-        """Return the scoring criteria used."""
-        return [
-            "Methodology Quality (25%): Study design, sample size, data collection methods, validity",
-            "Statistical Quality (20%): Method appropriateness, assumptions, effect sizes, confidence intervals",
-            "Bias Assessment (20%): Selection bias, measurement bias, confounding, publication bias",
-            "Reproducibility (15%): Data availability, code availability, methodology transparency",
-            "Novelty/Contribution (10%): Research gaps, key findings, innovation",
-            "Presentation Quality (10%): Clarity, citation quality, recent sources"
-        ]
+        """Return the scoring criteria used (a fresh list; it goes into the result)."""
+        return list(_SCORING_CRITERIA)
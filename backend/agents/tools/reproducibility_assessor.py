@@ -4,22 +4,302 @@ Reproducibility Assessor Tool for QualiLens.
 This tool evaluates the reproducibility of research studies.
 """
 
+from __future__ import annotations
+
+import asyncio
+import copy
 import logging
 import json
+import os
 import re
+import threading
+from concurrent.futures import Future
+from functools import lru_cache
 from typing import Dict, Any, Optional, List
-from .base_tool import BaseTool, ToolMetadata
 
-# Add the project root to the Python path for imports
-import sys
-import os
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+import httpx
 
+# The backend directory is the import root (it is where `agents` itself is imported
+# from), so no sys.path manipulation is needed to reach LLM or the result cache
 from LLM.openai_client import OpenAIClient
+from .base_tool import BaseTool, ToolMetadata
+from ..tool_result_cache import ToolResultCache
+from ..semantic_result_cache import SemanticResultCache
+
+try:
+    import orjson  # pip install orjson
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
+
+try:
+    import tiktoken  # installed with langchain-openai
+    _HAVE_TIKTOKEN = True
+except Exception:
+    _HAVE_TIKTOKEN = False
 
 logger = logging.getLogger(__name__)
 
 
+_JSON_OBJECT_RE = re.compile(r"\{.*\}", re.DOTALL)
+
+
+def _loads_llm_json(llm_response: str) -> Any:
+    """
+    Parse a JSON answer from the LLM, using orjson when it is installed.
+    
+    If the answer has prose or code fences around the JSON object, the outermost
+    {...} span is parsed instead. Raises json.JSONDecodeError when neither parses
+    (orjson.JSONDecodeError is a subclass of it).
+    """
+    def loads(raw: str) -> Any:
+        if _HAVE_ORJSON:
+            return orjson.loads(raw)
+        return json.loads(raw)
+    
+    try:
+        return loads(llm_response)
+    except json.JSONDecodeError:
+        match = _JSON_OBJECT_RE.search(llm_response)
+        if not match or match.group(0) == llm_response:
+            raise
+        return loads(match.group(0))
+
+
+# Model used for every reproducibility assessment call
+_ASSESSMENT_MODEL = "gpt-4o-mini"
+# Bump whenever the assessment prompts (or how their answers are post-processed) change,
+# so cached assessments produced by the old prompts are no longer reused
+_PROMPT_VERSION = 1
+# Leading part of the paper embedded for the near-match cache (QUALILENS_SEMANTIC_CACHE=1)
+_SEMANTIC_CACHE_CHARS = 8000
+# Completion cap for the basic assessment: six short fields, so well under the former
+# 1000; a truncated json_object answer is unparseable, so leave headroom for long lists
+_BASIC_MAX_TOKENS = 600
+
+# Answer format and scoring rules of the basic assessment prompt
+_BASIC_ANSWER_SCHEMA = """{
+  "reproducibility_score": 0.0-1.0,  // Calculate actual score based on content analysis
+  "methodological_detail": "Assessment of methodological detail provided",
+  "data_availability": "Information about data availability",
+  "code_availability": "Information about code availability",
+  "reproducibility_barriers": [
+    "Barrier 1",
+    "Barrier 2"
+  ],
+  "recommendations": [
+    "Recommendation 1",
+    "Recommendation 2"
+  ]
+}"""
+_BASIC_SCORING_GUIDANCE = """IMPORTANT: Calculate the reproducibility_score based on actual content analysis. Consider:
+- Methodological detail provided (0.0-0.3 points)
+- Data availability mentioned (0.0-0.3 points) 
+- Code availability mentioned (0.0-0.2 points)
+- Reproducibility barriers identified (0.0-0.2 points)
+- Provide a realistic score between 0.0 and 1.0 based on the actual content"""
+# Papers short enough to fit the basic excerpt whole can share one prompt, up to this
+# many tokens of paper text per request (the completion gets _BASIC_MAX_TOKENS per paper)
+_PACKED_PROMPT_TOKENS = 12000
+# ...and at most this many papers, so the combined completion cap stays within the
+# model's output limit (16,384 tokens for gpt-4o-mini)
+_PACKED_MAX_PAPERS = 16384 // _BASIC_MAX_TOKENS
+
+# Fields of the basic assessment answer; missing ones get the defaults execute() would use
+_BASIC_ASSESSMENT_DEFAULTS = {
+    "methodological_detail": "",
+    "data_availability": "",
+    "code_availability": "",
+    "reproducibility_barriers": [],
+    "recommendations": []
+}
+
+
+def _parse_basic_assessment(llm_response: str) -> Dict[str, Any]:
+    """
+    Parse and check the basic assessment answer.
+    
+    Raises ValueError when the answer is not a JSON object or has no usable
+    reproducibility_score, so a malformed answer is reported as a parse failure
+    instead of silently scoring 0.0. Numeric strings ("0.6") are accepted.
+    """
+    return _check_basic_assessment(_loads_llm_json(llm_response))
+
+
+def _check_basic_assessment(result: Any) -> Dict[str, Any]:
+    """Check one parsed basic assessment object (see _parse_basic_assessment)."""
+    if not isinstance(result, dict):
+        raise ValueError(f"expected a JSON object, got {type(result).__name__}")
+    
+    score = result.get("reproducibility_score")
+    if isinstance(score, bool) or score is None:
+        raise ValueError(f"invalid reproducibility_score: {score!r}")
+    result["reproducibility_score"] = float(score)  # ValueError/TypeError for non-numbers
+    
+    for field, default in _BASIC_ASSESSMENT_DEFAULTS.items():
+        if not isinstance(result.get(field), type(default)):
+            result[field] = type(default)()
+    return result
+
+
+# Paper excerpt budgets for the LLM prompts, in tokens of the assessment model
+_BASIC_PROMPT_TOKENS = 1500
+_DETAILED_PROMPT_TOKENS = 2000
+# Used when no tokenizer is available; matches the former character limits (6000 / 8000)
+_CHARS_PER_TOKEN = 4
+
+
+@lru_cache(maxsize=None)
+def _get_token_encoder():
+    """Return the tiktoken encoder for the assessment model, or None if it cannot be loaded."""
+    if not _HAVE_TIKTOKEN:
+        return None
+    try:
+        return tiktoken.encoding_for_model(_ASSESSMENT_MODEL)
+    except Exception as e:
+        # The encoding file is downloaded on first use, which fails offline
+        logger.warning(f"tiktoken encoder unavailable, truncating prompts by characters: {str(e)}")
+        return None
+
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Keep the first max_tokens tokens of text for a prompt."""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return text[:max_tokens * _CHARS_PER_TOKEN]
+    
+    # Only the head of the paper can end up in the prompt, so don't tokenize the rest
+    head = text[:max_tokens * _CHARS_PER_TOKEN * 2]
+    tokens = encoder.encode(head, disallowed_special=())
+    if len(tokens) <= max_tokens and len(head) < len(text):
+        tokens = encoder.encode(text, disallowed_special=())
+    if len(tokens) <= max_tokens:
+        return text
+    return encoder.decode(tokens[:max_tokens])
+
+
+def _count_tokens(text: str) -> int:
+    """Count the tokens of text for the assessment model (estimated without a tokenizer)."""
+    encoder = _get_token_encoder()
+    if encoder is None:
+        return -(-len(text) // _CHARS_PER_TOKEN)
+    return len(encoder.encode(text, disallowed_special=()))
+
+
+# One OpenAIClient for every assessor instance, so all assessments (including the
+# concurrent ones from aexecute_many) reuse the same pool of keep-alive connections
+_CLIENT_LOCK = threading.Lock()
+_CLIENT: Optional[OpenAIClient] = None
+# Transient failures (429, 5xx, timeouts, dropped connections) are retried by the SDK
+# with exponential backoff and jitter; one failed call would otherwise fail the assessment
+_LLM_MAX_RETRIES = 5
+
+
+def _get_shared_openai_client() -> OpenAIClient:
+    """Return the shared OpenAIClient, creating it on first use."""
+    global _CLIENT
+    if _CLIENT is None:
+        with _CLIENT_LOCK:
+            if _CLIENT is None:
+                _CLIENT = OpenAIClient(
+                    http_client=httpx.Client(
+                        limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+                    ),
+                    max_retries=_LLM_MAX_RETRIES
+                )
+    return _CLIENT
+
+
+# Assessments currently running, keyed by their inputs, so concurrent identical requests
+# share one LLM assessment (single-flight)
+_INFLIGHT_LOCK = threading.Lock()
+_INFLIGHT: Dict[tuple, Future] = {}
+
+
+def _run_coalesced(key: tuple, assess) -> Dict[str, Any]:
+    """
+    Run assess() unless an identical assessment is already running, in which case
+    wait for it and return a copy of its result.
+    """
+    with _INFLIGHT_LOCK:
+        future = _INFLIGHT.get(key)
+        owner = future is None
+        if owner:
+            future = _INFLIGHT[key] = Future()
+    
+    if not owner:
+        logger.info("⏳ Identical reproducibility assessment in progress, waiting for its result")
+        # A copy, so callers never share (and mutate) the same lists
+        return copy.deepcopy(future.result())
+    
+    try:
+        result = assess()
+        future.set_result(result)
+        return result
+    except BaseException as e:
+        future.set_exception(e)
+        raise
+    finally:
+        with _INFLIGHT_LOCK:
+            del _INFLIGHT[key]
+
+
+# Reproducibility indicator patterns (matched case-insensitively), each paired with a
+# lowercase keyword the pattern cannot match without
+
+# URL patterns for data repositories
+# DOI pattern: doi.org/10.XXXX/YYYY (must have at least one segment after 10.)
+_DATA_REPO_PATTERNS = (
+    (r'https?://(?:www\.)?(?:osf\.io|figshare\.com|zenodo\.org|dryad\.org|dataverse\.harvard\.edu|datacite\.org|datadryad\.org)/[^\s\)\.,;:]+', "http"),
+    (r'doi\.org/10\.\d+[^\s\)\.,;:]+', "doi.org/10."),  # Must have 10. followed by digits and more content
+    (r'https?://(?:dx\.)?doi\.org/10\.\d+[^\s\)\.,;:]+', "doi.org/10."),  # Full DOI URLs
+    (r'data\s+available\s+at\s+(?:https?://)?[^\s\)\.,;:]+', "available"),
+    (r'data\s+deposited\s+at\s+(?:https?://)?[^\s\)\.,;:]+', "deposited"),
+    (r'data\s+repository[:\s]+(?:https?://)?[^\s\)\.,;:]+', "repository"),
+)
+
+# URL patterns for code repositories
+_CODE_REPO_PATTERNS = (
+    (r'https?://(?:www\.)?(?:github\.com|gitlab\.com|bitbucket\.org|sourceforge\.net)/[^\s\)\.,;:]+', "http"),
+    (r'code\s+available\s+at\s+(?:https?://)?[^\s\)\.,;:]+', "available"),
+    (r'source\s+code\s+at\s+(?:https?://)?[^\s\)\.,;:]+', "source"),
+    (r'repository[:\s]+(?:https?://)?(?:www\.)?(?:github\.com|gitlab\.com|bitbucket\.org)/[^\s\)\.,;:]+', "repository"),
+)
+
+# Preregistration patterns
+_PREREG_PATTERNS = (
+    (r'(?:pre-?registered|preregistered|pre\s+registered)\s+(?:at|on|with)?\s*(?:https?://)?(?:www\.)?(?:clinicaltrials\.gov|osf\.io|aspredicted\.org|egap\.org)/[^\s\)\.,;:]+', "registered"),
+    (r'clinicaltrials\.gov/(?:id|identifier|number)[\s:=]+([A-Z]{2,}\d+)', "clinicaltrials.gov/"),
+    (r'NCT\d{8}', "nct"),
+    (r'OSF\s+(?:registration|preregistration)[\s:]+([a-z0-9]+)', "osf"),
+    (r'AsPredicted\s+#?(\d+)', "aspredicted"),
+    (r'preregistration\s+(?:number|id)[:\s]+([A-Z0-9]+)', "preregistration"),
+)
+
+# Supplementary material patterns
+_SUPP_PATTERNS = (
+    (r'supplementary\s+(?:material|data|information|file|table|figure)[\s:]+(?:https?://)?[^\s\)\.,;:]+', "supplementary"),
+    (r'supplement\s+(?:available|at|in)[\s:]+(?:https?://)?[^\s\)\.,;:]+', "supplement"),
+    (r'additional\s+(?:file|data|material)[\s:]+(?:https?://)?[^\s\)\.,;:]+', "additional"),
+)
+
+_DATA_REPO_PATTERNS, _CODE_REPO_PATTERNS, _PREREG_PATTERNS, _SUPP_PATTERNS = (
+    tuple((re.compile(pattern, re.IGNORECASE), keyword) for pattern, keyword in patterns)
+    for patterns in (_DATA_REPO_PATTERNS, _CODE_REPO_PATTERNS, _PREREG_PATTERNS, _SUPP_PATTERNS)
+)
+
+
+def _iter_indicator_matches(patterns, text_content: str, text_lower: Optional[str]):
+    """
+    Yield the matches of each pattern in order, skipping patterns whose keyword is
+    absent from text_lower (pass None to run every pattern).
+    """
+    for pattern, keyword in patterns:
+        if text_lower is not None and keyword not in text_lower:
+            continue
+        yield from pattern.finditer(text_content)
+
+
 def _find_word_boundary(text: str, position: int, direction: str = 'backward') -> int:
     """Find the nearest word boundary from a position."""
     if direction == 'backward':
@@ -80,13 +360,21 @@ class ReproducibilityAssessorTool(BaseTool):
     def __init__(self):
         super().__init__()
         self.openai_client = None
+        self.result_cache = ToolResultCache()
+        self.semantic_cache = None
     
     def _get_openai_client(self):
         """Get OpenAI client, initializing it lazily if needed."""
         if self.openai_client is None:
-            self.openai_client = OpenAIClient()
+            self.openai_client = _get_shared_openai_client()
         return self.openai_client
     
+    def _get_semantic_cache(self) -> SemanticResultCache:
+        """Get the near-match result cache, initializing it lazily (it is only used when enabled)."""
+        if self.semantic_cache is None:
+            self.semantic_cache = SemanticResultCache()
+        return self.semantic_cache
+    
     def _get_metadata(self) -> ToolMetadata:
         """Return the metadata for this tool."""
         return ToolMetadata(
@@ -94,7 +382,7 @@ class ReproducibilityAssessorTool(BaseTool):
             description="Evaluate the reproducibility of research studies",
             parameters={
                 "required": ["text_content"],
-                "optional": ["assessment_criteria", "reproducibility_level"],
+                "optional": ["assessment_criteria", "reproducibility_level", "use_cache"],
                 "properties": {
                     "text_content": {
                         "type": "string",
@@ -109,6 +397,11 @@ class ReproducibilityAssessorTool(BaseTool):
                         "type": "string",
                         "description": "Level of reproducibility assessment: 'basic', 'detailed'",
                         "default": "detailed"
+                    },
+                    "use_cache": {
+                        "type": "boolean",
+                        "description": "Reuse a stored LLM assessment for identical input instead of calling the LLM again",
+                        "default": True
                     }
                 }
             },
@@ -122,7 +415,8 @@ class ReproducibilityAssessorTool(BaseTool):
     
     def execute(self, text_content: str, assessment_criteria: Optional[List[str]] = None,
                 reproducibility_level: str = "detailed", evidence_collector=None, 
-                methodology_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+                methodology_data: Optional[Dict[str, Any]] = None,
+                use_cache: bool = True) -> Dict[str, Any]:
         """
         Assess study reproducibility.
         
@@ -130,6 +424,7 @@ class ReproducibilityAssessorTool(BaseTool):
             text_content: The text content to assess
             assessment_criteria: Specific criteria to assess
             reproducibility_level: Level of assessment
+            use_cache: Reuse a stored LLM assessment for the same input when available
             
         Returns:
             Dict containing reproducibility assessment
@@ -137,11 +432,70 @@ class ReproducibilityAssessorTool(BaseTool):
         try:
             logger.info(f"Assessing reproducibility with level: {reproducibility_level}")
             
-            # Generate reproducibility assessment based on level
-            if reproducibility_level == "basic":
-                assessment_result = self._assess_basic_reproducibility(text_content, assessment_criteria, methodology_data)
-            else:  # detailed
-                assessment_result = self._assess_detailed_reproducibility(text_content, assessment_criteria, methodology_data)
+            # Check cache first. Only the LLM assessment is cached: evidence collection and
+            # the indicator-based scoring below are cheap and always recomputed. The detailed
+            # prompt and fallback scores depend on the detected methodologies, so they are
+            # part of the key for that level.
+            cache_key_params = self._cache_key_params(assessment_criteria, reproducibility_level, methodology_data)
+            cached_result = None
+            if use_cache:
+                cached_result = self.result_cache.get_cached_result(
+                    "reproducibility_assessor_tool",
+                    text_content,
+                    **cache_key_params
+                )
+            
+            if cached_result:
+                logger.info("✅ Using cached reproducibility assessment")
+                assessment_result = cached_result
+            else:
+                def assess() -> Dict[str, Any]:
+                    # Opt-in near-match lookup: the same paper re-extracted with small
+                    # whitespace/OCR differences misses the exact cache but embeds alike
+                    embedding = None
+                    if use_cache and os.getenv("QUALILENS_SEMANTIC_CACHE") == "1":
+                        embedding = self._get_openai_client().generate_embedding(text_content[:_SEMANTIC_CACHE_CHARS])
+                        if embedding:
+                            similar_result = self._get_semantic_cache().get_similar_result(
+                                "reproducibility_assessor_tool",
+                                embedding,
+                                **cache_key_params
+                            )
+                            if similar_result:
+                                logger.info("✅ Using reproducibility assessment of a near-identical paper")
+                                return similar_result
+                    
+                    # Generate reproducibility assessment based on level
+                    if reproducibility_level == "basic":
+                        result = self._assess_basic_reproducibility(text_content, assessment_criteria, methodology_data)
+                    else:  # detailed
+                        result = self._assess_detailed_reproducibility(text_content, assessment_criteria, methodology_data)
+                    
+                    # Cache only assessments the LLM answered and that parsed cleanly
+                    # (not errors, nor the canned baseline used when inference fails)
+                    if use_cache and not result.get("error") and not result.get("fallback"):
+                        self.result_cache.cache_result(
+                            "reproducibility_assessor_tool",
+                            text_content,
+                            result,
+                            **cache_key_params
+                        )
+                        if embedding:
+                            self._get_semantic_cache().cache_result(
+                                "reproducibility_assessor_tool",
+                                embedding,
+                                result,
+                                **cache_key_params
+                            )
+                    return result
+                
+                if use_cache:
+                    # Identical requests already in flight (refresh clicks, pipeline retries)
+                    # wait for that assessment instead of paying for another one
+                    inflight_key = (text_content, json.dumps(cache_key_params, sort_keys=True, default=str))
+                    assessment_result = _run_coalesced(inflight_key, assess)
+                else:
+                    assessment_result = assess()
             
             # Collect evidence if evidence_collector is provided
             if evidence_collector:
@@ -383,6 +737,224 @@ class ReproducibilityAssessorTool(BaseTool):
                 "tool_used": "reproducibility_assessor_tool"
             }
     
+    async def aexecute(self, text_content: str, assessment_criteria: Optional[List[str]] = None,
+                       reproducibility_level: str = "detailed", evidence_collector=None,
+                       methodology_data: Optional[Dict[str, Any]] = None,
+                       use_cache: bool = True) -> Dict[str, Any]:
+        """
+        Async variant of execute() for agent frameworks that support async tools.
+        
+        The assessment is dominated by blocking LLM round-trips, so it runs in a worker
+        thread and the event loop stays free to drive other assessments meanwhile.
+        """
+        return await asyncio.to_thread(
+            self.execute,
+            text_content,
+            assessment_criteria=assessment_criteria,
+            reproducibility_level=reproducibility_level,
+            evidence_collector=evidence_collector,
+            methodology_data=methodology_data,
+            use_cache=use_cache
+        )
+    
+    async def aexecute_many(self, items: List[Dict[str, Any]], max_concurrency: int = 8,
+                            pack_short_basic: bool = False) -> List[Dict[str, Any]]:
+        """
+        Assess several papers concurrently.
+        
+        Args:
+            items: One dict of execute() keyword arguments per paper
+            max_concurrency: Maximum number of assessments (or packed requests) in flight at once
+            pack_short_basic: Assess basic-level papers that fit the prompt excerpt whole
+                (e.g. abstracts) several to one LLM request instead of one request each
+            
+        Returns:
+            One execute() result per paper, in input order; a paper that fails
+            gets its own {"success": False, ...} entry without stopping the batch
+        """
+        logger.info(f"Assessing reproducibility of {len(items)} papers (max concurrency: {max_concurrency})")
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+        
+        if pack_short_basic:
+            # Packed answers land in the result cache, where the per-paper execute() calls
+            # below pick them up; papers whose pack failed are assessed individually
+            packs = await asyncio.to_thread(self._plan_basic_packs, items)
+            if packs:
+                logger.info(f"Packing {sum(len(pack) for pack in packs)} short papers into {len(packs)} requests")
+            
+            async def run_pack(pack: List[int]) -> None:
+                async with semaphore:
+                    await asyncio.to_thread(self._assess_basic_pack, items, pack)
+            
+            await asyncio.gather(*(run_pack(pack) for pack in packs))
+        
+        async def run_bounded(item: Dict[str, Any]) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.aexecute(**item)
+        
+        return await asyncio.gather(*(run_bounded(item) for item in items))
+    
+    def _plan_basic_packs(self, items: List[Dict[str, Any]]) -> List[List[int]]:
+        """
+        Group the basic-level items that can share a prompt into packs of item indices.
+        
+        Eligible are papers short enough to fit the basic excerpt whole, without a stored
+        assessment and not bypassing the cache. Packs share the same criteria and hold
+        up to _PACKED_PROMPT_TOKENS of paper text and _PACKED_MAX_PAPERS papers;
+        single-paper packs are dropped.
+        """
+        groups: Dict[tuple, List[tuple]] = {}
+        seen = set()
+        for idx, item in enumerate(items):
+            if item.get("reproducibility_level", "detailed") != "basic" or not item.get("use_cache", True):
+                continue
+            text_content = item["text_content"]
+            criteria = item.get("assessment_criteria")
+            key = (text_content, tuple(criteria or ()))
+            if key in seen or _truncate_to_tokens(text_content, _BASIC_PROMPT_TOKENS) != text_content:
+                continue
+            seen.add(key)
+            if self.result_cache.get_cached_result(
+                    "reproducibility_assessor_tool", text_content, **self._cache_key_params(criteria, "basic")):
+                continue
+            groups.setdefault(tuple(criteria or ()), []).append((idx, _count_tokens(text_content)))
+        
+        packs = []
+        for members in groups.values():
+            pack, pack_tokens = [], 0
+            for idx, tokens in members:
+                if pack and (pack_tokens + tokens > _PACKED_PROMPT_TOKENS or len(pack) >= _PACKED_MAX_PAPERS):
+                    packs.append(pack)
+                    pack, pack_tokens = [], 0
+                pack.append(idx)
+                pack_tokens += tokens
+            packs.append(pack)
+        return [pack for pack in packs if len(pack) > 1]
+    
+    def _assess_basic_pack(self, items: List[Dict[str, Any]], pack: List[int]) -> None:
+        """
+        Assess a pack of short papers with one LLM request and store each paper's answer
+        in the result cache. Papers without a usable answer are left uncached.
+        """
+        criteria = items[pack[0]].get("assessment_criteria")
+        try:
+            llm_response = self._get_openai_client().generate_completion(
+                prompt=self._build_packed_basic_prompt([items[idx]["text_content"] for idx in pack], criteria),
+                model=_ASSESSMENT_MODEL,
+                max_tokens=_BASIC_MAX_TOKENS * len(pack),
+                temperature=0.0,
+                json_mode=True
+            )
+            if not llm_response:
+                logger.warning(f"No response for a pack of {len(pack)} papers, assessing them individually")
+                return
+            
+            answer = _loads_llm_json(llm_response)
+            assessments = answer.get("assessments") if isinstance(answer, dict) else None
+            if not isinstance(assessments, list) or len(assessments) != len(pack):
+                logger.warning(f"Packed answer does not hold {len(pack)} assessments, assessing the papers individually")
+                return
+            
+            for idx, assessment in zip(pack, assessments):
+                try:
+                    assessment_result = _check_basic_assessment(assessment)
+                except (ValueError, TypeError):
+                    continue
+                self.result_cache.cache_result(
+                    "reproducibility_assessor_tool",
+                    items[idx]["text_content"],
+                    assessment_result,
+                    **self._cache_key_params(criteria, "basic")
+                )
+        except Exception as e:
+            logger.warning(f"Packed basic assessment failed, assessing the papers individually: {str(e)}")
+    
+    def execute_batch_offline(self, items: List[Dict[str, Any]], poll_interval: float = 60.0,
+                              timeout: float = 24 * 60 * 60, use_cache: bool = True) -> List[Dict[str, Any]]:
+        """
+        Assess many papers through the OpenAI Batch API (basic level).
+        
+        Intended for large offline evaluations where cost and rate limits matter more
+        than latency: all LLM prompts go out as one batch job, which may take up to
+        24 hours. Only the basic assessment is batched, since the detailed assessment
+        needs the answer of its first phase before it can build the second prompt.
+        
+        Batch answers are stored in the tool result cache and each paper is then
+        finished by execute(), so results are shaped exactly like live ones.
+        
+        Args:
+            items: One dict of execute() keyword arguments per paper
+                   (reproducibility_level is ignored and treated as 'basic')
+            poll_interval: Seconds between batch status checks
+            timeout: Seconds to wait for the batch before giving up
+            use_cache: Skip papers that already have a stored assessment
+            
+        Returns:
+            One execute() result per paper, in input order; a paper whose batch
+            request failed gets its own {"success": False, ...} entry
+        """
+        items = [{**item, "reproducibility_level": "basic"} for item in items]
+        errors: Dict[int, str] = {}
+        
+        pending = []
+        for idx, item in enumerate(items):
+            cache_key_params = self._cache_key_params(item.get("assessment_criteria"), "basic")
+            if use_cache and self.result_cache.get_cached_result(
+                    "reproducibility_assessor_tool", item["text_content"], **cache_key_params):
+                continue
+            pending.append((idx, cache_key_params))
+        
+        logger.info(f"Submitting {len(pending)} of {len(items)} reproducibility assessments as a batch")
+        if pending:
+            completions = self._get_openai_client().generate_completions_batch(
+                [
+                    {
+                        "prompt": self._build_basic_prompt(items[idx]["text_content"], items[idx].get("assessment_criteria")),
+                        "model": _ASSESSMENT_MODEL,
+                        "max_tokens": _BASIC_MAX_TOKENS,
+                        "temperature": 0.0,
+                        "json_mode": True
+                    }
+                    for idx, _ in pending
+                ],
+                poll_interval=poll_interval,
+                timeout=timeout
+            )
+            for (idx, cache_key_params), llm_response in zip(pending, completions):
+                if not llm_response:
+                    errors[idx] = "No response from LLM batch"
+                    continue
+                try:
+                    assessment_result = _parse_basic_assessment(llm_response)
+                except (ValueError, TypeError):
+                    errors[idx] = "Could not parse reproducibility assessment"
+                    continue
+                if not self.result_cache.cache_result(
+                        "reproducibility_assessor_tool", items[idx]["text_content"],
+                        assessment_result, **cache_key_params):
+                    errors[idx] = "Could not store batch assessment"
+        
+        return [
+            {"success": False, "error": errors[idx], "tool_used": "reproducibility_assessor_tool"}
+            if idx in errors else self.execute(**{**item, "use_cache": True})
+            for idx, item in enumerate(items)
+        ]
+    
+    @staticmethod
+    def _cache_key_params(assessment_criteria: Optional[List[str]], reproducibility_level: str,
+                          methodology_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Parameters besides the text that determine the LLM assessment, for the result cache key."""
+        return {
+            "assessment_criteria": assessment_criteria or [],
+            "reproducibility_level": reproducibility_level,
+            "model": _ASSESSMENT_MODEL,
+            "prompt_version": _PROMPT_VERSION,
+            "detected_methodologies": (
+                (methodology_data or {}).get("detected_methodologies", {})
+                if reproducibility_level != "basic" else {}
+            )
+        }
+    
     def _extract_reproducibility_indicators(self, text_content: str) -> Dict[str, Any]:
         """
         Extract specific reproducibility indicators from text content.
@@ -405,99 +977,59 @@ class ReproducibilityAssessorTool(BaseTool):
         if not text_content:
             return indicators
         
-        text_lower = text_content.lower()
-        
-        # URL patterns for data repositories
-        # DOI pattern: doi.org/10.XXXX/YYYY (must have at least one segment after 10.)
-        data_repo_patterns = [
-            r'https?://(?:www\.)?(?:osf\.io|figshare\.com|zenodo\.org|dryad\.org|dataverse\.harvard\.edu|datacite\.org|datadryad\.org)/[^\s\)\.,;:]+',
-            r'doi\.org/10\.\d+[^\s\)\.,;:]+',  # Must have 10. followed by digits and more content
-            r'https?://(?:dx\.)?doi\.org/10\.\d+[^\s\)\.,;:]+',  # Full DOI URLs
-            r'data\s+available\s+at\s+(?:https?://)?[^\s\)\.,;:]+',
-            r'data\s+deposited\s+at\s+(?:https?://)?[^\s\)\.,;:]+',
-            r'data\s+repository[:\s]+(?:https?://)?[^\s\)\.,;:]+',
-        ]
-        
-        # URL patterns for code repositories
-        code_repo_patterns = [
-            r'https?://(?:www\.)?(?:github\.com|gitlab\.com|bitbucket\.org|sourceforge\.net)/[^\s\)\.,;:]+',
-            r'code\s+available\s+at\s+(?:https?://)?[^\s\)\.,;:]+',
-            r'source\s+code\s+at\s+(?:https?://)?[^\s\)\.,;:]+',
-            r'repository[:\s]+(?:https?://)?(?:www\.)?(?:github\.com|gitlab\.com|bitbucket\.org)/[^\s\)\.,;:]+',
-        ]
-        
-        # Preregistration patterns
-        prereg_patterns = [
-            r'(?:pre-?registered|preregistered|pre\s+registered)\s+(?:at|on|with)?\s*(?:https?://)?(?:www\.)?(?:clinicaltrials\.gov|osf\.io|aspredicted\.org|egap\.org)/[^\s\)\.,;:]+',
-            r'clinicaltrials\.gov/(?:id|identifier|number)[\s:=]+([A-Z]{2,}\d+)',
-            r'NCT\d{8}',
-            r'OSF\s+(?:registration|preregistration)[\s:]+([a-z0-9]+)',
-            r'AsPredicted\s+#?(\d+)',
-            r'preregistration\s+(?:number|id)[:\s]+([A-Z0-9]+)',
-        ]
-        
-        # Supplementary material patterns
-        supp_patterns = [
-            r'supplementary\s+(?:material|data|information|file|table|figure)[\s:]+(?:https?://)?[^\s\)\.,;:]+',
-            r'supplement\s+(?:available|at|in)[\s:]+(?:https?://)?[^\s\)\.,;:]+',
-            r'additional\s+(?:file|data|material)[\s:]+(?:https?://)?[^\s\)\.,;:]+',
-        ]
+        # Each pattern only runs if its required keyword occurs in the text (a plain
+        # substring check), which skips most of the case-insensitive regex scans on papers
+        # without those statements. "ı", "İ" and "ſ" match ASCII letters under re.IGNORECASE
+        # but lowercase differently, so texts containing them scan every pattern.
+        text_lower = None if any(c in text_content for c in "ıİſ") else text_content.lower()
         
         # Extract data repository links
-        for pattern in data_repo_patterns:
-            matches = re.finditer(pattern, text_content, re.IGNORECASE)
-            for match in matches:
-                url = match.group(0).strip('.,;:')
-                # Clean up common trailing punctuation
-                url = re.sub(r'[.,;:]+$', '', url)
-                
-                # Validate DOI: must be complete (doi.org/10.XXXX/YYYY format)
-                if 'doi.org' in url.lower():
-                    # Check if it's a complete DOI (has at least 10.XXXX/YYYY structure)
-                    doi_match = re.search(r'doi\.org/(10\.\d+/.+)', url, re.IGNORECASE)
-                    if not doi_match:
-                        # Skip incomplete DOIs like "doi.org/10"
-                        continue
-                    # Ensure it has a proper suffix after the slash
-                    doi_parts = doi_match.group(1).split('/')
-                    if len(doi_parts) < 2 or len(doi_parts[1].strip()) < 3:
-                        # Skip if suffix is too short (likely incomplete)
-                        continue
-                
-                # Additional validation: skip very short URLs that are likely false positives
-                if len(url) < 10:
+        for match in _iter_indicator_matches(_DATA_REPO_PATTERNS, text_content, text_lower):
+            url = match.group(0).strip('.,;:')
+            # Clean up common trailing punctuation
+            url = re.sub(r'[.,;:]+$', '', url)
+            
+            # Validate DOI: must be complete (doi.org/10.XXXX/YYYY format)
+            if 'doi.org' in url.lower():
+                # Check if it's a complete DOI (has at least 10.XXXX/YYYY structure)
+                doi_match = re.search(r'doi\.org/(10\.\d+/.+)', url, re.IGNORECASE)
+                if not doi_match:
+                    # Skip incomplete DOIs like "doi.org/10"
                     continue
-                    
-                if url not in indicators["data_repositories"]:
-                    indicators["data_repositories"].append(url)
+                # Ensure it has a proper suffix after the slash
+                doi_parts = doi_match.group(1).split('/')
+                if len(doi_parts) < 2 or len(doi_parts[1].strip()) < 3:
+                    # Skip if suffix is too short (likely incomplete)
+                    continue
+            
+            # Additional validation: skip very short URLs that are likely false positives
+            if len(url) < 10:
+                continue
+                
+            if url not in indicators["data_repositories"]:
+                indicators["data_repositories"].append(url)
         
         # Extract code repository links
-        for pattern in code_repo_patterns:
-            matches = re.finditer(pattern, text_content, re.IGNORECASE)
-            for match in matches:
-                url = match.group(0).strip('.,;:')
-                url = re.sub(r'[.,;:]+$', '', url)
-                if url not in indicators["code_repositories"]:
-                    indicators["code_repositories"].append(url)
+        for match in _iter_indicator_matches(_CODE_REPO_PATTERNS, text_content, text_lower):
+            url = match.group(0).strip('.,;:')
+            url = re.sub(r'[.,;:]+$', '', url)
+            if url not in indicators["code_repositories"]:
+                indicators["code_repositories"].append(url)
         
         # Extract preregistration numbers
-        for pattern in prereg_patterns:
-            matches = re.finditer(pattern, text_content, re.IGNORECASE)
-            for match in matches:
-                # Extract the identifier (could be in group 1 or the full match)
-                identifier = match.group(1) if match.groups() else match.group(0)
-                identifier = identifier.strip('.,;:')
-                if identifier and identifier not in indicators["preregistration_numbers"]:
-                    indicators["preregistration_numbers"].append(identifier)
+        for match in _iter_indicator_matches(_PREREG_PATTERNS, text_content, text_lower):
+            # Extract the identifier (could be in group 1 or the full match)
+            identifier = match.group(1) if match.groups() else match.group(0)
+            identifier = identifier.strip('.,;:')
+            if identifier and identifier not in indicators["preregistration_numbers"]:
+                indicators["preregistration_numbers"].append(identifier)
         
         # Extract supplementary material links
-        for pattern in supp_patterns:
-            matches = re.finditer(pattern, text_content, re.IGNORECASE)
-            for match in matches:
-                url = match.group(0).strip('.,;:')
-                url = re.sub(r'[.,;:]+$', '', url)
-                if url not in indicators["supplementary_material_links"]:
-                    indicators["supplementary_material_links"].append(url)
+        for match in _iter_indicator_matches(_SUPP_PATTERNS, text_content, text_lower):
+            url = match.group(0).strip('.,;:')
+            url = re.sub(r'[.,;:]+$', '', url)
+            if url not in indicators["supplementary_material_links"]:
+                indicators["supplementary_material_links"].append(url)
         
         # Calculate confidence score based on indicators found
         confidence_factors = 0
@@ -741,55 +1273,63 @@ class ReproducibilityAssessorTool(BaseTool):
         
         return (best_baseline, best_adjustment)
     
-    def _assess_basic_reproducibility(self, text_content: str, assessment_criteria: Optional[List[str]], 
-                                      methodology_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Assess basic reproducibility elements."""
-        try:
-            prompt = f"""
+    def _build_basic_prompt(self, text_content: str, assessment_criteria: Optional[List[str]]) -> str:
+        """Build the single-shot prompt for the basic assessment (shared by the live and batch paths)."""
+        return f"""
 You are an expert research analyst. Provide a basic assessment of the reproducibility of this research study.
 
 PAPER CONTENT:
-{text_content[:6000]}
+{_truncate_to_tokens(text_content, _BASIC_PROMPT_TOKENS)}
 
 {f"SPECIFIC CRITERIA TO ASSESS: {', '.join(assessment_criteria)}" if assessment_criteria else ""}
 
 Provide basic reproducibility assessment in JSON format:
-{{
-  "reproducibility_score": 0.0-1.0,  // Calculate actual score based on content analysis
-  "methodological_detail": "Assessment of methodological detail provided",
-  "data_availability": "Information about data availability",
-  "code_availability": "Information about code availability",
-  "reproducibility_barriers": [
-    "Barrier 1",
-    "Barrier 2"
-  ],
-  "recommendations": [
-    "Recommendation 1",
-    "Recommendation 2"
-  ]
-}}
+{_BASIC_ANSWER_SCHEMA}
 
-IMPORTANT: Calculate the reproducibility_score based on actual content analysis. Consider:
-- Methodological detail provided (0.0-0.3 points)
-- Data availability mentioned (0.0-0.3 points) 
-- Code availability mentioned (0.0-0.2 points)
-- Reproducibility barriers identified (0.0-0.2 points)
-- Provide a realistic score between 0.0 and 1.0 based on the actual content
+{_BASIC_SCORING_GUIDANCE}
+
+Focus on the most essential reproducibility elements.
+"""
+    
+    def _build_packed_basic_prompt(self, texts: List[str], assessment_criteria: Optional[List[str]]) -> str:
+        """Build one basic-assessment prompt covering several short papers."""
+        papers = "\n\n".join(
+            f"PAPER {number} CONTENT:\n{text}" for number, text in enumerate(texts, 1)
+        )
+        return f"""
+You are an expert research analyst. Provide a basic assessment of the reproducibility of each of the following {len(texts)} research studies. Assess every paper on its own content only.
+
+{papers}
+
+{f"SPECIFIC CRITERIA TO ASSESS: {', '.join(assessment_criteria)}" if assessment_criteria else ""}
+
+Provide the basic reproducibility assessments in JSON format, as an object with an "assessments" array holding exactly {len(texts)} entries in paper order (entry 1 for PAPER 1, ...), each entry shaped like:
+{_BASIC_ANSWER_SCHEMA}
+
+{_BASIC_SCORING_GUIDANCE}
 
 Focus on the most essential reproducibility elements.
 """
+    
+    def _assess_basic_reproducibility(self, text_content: str, assessment_criteria: Optional[List[str]], 
+                                      methodology_data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+        """Assess basic reproducibility elements."""
+        try:
+            prompt = self._build_basic_prompt(text_content, assessment_criteria)
             
             llm_response = self._get_openai_client().generate_completion(
                 prompt=prompt,
-                model="gpt-4o-mini",
-                max_tokens=1000,
-                temperature=0.0  # Deterministic for consistency
+                model=_ASSESSMENT_MODEL,
+                max_tokens=_BASIC_MAX_TOKENS,
+                temperature=0.0,  # Deterministic for consistency
+                json_mode=True
             )
             
             if llm_response:
                 try:
-                    return json.loads(llm_response)
-                except json.JSONDecodeError:
+                    return _parse_basic_assessment(llm_response)
+                except (ValueError, TypeError) as e:
+                    logger.error(f"Basic reproducibility assessment is malformed: {str(e)}")
                     return {"error": "Could not parse reproducibility assessment"}
             else:
                 return {"error": "No response from LLM"}
@@ -818,6 +1358,9 @@ Focus on the most essential reproducibility elements.
             # PHASE 1: Identify sections with reproducibility practices
             logger.info("🔍 PHASE 1: Identifying sections with reproducibility practices across the paper...")
             
+            # All phases show the model the same excerpt, so truncate once
+            paper_excerpt = _truncate_to_tokens(text_content, _DETAILED_PROMPT_TOKENS)
+            
             # Extract methodology information for context
             methodology_context = ""
             if methodology_data:
@@ -835,7 +1378,7 @@ Focus on the most essential reproducibility elements.
 You are an expert in research reproducibility. Your task is to analyze this research paper and identify SECTIONS that contain reproducibility practices (either good or bad).
 
 PAPER CONTENT:
-{text_content[:8000]}
+{paper_excerpt}
 
 {methodology_context}
 
@@ -966,9 +1509,11 @@ Be thorough and creative - even papers without explicit data sharing statements
             # Phase 1: Section identification
             section_response = self._get_openai_client().generate_completion(
                 prompt=section_analysis_prompt,
-                model="gpt-4o-mini",
+                model=_ASSESSMENT_MODEL,
                 max_tokens=3500,
-                temperature=0.2  # Low temperature for systematic analysis
+                temperature=0.2,  # Low temperature for systematic analysis
+                json_mode=True,
+                stream=True  # Long completion: log time to first token
             )
 
             if not section_response:
@@ -976,7 +1521,7 @@ Be thorough and creative - even papers without explicit data sharing statements
                 return {"error": "No response from Phase 1 (section analysis)"}
 
             try:
-                phase1_result = json.loads(section_response)
+                phase1_result = _loads_llm_json(section_response)
                 reproducibility_sections = phase1_result.get("reproducibility_sections", [])
                 logger.info(f"✅ PHASE 1 complete: {len(reproducibility_sections)} reproducibility-related sections identified")
 
@@ -1002,7 +1547,7 @@ Be thorough and creative - even papers without explicit data sharing statements
 You are a reproducibility expert. No explicit reproducibility sections were found, but you must still assess the paper creatively.
 
 PAPER CONTENT:
-{text_content[:8000]}
+{paper_excerpt}
 
 CREATIVE INFERENCE TASK:
 Even without explicit data/code availability statements, you can still assess reproducibility by looking at:
@@ -1063,14 +1608,15 @@ Think creatively - make educated guesses!
 
                 inference_response = self._get_openai_client().generate_completion(
                     prompt=inference_prompt,
-                    model="gpt-4o-mini",
+                    model=_ASSESSMENT_MODEL,
                     max_tokens=2000,
-                    temperature=0.3  # Slightly higher for creative inference
+                    temperature=0.3,  # Slightly higher for creative inference
+                    json_mode=True
                 )
 
                 if inference_response:
                     try:
-                        inferred_result = json.loads(inference_response)
+                        inferred_result = _loads_llm_json(inference_response)
 
                         # Convert inferred_practices to good_practices format
                         good_practices = []
@@ -1164,7 +1710,9 @@ Think creatively - make educated guesses!
                         "Share analysis code on GitHub or similar platform",
                         "Include more specific methodological details (parameters, versions, procedures)"
                     ],
-                    "overall_assessment": "Paper has basic methods but lacks explicit reproducibility practices. Score of 0.20 based on minimal baseline assessment."
+                    "overall_assessment": "Paper has basic methods but lacks explicit reproducibility practices. Score of 0.20 based on minimal baseline assessment.",
+                    # Canned baseline rather than an assessment of this paper; not cached
+                    "fallback": True
                 }
 
             # PHASE 2: Detailed verification with chain-of-thought reasoning
@@ -1174,7 +1722,7 @@ Think creatively - make educated guesses!
 You are a rigorous reproducibility expert. You will now VERIFY each reproducibility section identified in Phase 1.
 
 PAPER CONTENT:
-{text_content[:8000]}
+{paper_excerpt}
 
 REPRODUCIBILITY SECTIONS TO VERIFY:
 {json.dumps(reproducibility_sections, indent=2)}
@@ -1347,9 +1895,11 @@ CRITICAL REMINDERS:
             # Phase 2: Rigorous verification
             verification_response = self._get_openai_client().generate_completion(
                 prompt=verification_prompt,
-                model="gpt-4o-mini",
+                model=_ASSESSMENT_MODEL,
                 max_tokens=4500,
-                temperature=0.0  # Deterministic for consistency
+                temperature=0.0,  # Deterministic for consistency
+                json_mode=True,
+                stream=True  # Long completion: log time to first token
             )
 
             if not verification_response:
@@ -1357,7 +1907,7 @@ CRITICAL REMINDERS:
                 return {"error": "No response from Phase 2 (verification)"}
 
             try:
-                result = json.loads(verification_response)
+                result = _loads_llm_json(verification_response)
                 good_practices = result.get("good_practices", [])
                 bad_practices = result.get("bad_practices", [])
                 reclassified = result.get("reclassified_sections", [])
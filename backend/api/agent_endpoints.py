@@ -389,9 +389,6 @@ def upload_file():
             metadata={"file_name": file.filename, "file_size_mb": file_size_mb}
         )
         
-        # Read file content
-        file_content = file.read()
-        
         # Get or create agent orchestrator
         if not hasattr(current_app, 'agent_orchestrator'):
             current_app.agent_orchestrator = create_agent_orchestrator()
@@ -402,8 +399,10 @@ def upload_file():
         import tempfile
         import os
         
+        # Stream the upload to disk in blocks instead of reading it into memory;
+        # the parser then works from the file path
         with tempfile.NamedTemporaryFile(delete=False, suffix='.pdf') as temp_file:
-            temp_file.write(file_content)
+            file.save(temp_file)
             temp_file_path = temp_file.name
         
         try:
@@ -494,7 +493,11 @@ def upload_file():
                 
                 # Execute PDF analysis directly
                 try:
-                    result = pdf_tool.execute(file_path=temp_file_path)
+                    # Section text is needed for per-section analysis below; coordinates
+                    # are only used for evidence highlighting, which this path doesn't do
+                    result = pdf_tool.execute(
+                        file_path=temp_file_path, include_section_text=True, include_coords=False
+                    )
                     
                     # If PDF parsing was successful, enhance with paper analysis
                     if result.get("success") and result.get("text"):
@@ -7,6 +7,7 @@ This module contains the Flask app configuration and startup.
 
 import logging
 from flask import Flask
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
 from api.agent_endpoints import (
     agent_query, 
@@ -25,9 +26,57 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+try:
+    import orjson  # pip install orjson
+    _HAVE_ORJSON = True
+except Exception:
+    _HAVE_ORJSON = False
+
+
+class ORJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider that encodes responses with orjson when it is installed.
+
+    Analysis responses carry whole papers (text, chunks, text-block coordinates),
+    where the stdlib encoder dominates response time. Dates, UUIDs, dataclasses
+    and dict/list subclasses go through the same conversions as the default
+    provider; anything else orjson can't encode falls back to it entirely.
+    """
+
+    def dumps(self, obj, **kwargs):
+        # response() passes indent=2 (debug) or compact separators; other
+        # json.dumps arguments are only honoured by the stdlib path
+        if _HAVE_ORJSON and set(kwargs) <= {"indent", "separators"} and kwargs.get("indent") in (None, 2):
+            option = (
+                orjson.OPT_NON_STR_KEYS
+                | orjson.OPT_PASSTHROUGH_SUBCLASS
+                | orjson.OPT_PASSTHROUGH_DATETIME
+                | orjson.OPT_PASSTHROUGH_DATACLASS
+            )
+            if self.sort_keys:
+                option |= orjson.OPT_SORT_KEYS
+            if kwargs.get("indent"):
+                option |= orjson.OPT_INDENT_2
+            try:
+                return orjson.dumps(obj, default=self._orjson_default, option=option).decode("utf-8")
+            except TypeError:
+                pass  # e.g. integers wider than 64 bits; the stdlib encoder handles those
+        return super().dumps(obj, **kwargs)
+
+    def _orjson_default(self, obj):
+        # Subclasses are passed through so that e.g. lazily computed result dicts
+        # are materialized the way json.dumps would iterate them
+        if isinstance(obj, dict):
+            return dict(obj)
+        if isinstance(obj, list):
+            return list(obj)
+        return self.default(obj)
+
+
 def create_app():
     """Create and configure the Flask application."""
     app = Flask(__name__)
+    app.json = ORJSONProvider(app)
     
     # Configure file upload limits
     app.config['MAX_CONTENT_LENGTH'] = 50 * 1024 * 1024  # 50MB limit